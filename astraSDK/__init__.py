@@ -14,27 +14,45 @@
    limitations under the License.
 """
 
-from . import apiresources
-from . import apps
-from . import asups
-from . import backups
-from . import buckets
-from . import clouds
-from . import clusters
-from . import credentials
-from . import common
-from . import entitlements
-from . import groups
-from . import hooks
-from . import k8s
-from . import namespaces
-from . import notifications
-from . import protections
-from . import replications
-from . import rolebindings
-from . import scripts
-from . import settings
-from . import snapshots
-from . import storagebackends
-from . import storageclasses
-from . import users
+import importlib
+
+# Submodules are imported the first time they're accessed (astraSDK.apps, tkSrc.list, etc.), so
+# that each command only pays the import cost of the modules it actually uses
+__all__ = [
+    "aio",
+    "apiresources",
+    "apps",
+    "asups",
+    "backups",
+    "buckets",
+    "clouds",
+    "clusters",
+    "credentials",
+    "common",
+    "entitlements",
+    "groups",
+    "hooks",
+    "jobs",
+    "k8s",
+    "namespaces",
+    "notifications",
+    "protections",
+    "replications",
+    "rolebindings",
+    "scripts",
+    "settings",
+    "snapshots",
+    "storagebackends",
+    "storageclasses",
+    "users",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
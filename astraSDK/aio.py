@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from . import (
+    apiresources,
+    apps,
+    asups,
+    backups,
+    buckets,
+    clouds,
+    clusters,
+    credentials,
+    entitlements,
+    groups,
+    hooks,
+    namespaces,
+    notifications,
+    protections,
+    replications,
+    rolebindings,
+    scripts,
+    settings,
+    snapshots,
+    storagebackends,
+    storageclasses,
+    users,
+)
+from .common import (
+    getConfig,
+    ResourceContext,
+    ResponseCache,
+    DEFAULT_AIO_CONTEXT_TTL,
+    DEFAULT_MAX_WORKERS,
+)
+
+
+class AsyncSDKCommon:
+    """The parent class of the awaitable equivalents of the astraSDK "get" classes, for use
+    within asyncio event loops. The same arguments as the synchronous class are accepted, and the
+    same data structures are returned, for instance:
+
+        apps = await astraSDK.aio.getApps(config=config).main(namespace="wordpress")
+
+    Every API call is awaited on the event loop, bounded by an asyncio.Semaphore of the config's
+    max_workers, and made (as requests is synchronous) on a thread pool of as many threads. The
+    semaphore and thread pool are shared by every awaitable class using the same config, along
+    with its requests session (connection pool, retries, and timeouts). This means any number of
+    calls can be awaited concurrently, for example via asyncio.gather(), while the number of API
+    calls in flight (and threads) remains bounded.
+
+    The parent collections (like the apps of getBackups) are shared through a ResourceContext of
+    the aio classes, whose entries expire after DEFAULT_AIO_CONTEXT_TTL seconds, so a long-lived
+    event loop doesn't hold on to them forever.
+
+    The thread pool is shut down by aclose(), or on leaving an 'async with' block of any class
+    using the config, and a new one is created if a class using the config is awaited again."""
+
+    syncClass = None
+
+    def __init__(self, config=None, **kwargs):
+        """config: optionally provide a pre-populated common.getConfig().main() object
+        kwargs: any other arguments of the synchronous class (quiet, verbose, output)"""
+        self.conf = getConfig().main() if config is None else config
+        # Configs built by hand (rather than via getConfig) still get a shared cache
+        self.conf.setdefault("response_cache", ResponseCache())
+        self.conf.setdefault("aio_context", ResourceContext(ttl=DEFAULT_AIO_CONTEXT_TTL))
+        self.kwargs = kwargs
+
+    def getExecutor(self):
+        """Returns the thread pool of the config, creating it if it doesn't exist yet"""
+        if "executor" not in self.conf:
+            self.conf["executor"] = ThreadPoolExecutor(
+                max_workers=self.conf.get("max_workers", DEFAULT_MAX_WORKERS),
+                thread_name_prefix="astraSDK",
+            )
+        return self.conf["executor"]
+
+    def getSemaphore(self):
+        """Returns the semaphore of the config which bounds the calls in flight on the running
+        event loop, creating it if it doesn't exist yet (or belongs to another event loop)"""
+        loop = asyncio.get_running_loop()
+        if self.conf.get("semaphore", (None,))[0] is not loop:
+            maxWorkers = self.conf.get("max_workers", DEFAULT_MAX_WORKERS)
+            self.conf["semaphore"] = (loop, asyncio.Semaphore(maxWorkers))
+        return self.conf["semaphore"][1]
+
+    async def call(self, func, *args):
+        """Awaits func(*args) on the thread pool, once the semaphore allows another call"""
+        async with self.getSemaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                self.getExecutor(), functools.partial(func, *args)
+            )
+
+    def syncInstance(self):
+        """Instantiates the synchronous class (which may make API calls of its own), with the
+        aio classes' context"""
+        conf = {**self.conf, "context": self.conf["aio_context"]}
+        return self.syncClass(config=conf, **self.kwargs)
+
+    async def main(self, *args, **kwargs):
+        return await self.call(lambda: self.syncInstance().main(*args, **kwargs))
+
+    async def aclose(self):
+        """Shuts down the thread pool of the config, once its pending calls have finished"""
+        self.conf.pop("semaphore", None)
+        executor = self.conf.pop("executor", None)
+        if executor is not None:
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+
+class AsyncFanOut(AsyncSDKCommon):
+    """The parent class of the awaitable equivalents of the classes which fan out a call per
+    parent (like getBackups, which gets the backups of every app). Each of the per-parent calls
+    is awaited on the event loop (bounded by the semaphore, like any other call), and they're all
+    gathered there, so a single fan-out makes up to max_workers calls at once, and concurrent
+    fan-outs share that bound. The synchronous class's own work (getting its parents, and
+    building its output from the results) runs on the event loop's default executor."""
+
+    async def main(self, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+
+        def run():
+            instance = self.syncInstance()
+            instance.iterFanOut = functools.partial(self.iterFanOut, loop, instance)
+            return instance.main(*args, **kwargs)
+
+        return await loop.run_in_executor(None, run)
+
+    def iterFanOut(self, loop, instance, func, items):
+        """Replaces the iterFanOut (and so fanOut) of instance: yields func(item) of every item
+        of items in order, as each call awaited on loop (from this executor thread) finishes"""
+        # Verbose output is only readable if the calls aren't interleaved
+        if getattr(instance, "verbose", False):
+            yield from type(instance).iterFanOut(instance, func, items)
+            return
+        futures = [asyncio.run_coroutine_threadsafe(self.call(func, item), loop) for item in items]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+class getApiResources(AsyncSDKCommon):
+    syncClass = apiresources.getApiResources
+
+
+class getApps(AsyncSDKCommon):
+    syncClass = apps.getApps
+
+
+class getAppAssets(AsyncSDKCommon):
+    syncClass = apps.getAppAssets
+
+
+class getAsups(AsyncSDKCommon):
+    syncClass = asups.getAsups
+
+
+class getBackups(AsyncFanOut):
+    syncClass = backups.getBackups
+
+
+class getBuckets(AsyncSDKCommon):
+    syncClass = buckets.getBuckets
+
+
+class getClouds(AsyncSDKCommon):
+    syncClass = clouds.getClouds
+
+
+class getClusters(AsyncSDKCommon):
+    syncClass = clusters.getClusters
+
+
+class getManagedClusters(AsyncSDKCommon):
+    syncClass = clusters.getManagedClusters
+
+
+class getCredentials(AsyncSDKCommon):
+    syncClass = credentials.getCredentials
+
+
+class getEntitlements(AsyncSDKCommon):
+    syncClass = entitlements.getEntitlements
+
+
+class getGroups(AsyncSDKCommon):
+    syncClass = groups.getGroups
+
+
+class getLdapGroups(AsyncSDKCommon):
+    syncClass = groups.getLdapGroups
+
+
+class getHooks(AsyncFanOut):
+    syncClass = hooks.getHooks
+
+
+class getNamespaces(AsyncSDKCommon):
+    syncClass = namespaces.getNamespaces
+
+
+class getNotifications(AsyncSDKCommon):
+    syncClass = notifications.getNotifications
+
+
+class getProtectionpolicies(AsyncFanOut):
+    syncClass = protections.getProtectionpolicies
+
+
+class getReplicationpolicies(AsyncSDKCommon):
+    syncClass = replications.getReplicationpolicies
+
+
+class getRolebindings(AsyncSDKCommon):
+    syncClass = rolebindings.getRolebindings
+
+
+class getScripts(AsyncSDKCommon):
+    syncClass = scripts.getScripts
+
+
+class getSettings(AsyncSDKCommon):
+    syncClass = settings.getSettings
+
+
+class getLdapSettings(AsyncSDKCommon):
+    syncClass = settings.getLdapSettings
+
+
+class getSnaps(AsyncFanOut):
+    syncClass = snapshots.getSnaps
+
+
+class getStorageBackends(AsyncSDKCommon):
+    syncClass = storagebackends.getStorageBackends
+
+
+class getStorageClasses(AsyncSDKCommon):
+    syncClass = storageclasses.getStorageClasses
+
+
+class getUsers(AsyncSDKCommon):
+    syncClass = users.getUsers
+
+
+class getLdapUsers(AsyncSDKCommon):
+    syncClass = users.getLdapUsers
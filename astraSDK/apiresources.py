@@ -16,10 +16,9 @@
 """
 
 import yaml
-import json
 from tabulate import tabulate
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 from .clusters import getClusters
 
 
@@ -35,7 +34,10 @@ class getApiResources(SDKCommon):
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.clusters = getClusters(quiet=True, verbose=verbose, config=config).main()
+        self.clusters = self.context.get(
+            "clusters",
+            lambda: getClusters(quiet=True, verbose=verbose, config=self.conf).main(),
+        )
 
     def main(self, cluster=None):
         if self.clusters is False:
@@ -98,5 +100,5 @@ class getApiResources(SDKCommon):
             dataReturn = tabulate(tabData, tabHeader, tablefmt="grid")
 
         if not self.quiet:
-            print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+            print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
         return dataReturn
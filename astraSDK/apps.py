@@ -15,12 +15,17 @@
    limitations under the License.
 """
 
+import time
 import yaml
-import json
-import copy
 from tabulate import tabulate
 
-from .common import SDKCommon
+from .common import (
+    DEFAULT_WAIT_MAX_INTERVAL,
+    DEFAULT_WAIT_TIMEOUT,
+    SDKCommon,
+    STREAM_OUTPUTS,
+    jsonDumps,
+)
 
 BLUE = "\033[34m"
 ENDC = "\033[0m"
@@ -41,6 +46,8 @@ class getApps(SDKCommon):
         output: table: pretty print the data
                 json: (default) output in JSON
                 yaml: output in yaml
+                ndjson, yaml-stream, table-stream: write each app as soon as it's fetched
+                                                   (see common.ItemWriter), and return True
         config: optionally provide a pre-populated common.getConfig().main() object"""
         self.quiet = quiet
         self.verbose = verbose
@@ -52,28 +59,48 @@ class getApps(SDKCommon):
         namespace=None,
         nameFilter=None,
         cluster=None,
+        shared=False,
     ):
         """namespace: Filter by the namespace the app is in
-        cluster: Filter by a specific k8s cluster"""
+        cluster: Filter by a specific k8s cluster
+        shared: get the apps through the config's ResourceContext, so that classes sharing the
+                config (like getBackups) share a single fetch of them (ignored for streaming
+                outputs, which are written as each page is fetched)"""
 
         endpoint = "k8s/v2/apps"
         params = {}
         url = self.base + endpoint
-        data = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
-        )
+        def cook(apps):
+            """Only keep the apps which match the given filters"""
+            return self.filterItems(
+                apps,
+                lambda app: not namespace or namespace in app["namespaces"],
+                lambda app: not cluster or cluster in (app["clusterName"], app["clusterID"]),
+                lambda app: not nameFilter or nameFilter in app.get("name"),
+            )
+
+        if self.output in STREAM_OUTPUTS:
+            return self.streamPages(
+                self.iterPages(url, self.headers, params, quiet=self.quiet, verbose=self.verbose),
+                cook,
+                ["appName", "appID", "clusterName", "namespace", "state"],
+                ["name", "id", "clusterName", "namespaces", "state"],
+            )
+
+        def fetch():
+            ret, apps = self.getPages(
+                url, self.headers, params, quiet=self.quiet, verbose=self.verbose
+            )
+            if ret.ok and apps is not None:
+                return apps
+            if not self.quiet:
+                self.printError(ret)
+            return False
 
-        if ret.ok:
-            apps = super().jsonifyResults(ret)
-            appsCooked = copy.deepcopy(apps)
+        apps = self.context.get("apps", fetch) if shared else fetch()
+
+        if apps is not False:
             """
             apps = {"items":[
                     {
@@ -122,21 +149,7 @@ class getApps(SDKCommon):
             }
             """
 
-            # Loop through all apps and delete those that don't match filters
-            for counter, app in enumerate(apps.get("items")):
-                # If there's a given filter, delete non-matching values
-                if namespace:
-                    delApp = True
-                    for ns in app["namespaces"]:
-                        if ns == namespace:
-                            delApp = False
-                    if delApp:
-                        appsCooked["items"].remove(apps["items"][counter])
-                        continue
-                if cluster and not (cluster == app["clusterName"] or cluster == app["clusterID"]):
-                    appsCooked["items"].remove(apps["items"][counter])
-                elif nameFilter and nameFilter not in app.get("name"):
-                    appsCooked["items"].remove(apps["items"][counter])
+            appsCooked = cook(apps)
 
             if self.output == "json":
                 dataReturn = appsCooked
@@ -168,15 +181,94 @@ class getApps(SDKCommon):
                 dataReturn = tabulate(tabData, tabHeader, tablefmt="grid")
 
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
-            if not self.quiet:
-                super().printError(ret)
             return False
 
 
+class waitForApp(SDKCommon):
+    """Wait for a single app to reach one of the given states, by polling k8s/v2/apps/{appID}
+    (rather than listing every app).  The delay between polls starts at pollTimer and grows by
+    half after every unchanged poll, up to maxPollTimer, and is reset to pollTimer whenever
+    the app's state changes.  Used after submitting a clone, restore, or manage operation."""
+
+    def __init__(self, quiet=True, verbose=False, config=None):
+        """quiet: Will there be CLI output or just return (datastructure)
+        verbose: Print all of the ReST call info: URL, Method, Headers, Request Body
+        config: optionally provide a pre-populated common.getConfig().main() object"""
+        self.quiet = quiet
+        self.verbose = verbose
+        super().__init__(config=config)
+        self.headers["accept"] = "application/astra-app+json"
+
+    def main(
+        self,
+        appID,
+        states=None,
+        failedStates=None,
+        pollTimer=5,
+        maxPollTimer=DEFAULT_WAIT_MAX_INTERVAL,
+        timeout=DEFAULT_WAIT_TIMEOUT,
+        onPoll=None,
+    ):
+        """appID: the app to wait for, which may not exist yet (a 404 is treated as pending)
+        states: return the app once it's in one of these states (defaults to ["ready"])
+        failedStates: return False once the app is in one of these states (defaults to ["failed"])
+        pollTimer: the initial number of seconds between polls
+        maxPollTimer: the maximum number of seconds between polls
+        timeout: return False if the app isn't in one of states after this many seconds
+        onPoll: optionally called with the app dict (or None if it doesn't exist yet) after
+                every poll which doesn't return, for instance to print progress"""
+        states = ["ready"] if states is None else states
+        failedStates = ["failed"] if failedStates is None else failedStates
+        endpoint = f"k8s/v2/apps/{appID}"
+        url = self.base + endpoint
+        params = {}
+        data = {}
+
+        deadline = time.monotonic() + timeout
+        interval = pollTimer
+        lastState = None
+        while True:
+            ret = super().apicall(
+                "get", url, data, self.headers, params, quiet=True, verbose=self.verbose
+            )
+            if ret.ok:
+                app = super().jsonifyResults(ret)
+            elif ret.status_code == 404:
+                app = None
+            else:
+                if not self.quiet:
+                    super().printError(ret)
+                return False
+
+            state = app.get("state") if app else None
+            if state in states:
+                return app
+            if state in failedStates:
+                if not self.quiet:
+                    super().printError(f"Error: app {appID} is in a {state} state\n")
+                return False
+            if onPoll:
+                onPoll(app)
+
+            if state != lastState:
+                interval = pollTimer
+                lastState = state
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if not self.quiet:
+                    super().printError(
+                        f"Error: timed out after {timeout} seconds waiting for app {appID} "
+                        f"(state: {state})\n"
+                    )
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 1.5, max(pollTimer, maxPollTimer))
+
+
 class manageApp(SDKCommon):
     """This class switches an unmanaged (aka undefined) app to a managed (aka defined) app.
     By default, it handles the simplest case, managing a single, entire namespace.
@@ -243,7 +335,7 @@ class manageApp(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -363,7 +455,7 @@ class cloneApp(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -452,21 +544,13 @@ class getAppAssets(SDKCommon):
         endpoint = f"k8s/v1/apps/{appID}/appAssets"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, assets = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            assets = super().jsonifyResults(ret)
+        if ret.ok and assets is not None:
             assets["metadata"]["appID"] = appID
             if self.output == "json":
                 dataReturn = assets
@@ -479,7 +563,7 @@ class getAppAssets(SDKCommon):
                     assets,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -15,11 +15,9 @@
    limitations under the License.
 """
 
-import copy
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getAsups(SDKCommon):
@@ -42,28 +40,18 @@ class getAsups(SDKCommon):
         endpoint = "core/v1/asups"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, results = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            results = super().jsonifyResults(ret)
-            if triggerTypeFilter or uploadFilter:
-                asupsCopy = copy.deepcopy(results)
-                for counter, asup in enumerate(asupsCopy.get("items")):
-                    if triggerTypeFilter and triggerTypeFilter != asup["triggerType"]:
-                        results["items"].remove(asupsCopy["items"][counter])
-                    elif uploadFilter and uploadFilter != asup["upload"]:
-                        results["items"].remove(asupsCopy["items"][counter])
+        if ret.ok and results is not None:
+            results = self.filterItems(
+                results,
+                lambda asup: not triggerTypeFilter or triggerTypeFilter == asup["triggerType"],
+                lambda asup: not uploadFilter or uploadFilter == asup["upload"],
+            )
             if self.output == "json":
                 dataReturn = results
             elif self.output == "yaml":
@@ -91,7 +79,7 @@ class getAsups(SDKCommon):
                     results,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -200,7 +188,7 @@ class createAsup(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
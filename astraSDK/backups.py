@@ -16,9 +16,8 @@
 """
 
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, ItemWriter, STREAM_OUTPUTS, jsonDumps
 from .apps import getApps
 
 
@@ -35,12 +34,17 @@ class getBackups(SDKCommon):
         output: table: pretty print the data
                 json: (default) output in JSON
                 yaml: output in yaml
+                ndjson, yaml-stream, table-stream: write each backup as soon as it's fetched
+                                                   (see common.ItemWriter), and return True
         config: optionally provide a pre-populated common.getConfig().main() object"""
         self.quiet = quiet
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.apps = getApps(quiet=True, verbose=verbose, config=config).main()
+        self.apps = self.context.get(
+            "apps",
+            lambda: getApps(quiet=True, verbose=verbose, config=self.conf).main(),
+        )
 
     def main(self, appFilter=None):
         if self.apps is False:
@@ -65,26 +69,31 @@ class getBackups(SDKCommon):
         backups = {}
         backups["items"] = []
 
-        for app in self.apps["items"]:
-            if appFilter:
-                if app["name"] != appFilter and app["id"] != appFilter:
-                    continue
-            endpoint = f"k8s/v1/apps/{app['id']}/appBackups"
-            url = self.base + endpoint
-
-            data = {}
-            params = {}
-
-            ret = super().apicall(
+        apps = [
+            app
+            for app in self.apps["items"]
+            if not appFilter or appFilter in (app["name"], app["id"])
+        ]
+        tabHeader = ["appID", "backupName", "backupID", "backupState", "creationTimestamp"]
+        tabKeys = ["appID", "name", "id", "state", "metadata.creationTimestamp"]
+        # Streaming outputs write each app's backups as soon as they're fetched
+        writer = None
+        if self.output in STREAM_OUTPUTS:
+            writer = ItemWriter(self.output, tabHeader, tabKeys, quiet=self.quiet)
+        rets = self.iterFanOut(
+            lambda app: self.apicall(
                 "get",
-                url,
-                data,
+                self.base + f"k8s/v1/apps/{app['id']}/appBackups",
+                {},
                 self.headers,
-                params,
+                {},
                 quiet=self.quiet,
                 verbose=self.verbose,
-            )
+            ),
+            apps,
+        )
 
+        for app, ret in zip(apps, rets):
             if ret.ok:
                 results = super().jsonifyResults(ret)
                 if results is None:
@@ -94,11 +103,14 @@ class getBackups(SDKCommon):
                     # Adding custom 'appID' key/value pair
                     if not item.get("appID"):
                         item["appID"] = app["id"]
-                    backups["items"].append(item)
+                if writer:
+                    writer.write(results["items"])
+                else:
+                    backups["items"].extend(results["items"])
                 if not self.quiet and self.verbose:
                     print(f"Backups for {app['id']}")
                     if self.output == "json":
-                        print(json.dumps(results))
+                        print(jsonDumps(results))
                     elif self.output == "yaml":
                         print(yaml.dump(results))
                     elif self.output == "table":
@@ -115,19 +127,19 @@ class getBackups(SDKCommon):
                     super().printError(ret)
                 continue
 
+        if writer:
+            writer.close()
+            return True
+
         if self.output == "json":
             dataReturn = backups
         elif self.output == "yaml":
             dataReturn = yaml.dump(backups)
         elif self.output == "table":
-            dataReturn = self.basicTable(
-                ["appID", "backupName", "backupID", "backupState", "creationTimestamp"],
-                ["appID", "name", "id", "state", "metadata.creationTimestamp"],
-                backups,
-            )
+            dataReturn = self.basicTable(tabHeader, tabKeys, backups)
 
         if not self.quiet:
-            print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+            print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
         return dataReturn
 
 
@@ -173,7 +185,7 @@ class takeBackup(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results.get("id") or True
         else:
             if not self.quiet:
@@ -16,10 +16,8 @@
 """
 
 import yaml
-import json
-import copy
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getBuckets(SDKCommon):
@@ -41,29 +39,20 @@ class getBuckets(SDKCommon):
         endpoint = "topology/v1/buckets"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, buckets = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            buckets = super().jsonifyResults(ret)
+        if ret.ok and buckets is not None:
             if buckets is None:
                 return False
-            bucketsCooked = copy.deepcopy(buckets)
-            for counter, bucket in enumerate(buckets.get("items")):
-                if nameFilter and nameFilter.lower() not in bucket.get("name").lower():
-                    bucketsCooked["items"].remove(buckets["items"][counter])
-                elif provider and provider != bucket.get("provider"):
-                    bucketsCooked["items"].remove(buckets["items"][counter])
+            bucketsCooked = self.filterItems(
+                buckets,
+                lambda bucket: not nameFilter or nameFilter.lower() in bucket.get("name").lower(),
+                lambda bucket: not provider or provider == bucket.get("provider"),
+            )
 
             if self.output == "json":
                 dataReturn = bucketsCooked
@@ -76,7 +65,7 @@ class getBuckets(SDKCommon):
                     bucketsCooked,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -128,7 +117,7 @@ class manageBucket(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -214,7 +203,7 @@ class updateBucket(SDKCommon):
             # the buckets/ endpoint doesn't return a dict for PUTs, so calling getBuckets
             results = next(b for b in getBuckets().main()["items"] if b["id"] == bucketID)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
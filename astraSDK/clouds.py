@@ -16,10 +16,8 @@
 """
 
 import yaml
-import json
-import copy
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getClouds(SDKCommon):
@@ -39,25 +37,16 @@ class getClouds(SDKCommon):
         endpoint = "topology/v1/clouds"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, clouds = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            clouds = super().jsonifyResults(ret)
-            cloudsCooked = copy.deepcopy(clouds)
-            for counter, cloud in enumerate(clouds.get("items")):
-                if cloudType and cloudType != cloud["cloudType"]:
-                    cloudsCooked["items"].remove(clouds["items"][counter])
+        if ret.ok and clouds is not None:
+            cloudsCooked = self.filterItems(
+                clouds, lambda cloud: not cloudType or cloudType == cloud["cloudType"]
+            )
             if self.output == "json":
                 dataReturn = cloudsCooked
             elif self.output == "yaml":
@@ -69,7 +58,7 @@ class getClouds(SDKCommon):
                     cloudsCooked,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -121,7 +110,7 @@ class manageCloud(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -208,7 +197,7 @@ class updateCloud(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
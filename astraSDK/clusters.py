@@ -15,11 +15,9 @@
    limitations under the License.
 """
 
-import copy
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 from .clouds import getClouds
 
 
@@ -38,12 +36,15 @@ class getClusters(SDKCommon):
         self.output = output
         self.config = config
         super().__init__(config=config)
-        self.clouds = getClouds(quiet=True, verbose=verbose, config=config).main()
+        self.clouds = self.context.get(
+            "clouds",
+            lambda: getClouds(quiet=True, verbose=verbose, config=self.conf).main(),
+        )
 
     def main(self, hideManaged=False, hideUnmanaged=False, nameFilter=None):
         if hideUnmanaged:
             return getManagedClusters(
-                quiet=self.quiet, verbose=self.verbose, output=self.output, config=self.config
+                quiet=self.quiet, verbose=self.verbose, output=self.output, config=self.conf
             ).main(nameFilter=nameFilter)
         clusters = {}
         clusters["items"] = []
@@ -110,7 +111,7 @@ class getClusters(SDKCommon):
             )
 
         if not self.quiet:
-            print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+            print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
         return dataReturn
 
 
@@ -132,26 +133,15 @@ class getManagedClusters(SDKCommon):
     def main(self, nameFilter=None):
         endpoint = "topology/v1/managedClusters"
         url = self.base + endpoint
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, clusters = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            clusters = super().jsonifyResults(ret)
+        if ret.ok and clusters is not None:
             if nameFilter:
-                filterCopy = copy.deepcopy(clusters)
-                for counter, r in enumerate(filterCopy.get("items")):
-                    if nameFilter not in self.recursiveGet("name", r):
-                        clusters["items"].remove(filterCopy["items"][counter])
+                clusters = self.filterItems(clusters, lambda r: nameFilter in r.get("name"))
 
             if self.output == "json":
                 dataReturn = clusters
@@ -181,7 +171,7 @@ class getManagedClusters(SDKCommon):
                 )
 
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -228,7 +218,7 @@ class manageCluster(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -248,7 +238,10 @@ class unmanageCluster(SDKCommon):
         super().__init__(config=config)
         self.headers["accept"] = "application/astra-managedCluster+json"
         self.headers["Content-Type"] = "application/managedCluster+json"
-        self.clusters = getClusters().main()
+        self.clusters = self.context.get(
+            "clusters",
+            lambda: getClusters(quiet=True, verbose=verbose, config=self.conf).main(),
+        )
 
     def main(self, clusterID):
         endpoint = f"topology/v1/managedClusters/{clusterID}"
@@ -326,7 +319,7 @@ class addCluster(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -412,7 +405,7 @@ class updateCluster(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -15,20 +15,73 @@
    limitations under the License.
 """
 
+import atexit
+import contextlib
+import contextvars
+import functools
+import gc
 import json
-import kubernetes
 import os
+import random
+import re
 import requests
 import shutil
+import socket
 import sys
 import textwrap
+import threading
+import time
 import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
 from tabulate import tabulate
 from urllib3 import disable_warnings
+from urllib3.connection import HTTPConnection
+
+# orjson is an optional, much faster json codec, the standard library json module is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 RED = "\033[31m"
 GREEN = "\033[32m"
 ENDC = "\033[0m"
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_MAX_BACKOFF = 30
+# Methods which are safe to repeat, any method is retried on a 429 as it was not processed
+IDEMPOTENT_METHODS = ["get", "put", "delete"]
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 120
+DEFAULT_RESPONSE_CACHE_SIZE = 32
+DEFAULT_RESPONSE_CACHE_TTL = 30
+DEFAULT_KUBE_LIST_LIMIT = 500
+DEFAULT_PAGE_SIZE = 500
+# Seconds the aio classes (which are typically used by long-lived processes) reuse the parent
+# collections of their ResourceContext for
+DEFAULT_AIO_CONTEXT_TTL = 30
+# Polling interval cap and overall deadline (in seconds) of waiting on a single resource
+DEFAULT_WAIT_MAX_INTERVAL = 60
+DEFAULT_WAIT_TIMEOUT = 3 * 60 * 60
+# Most pending jobs of a kubernetes plural which a KubeJobTracker checks with a GET each per cycle,
+# rather than with a list of the whole plural (whose size doesn't depend on the pending jobs)
+DEFAULT_JOB_MAX_GETS = 50
+# Output formats which write each item as soon as it's fetched, rather than the whole collection
+STREAM_OUTPUTS = ["ndjson", "yaml-stream", "table-stream"]
+STREAM_TABLE_MAX_WIDTH = 60
+# Filter values which can be pushed down to the kubernetes API server as a selector, and match
+# exactly the same resources as the client-side filter would
+KUBE_NAME = re.compile(r"^[a-z0-9]([-a-z0-9.]{0,251}[a-z0-9])?$")
+KUBE_LABEL_KEY = re.compile(
+    r"^([a-z0-9]([-a-z0-9]{0,251}[a-z0-9])?/)?[A-Za-z0-9]([-A-Za-z0-9_]{0,61}[A-Za-z0-9])?$"
+)
+KUBE_LABEL_VALUE = re.compile(r"^[A-Za-z0-9]([-A-Za-z0-9_.]{0,61}[A-Za-z0-9])?$")
 
 
 class getConfig:
@@ -39,21 +92,39 @@ class getConfig:
     2) ~/.config/astra-toolkits/
     3) /etc/astra-toolkits/
     4) The directory pointed to by the shell env var ASTRATOOLKITS_CONF
+
+    The optional maxWorkers field sets how many API calls may be in flight at once when a class
+    fans out over many parent objects (for instance listing the backups of every app).
+
+    The optional maxRetries, retryBackoff, and retryMaxBackoff fields control how failed API
+    calls are retried (see SDKCommon.apicall), and diagnoseErrors enables an additional
+    GET clouds call after a failure to improve error messaging.
+
+    The optional poolConnections, poolMaxsize, connectTimeout, readTimeout, and keepAlive fields
+    tune the connection pooling and timeouts of the requests session shared by every class.
+
+    The optional responseCacheSize (MiB) and responseCacheTTL (seconds) fields configure the
+    ResponseCache of GET responses.
     """
 
+    @staticmethod
+    def searchPaths():
+        """Returns the config.yaml paths which are searched, in order"""
+        return [
+            os.path.join(loc, "config.yaml")
+            for loc in (
+                os.getcwd(),
+                os.path.join(os.path.expanduser("~"), ".config", "astra-toolkits"),
+                "/etc/astra-toolkits",
+                os.environ.get("ASTRATOOLKITS_CONF"),
+            )
+            # loc could be None, which would blow up os.path.join()
+            if loc
+        ]
+
     def __init__(self):
         self.conf = None
-        for loc in (
-            os.getcwd(),
-            os.path.join(os.path.expanduser("~"), ".config", "astra-toolkits"),
-            "/etc/astra-toolkits",
-            os.environ.get("ASTRATOOLKITS_CONF"),
-        ):
-            # loc could be None, which would blow up os.path.join()
-            if loc:
-                configFile = os.path.join(loc, "config.yaml")
-            else:
-                continue
+        for configFile in self.searchPaths():
             try:
                 if os.path.isfile(configFile):
                     with open(configFile, "r") as f:
@@ -89,15 +160,779 @@ class getConfig:
         else:
             self.session.verify = True
 
+        self.maxWorkers = self.conf.get("maxWorkers", DEFAULT_MAX_WORKERS)
+        if not isinstance(self.maxWorkers, int) or self.maxWorkers < 1:
+            raise SystemExit(f"maxWorkers must be a positive integer in {configFile}")
+        self.maxRetries = self.conf.get("maxRetries", DEFAULT_MAX_RETRIES)
+        if not isinstance(self.maxRetries, int) or self.maxRetries < 0:
+            raise SystemExit(f"maxRetries must be a non-negative integer in {configFile}")
+        self.retryBackoff = self.conf.get("retryBackoff", DEFAULT_RETRY_BACKOFF)
+        self.retryMaxBackoff = self.conf.get("retryMaxBackoff", DEFAULT_RETRY_MAX_BACKOFF)
+        for name, value in [
+            ("retryBackoff", self.retryBackoff),
+            ("retryMaxBackoff", self.retryMaxBackoff),
+        ]:
+            if type(value) not in [int, float] or value < 0:
+                raise SystemExit(f"{name} must be a non-negative number in {configFile}")
+        self.diagnoseErrors = self.conf.get("diagnoseErrors") is True
+
+        self.poolConnections = self.conf.get("poolConnections", DEFAULT_POOL_CONNECTIONS)
+        # Fan out calls all go to the same host, so make sure each of them gets a connection
+        self.poolMaxsize = self.conf.get("poolMaxsize", max(self.maxWorkers, 10))
+        for name, value in [
+            ("poolConnections", self.poolConnections),
+            ("poolMaxsize", self.poolMaxsize),
+        ]:
+            if not isinstance(value, int) or value < 1:
+                raise SystemExit(f"{name} must be a positive integer in {configFile}")
+        # A timeout of null disables it, matching the requests module
+        timeouts = []
+        for name, default in [
+            ("connectTimeout", DEFAULT_CONNECT_TIMEOUT),
+            ("readTimeout", DEFAULT_READ_TIMEOUT),
+        ]:
+            value = self.conf.get(name, default)
+            if value is not None and (type(value) not in [int, float] or value <= 0):
+                raise SystemExit(f"{name} must be a positive number or null in {configFile}")
+            timeouts.append(value)
+        self.timeout = tuple(timeouts)
+        self.keepAlive = self.conf.get("keepAlive") is not False
+        adapter = PoolAdapter(
+            keepAlive=self.keepAlive,
+            pool_connections=self.poolConnections,
+            pool_maxsize=self.poolMaxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        if not self.keepAlive:
+            self.session.headers["Connection"] = "close"
+
+        self.responseCacheSize = self.conf.get("responseCacheSize", DEFAULT_RESPONSE_CACHE_SIZE)
+        self.responseCacheTTL = self.conf.get("responseCacheTTL", DEFAULT_RESPONSE_CACHE_TTL)
+        for name, value in [
+            ("responseCacheSize", self.responseCacheSize),
+            ("responseCacheTTL", self.responseCacheTTL),
+        ]:
+            if type(value) not in [int, float] or value < 0:
+                raise SystemExit(f"{name} must be a non-negative number in {configFile}")
+
     def main(self):
         return {
             "base": self.base,
             "session": self.session,
             "domain": self.domain,
             "account_id": self.account_id,
+            "max_workers": self.maxWorkers,
+            "max_retries": self.maxRetries,
+            "retry_backoff": self.retryBackoff,
+            "retry_max_backoff": self.retryMaxBackoff,
+            "diagnose_errors": self.diagnoseErrors,
+            "timeout": self.timeout,
+            "context": ResourceContext(),
+            "response_cache": ResponseCache(
+                maxBytes=int(self.responseCacheSize * 1024 * 1024), ttl=self.responseCacheTTL
+            ),
         }
 
 
+class PoolAdapter(HTTPAdapter):
+    """An HTTPAdapter which enables TCP keep-alive on its pooled connections (unless keepAlive is
+    False), so idle connections between calls aren't silently dropped by load balancers or NAT
+    gateways, which would otherwise cost a new TCP and TLS handshake"""
+
+    def __init__(self, keepAlive=True, **kwargs):
+        self.keepAlive = keepAlive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.keepAlive:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+class ResourceContext:
+    """Many SDK classes need the same parent collections (apps, clouds, clusters) before they
+    can do their own work, for instance getBackups needs every app, and getStorageClasses needs
+    every cloud and cluster. An instantiation of this class lives in the getConfig().main() dict,
+    so that every class sharing a config also shares a single fetch of each parent collection.
+
+    Entries are dropped whenever a successful POST/PUT/PATCH/DELETE is made against an endpoint
+    that could change them (see SDKCommon.apicall), so the context never outlives a mutation.
+    For long-lived processes (which may not see every mutation), entries can also be given a
+    ttl (in seconds), after which they're fetched again."""
+
+    # Parent collection name -> endpoint prefixes which, when modified, invalidate it
+    endpoints = {
+        "apps": ("k8s/v2/apps",),
+        "clouds": ("topology/v1/clouds",),
+        "clusters": ("topology/v1/clouds", "topology/v1/managedClusters"),
+    }
+
+    def __init__(self, ttl=None):
+        self.resources = {}
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.keyLocks = {}
+
+    def get(self, name, fetch):
+        """Return the memoized 'name' collection, calling fetch() to populate it on first use
+        (or once it's older than the ttl). Concurrent callers for the same name wait on the first
+        fetch rather than duplicating it. A failed fetch (False) is returned but not memoized, so
+        a later caller can retry."""
+        with self.lock:
+            keyLock = self.keyLocks.setdefault(name, threading.Lock())
+        with keyLock:
+            if name in self.resources:
+                fetched, resource = self.resources[name]
+                if self.ttl is None or time.monotonic() - fetched < self.ttl:
+                    return resource
+            resource = fetch()
+            if resource is not False:
+                self.resources[name] = (time.monotonic(), resource)
+            return resource
+
+    def invalidate(self, name=None):
+        """Drop a single memoized collection, or all of them if name is None"""
+        with self.lock:
+            if name is None:
+                self.resources.clear()
+            else:
+                self.resources.pop(name, None)
+
+    def invalidateEndpoint(self, endpoint):
+        """Drop every memoized collection which could be affected by a change to endpoint"""
+        for name, prefixes in self.endpoints.items():
+            if endpoint.startswith(prefixes):
+                self.invalidate(name)
+
+
+class ResponseCache:
+    """A bounded, least recently used cache of GET responses, which lives in the
+    getConfig().main() dict so it's shared by every class using the same config.
+
+    A cached response with an ETag or Last-Modified header is revalidated with a conditional
+    request (If-None-Match / If-Modified-Since), and reused if the server responds with a
+    304 Not Modified, so those are always up to date. Responses of the rarely changing
+    collections in ttlEndpoints without either header are reused without contacting the server
+    for up to ttl seconds. Any successful POST/PUT/PATCH/DELETE drops every cached response of
+    the same API group (topology, core, k8s, etc.), as a change to one resource can show up in
+    several collections (managing a cluster changes both topology/v1/clusters and
+    topology/v1/managedClusters)."""
+
+    ttlEndpoints = (
+        "topology/v1/clouds",
+        "topology/v1/clusters",
+        "core/v1/credentials",
+        "core/v1/hookSources",
+        "core/v1/settings",
+    )
+
+    def __init__(
+        self, maxBytes=DEFAULT_RESPONSE_CACHE_SIZE * 1024 * 1024, ttl=DEFAULT_RESPONSE_CACHE_TTL
+    ):
+        self.maxBytes = maxBytes
+        self.ttl = ttl
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def key(self, endpoint, params, headers):
+        return (endpoint, json.dumps(params, sort_keys=True), headers.get("accept"))
+
+    def get(self, key):
+        """Returns a (response, fresh) tuple, where fresh is True if the response can be used
+        without contacting the server, or (None, False) if there's no cached response"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None, False
+            self.entries.move_to_end(key)
+            ret, stored = entry
+        fresh = (
+            self.ttl > 0
+            and key[0].startswith(self.ttlEndpoints)
+            and not (ret.headers.get("ETag") or ret.headers.get("Last-Modified"))
+            and time.monotonic() - stored < self.ttl
+        )
+        return ret, fresh
+
+    def conditionalHeaders(self, ret):
+        """Returns the headers to revalidate a cached response, if it has a validator"""
+        headers = {}
+        if ret.headers.get("ETag"):
+            headers["If-None-Match"] = ret.headers["ETag"]
+        if ret.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = ret.headers["Last-Modified"]
+        return headers
+
+    def put(self, key, ret):
+        """Stores a successful GET response if it could ever be reused, evicting the least
+        recently used responses to remain under maxBytes"""
+        cacheable = (
+            ret.headers.get("ETag")
+            or ret.headers.get("Last-Modified")
+            or (self.ttl > 0 and key[0].startswith(self.ttlEndpoints))
+        )
+        size = len(ret.content or b"")
+        if not cacheable or size > self.maxBytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.size -= len(self.entries.pop(key)[0].content or b"")
+            self.entries[key] = (ret, time.monotonic())
+            self.size += size
+            while self.size > self.maxBytes:
+                _, (old, _) = self.entries.popitem(last=False)
+                self.size -= len(old.content or b"")
+
+    def touch(self, key):
+        """Resets the age of a response which was just revalidated"""
+        with self.lock:
+            if key in self.entries:
+                self.entries[key] = (self.entries[key][0], time.monotonic())
+
+    def invalidateEndpoint(self, endpoint):
+        """Drops every cached response within the same API group as endpoint"""
+        group = endpoint.split("/")[0] + "/"
+        with self.lock:
+            for key in [k for k in self.entries if k[0].startswith(group)]:
+                self.size -= len(self.entries.pop(key)[0].content or b"")
+
+
+class KubeClientPool:
+    """A process-wide, thread safe registry of kubernetes ApiClients, so that every KubeCommon
+    class for the same config_context (and verify_ssl / debug settings) reuses one configured
+    ApiClient and its connection pool, rather than re-reading and re-parsing the kubeconfig and
+    opening new connections for every class.
+
+    Each client is stamped with the paths and modification times of the kubeconfig files it could
+    have been loaded from, and is closed and reloaded if any of them change (for instance after a
+    'kubectl config use-context', or a different KUBECONFIG), which matters for long-lived
+    processes like actoolkitd."""
+
+    def __init__(self):
+        self.clients = {}
+        self.lock = threading.Lock()
+        self.keyLocks = {}
+
+    def stamp(self, config_context):
+        """Returns the paths and modification times of the kubeconfig files that config_context
+        could refer to: the KUBECONFIG (or ~/.kube/config) files, and config_context's file, if
+        any"""
+        paths = os.environ.get("KUBECONFIG", "~/.kube/config").split(os.pathsep)
+        if config_context:
+            paths.append(config_context.split("@")[-1])
+        mtimes = []
+        for path in paths:
+            path = os.path.expanduser(path)
+            try:
+                mtimes.append((path, os.stat(path).st_mtime_ns))
+            except (OSError, ValueError):
+                mtimes.append((path, None))
+        return tuple(mtimes)
+
+    def get(self, key, config_context, load):
+        """Return the ApiClient for key, calling load() to create it on first use (or if its
+        kubeconfig has changed). A failed load (None) is returned but not pooled, so a later
+        caller can retry."""
+        with self.lock:
+            keyLock = self.keyLocks.setdefault(key, threading.Lock())
+        with keyLock:
+            stamp = self.stamp(config_context)
+            if key in self.clients:
+                clientStamp, client = self.clients[key]
+                if clientStamp == stamp:
+                    return client
+                self.evict(key)
+            client = load()
+            if client is not None:
+                with self.lock:
+                    self.clients[key] = (stamp, client)
+            return client
+
+    def evict(self, key):
+        """Close and drop the ApiClient for key"""
+        with self.lock:
+            entry = self.clients.pop(key, None)
+        if entry:
+            entry[1].close()
+
+    def close(self, config_context=None):
+        """Close and drop every pooled ApiClient of config_context, or all of them if None"""
+        with self.lock:
+            keys = [k for k in self.clients if config_context is None or k[0] == config_context]
+        for key in keys:
+            self.evict(key)
+
+
+kubeClients = KubeClientPool()
+atexit.register(kubeClients.close)
+
+
+class Profiler:
+    """A process-wide, thread safe recorder of every HTTP request made by SDKCommon.apicall,
+    SDKCommon.downloadFile, and the kubernetes classes (the method, path template, status code,
+    response bytes, and latency of each), and of named phases of work (like the toolkit's config
+    load, choices prefetch, parser build, and command).
+
+    Nothing is recorded unless recording is turned on with enable(), which keeps every record for
+    summary() / report() until reset(), or a callback is registered with addCallback(callback),
+    which calls callback(record) with every record dict as it's made (from whichever thread made
+    the request, so callbacks must be thread safe). Request records look like:
+        {"type": "request", "source": "astra" or "kube", "method": "GET",
+         "path": "k8s/v1/apps/{id}/appBackups", "status": 200, "bytes": 1234,
+         "latency": 0.123, "cached": False, "start": 1.234}
+    where path has IDs replaced with {id} (or kubernetes names and namespaces with {name} and
+    {namespace}), status is None if no response was received, bytes is None if unknown (streamed
+    kubernetes responses without a Content-Length), cached is True for a fresh ResponseCache hit,
+    and start is seconds since the profiler was created or reset. Phase records look like:
+        {"type": "phase", "name": "command", "duration": 1.234, "start": 0.123}"""
+
+    idPattern = re.compile(r"(?<=/)[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}(?=/|$)")
+
+    def __init__(self):
+        self.enabled = False
+        self.callbacks = []
+        self.records = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.epoch = time.perf_counter()
+
+    def active(self):
+        """Returns whether requests and phases are currently being recorded"""
+        return self.enabled or bool(self.callbacks)
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def reset(self):
+        """Drops every kept record, and restarts the clock of the records' start times"""
+        with self.lock:
+            self.records = []
+            self.epoch = time.perf_counter()
+
+    def addCallback(self, callback):
+        with self.lock:
+            self.callbacks = self.callbacks + [callback]
+
+    def removeCallback(self, callback):
+        with self.lock:
+            self.callbacks = [c for c in self.callbacks if c is not callback]
+
+    def emit(self, record):
+        if self.enabled:
+            with self.lock:
+                self.records.append(record)
+        for callback in self.callbacks:
+            callback(record)
+
+    def request(self, source, method, path, status, nbytes, start, cached=False):
+        """Records a request which was sent at start (a time.perf_counter() value)"""
+        now = time.perf_counter()
+        self.emit(
+            {
+                "type": "request",
+                "source": source,
+                "method": method.upper(),
+                "path": self.idPattern.sub("{id}", path),
+                "status": status,
+                "bytes": nbytes,
+                "latency": now - start,
+                "cached": cached,
+                "start": start - self.epoch,
+            }
+        )
+
+    def addPhase(self, name, duration, start=None):
+        """Records a phase of duration seconds, which was started at start (a
+        time.perf_counter() value, by default duration seconds ago), unless the calling thread is
+        within nestedPhases()"""
+        if self.active() and not getattr(self.local, "nested", 0):
+            start = time.perf_counter() - duration if start is None else start
+            self.emit(
+                {"type": "phase", "name": name, "duration": duration, "start": start - self.epoch}
+            )
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Context manager which records the time spent within it as the name phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addPhase(name, time.perf_counter() - start, start)
+
+    @contextlib.contextmanager
+    def nestedPhases(self):
+        """Context manager which stops the calling thread's phases from being recorded within it
+        (its requests still are), for work which is already timed by an enclosing phase"""
+        self.local.nested = getattr(self.local, "nested", 0) + 1
+        try:
+            yield
+        finally:
+            self.local.nested -= 1
+
+    def instrumentApiClient(self, client):
+        """Wraps the call_api and rest_client.request methods of a kubernetes ApiClient so every
+        request it makes is recorded (while the profiler is active). call_api knows the path
+        template and parameters, and rest_client.request the response."""
+        callApi, restRequest = client.call_api, client.rest_client.request
+
+        def call_api(resource_path, method, path_params=None, *args, **kwargs):
+            if not self.active():
+                return callApi(resource_path, method, path_params, *args, **kwargs)
+            path = resource_path
+            for key, value in (path_params or {}).items():
+                if key not in ["name", "namespace"]:
+                    path = path.replace("{%s}" % key, str(value))
+            self.local.kubePath = path
+            try:
+                return callApi(resource_path, method, path_params, *args, **kwargs)
+            finally:
+                self.local.kubePath = None
+
+        def request(method, url, *args, **kwargs):
+            path = getattr(self.local, "kubePath", None)
+            if path is None:
+                return restRequest(method, url, *args, **kwargs)
+            start, status, nbytes = time.perf_counter(), None, None
+            try:
+                resp = restRequest(method, url, *args, **kwargs)
+                status = resp.status
+                if kwargs.get("_preload_content", True):
+                    nbytes = len(resp.data or b"")
+                elif resp.headers.get("Content-Length"):
+                    nbytes = int(resp.headers["Content-Length"])
+                return resp
+            except Exception as err:
+                # ApiExceptions carry the status and body of non-2xx responses
+                status = getattr(err, "status", None) or None
+                body = getattr(err, "body", None)
+                nbytes = len(body) if isinstance(body, (str, bytes)) else None
+                raise
+            finally:
+                self.request("kube", method, path, status, nbytes, start)
+
+        client.call_api, client.rest_client.request = call_api, request
+        return client
+
+    def summary(self):
+        """Returns a dict of the kept phases (name: count and total duration) and requests
+        (aggregated by source, method, and path), along with request totals"""
+        with self.lock:
+            records = list(self.records)
+        phases, requests = {}, {}
+        for r in records:
+            if r["type"] == "phase":
+                phase = phases.setdefault(r["name"], {"count": 0, "duration": 0})
+                phase["count"] += 1
+                phase["duration"] += r["duration"]
+                continue
+            group = requests.setdefault(
+                (r["source"], r["method"], r["path"]),
+                {"count": 0, "errors": 0, "cached": 0, "bytes": 0, "latencies": []},
+            )
+            group["count"] += 1
+            group["errors"] += r["status"] is None or r["status"] >= 400
+            group["cached"] += r["cached"]
+            group["bytes"] += r["bytes"] or 0
+            group["latencies"].append(r["latency"])
+        groups = []
+        for (source, method, path), group in requests.items():
+            latencies = sorted(group.pop("latencies"))
+            groups.append(
+                {
+                    "source": source,
+                    "method": method,
+                    "path": path,
+                    **group,
+                    "total": sum(latencies),
+                    "median": latencies[len(latencies) // 2],
+                    "max": latencies[-1],
+                }
+            )
+        groups.sort(key=lambda g: g["total"], reverse=True)
+        return {
+            "phases": [{"name": name, **phase} for name, phase in phases.items()],
+            "requests": groups,
+            "totals": {
+                key: sum(g[key] for g in groups)
+                for key in ["count", "errors", "cached", "bytes", "total"]
+            },
+        }
+
+    def report(self):
+        """Returns the summary() as a human readable pair of tables"""
+        summary = self.summary()
+        phaseTable = tabulate(
+            [[p["name"], p["count"], f"{p['duration']:.3f}s"] for p in summary["phases"]],
+            ["phase", "count", "time"],
+            tablefmt="simple",
+        )
+        totals = summary["totals"]
+        requestTable = tabulate(
+            [
+                [
+                    g["source"],
+                    g["method"],
+                    g["path"],
+                    g["count"],
+                    g["errors"],
+                    g["cached"],
+                    g["bytes"],
+                    f"{g['total']:.3f}s",
+                    f"{g['median']:.3f}s",
+                    f"{g['max']:.3f}s",
+                ]
+                for g in summary["requests"]
+            ]
+            + [
+                [
+                    "total",
+                    "",
+                    "",
+                    totals["count"],
+                    totals["errors"],
+                    totals["cached"],
+                    totals["bytes"],
+                    f"{totals['total']:.3f}s",
+                    "",
+                    "",
+                ]
+            ],
+            [
+                "source",
+                "method",
+                "path",
+                "count",
+                "errors",
+                "cached",
+                "bytes",
+                "total time",
+                "median",
+                "max",
+            ],
+            tablefmt="simple",
+        )
+        return f"{phaseTable}\n\n{requestTable}\n"
+
+    def write(self, path):
+        """Writes the summary() and every kept record to path as json"""
+        with self.lock:
+            records = list(self.records)
+        with open(path, "w") as f:
+            json.dump({**self.summary(), "records": records}, f, indent=2)
+
+
+profiler = Profiler()
+
+
+@functools.lru_cache(maxsize=1024)
+def compilePath(k):
+    """Compiles a key path into a function(item, conCatList=None) which returns the value of the
+    key path within item, so that the key path is only parsed once rather than on every lookup:
+     - '.' in the key name ('metadata.creationTimestamp') is used to identify a dict
+     - '[]' in the key name ('spec.includedNamespaces[]') is used to identify a list, the values of
+       which are joined into a comma separated string
+     - '*' as a key represents a wildcard (returns first entry)
+     - 'KEYS' represents returning the keys rather than the vaules."""
+    if k.startswith("."):
+        return compilePath(k[1:])
+    dot, brackets = k.find("."), k.find("[]")
+    # A dict, if the first '.' comes before the first '[]'
+    if dot != -1 and (brackets == -1 or dot < brackets):
+        head, rest = k[:dot], compilePath(k[dot + 1 :])
+        if head == "*":
+            return lambda item, conCatList=None: rest(item[next(iter(item))], conCatList)
+        elif head == "KEYS":
+            return lambda item, conCatList=None: rest(item[head].keys(), conCatList)
+
+        def getDict(item, conCatList=None):
+            try:
+                return rest(item[head], conCatList)
+            except KeyError:
+                return "None"
+
+        return getDict
+    # A list
+    elif brackets != -1:
+        head, rest = k[:brackets], compilePath(k[brackets + 2 :])
+
+        def getList(item, conCatList=None):
+            if conCatList is None:
+                conCatList = []
+            for i in item[head]:
+                if add := rest(i, []):
+                    conCatList.append(add)
+            return ", ".join(conCatList)
+
+        return getList
+    elif k == "KEYS":
+        return lambda item, conCatList=None: list(item.keys())
+    elif k == "*":
+        return lambda item, conCatList=None: item[next(iter(item))]
+
+    def getValue(item, conCatList=None):
+        if isinstance(item, dict):
+            value = item.get(k)
+            return str(value) if isinstance(value, dict) else value
+        return ""
+
+    return getValue
+
+
+@functools.lru_cache(maxsize=None)
+def kubeModelType(klass):
+    """Returns a (kind, detail) tuple describing a kubernetes client openapi type string, where kind
+    is one of "list" / "dict" (detail is the type of the values), "datetime", "date", "model"
+    (detail is a tuple of (attribute, json key, type) of each of the model's attributes), or
+    "primitive" (str, int, bool, object, etc., which are left as is)"""
+    if klass.startswith("list["):
+        return "list", klass[5:-1]
+    elif klass.startswith("dict("):
+        return "dict", klass[5:-1].split(", ", 1)[1]
+    elif klass in ["datetime", "date"]:
+        return klass, None
+    import kubernetes
+
+    model = getattr(kubernetes.client.models, klass, None)
+    if model is None:
+        return "primitive", None
+    return "model", tuple(
+        (attr, model.attribute_map[attr], t) for attr, t in model.openapi_types.items()
+    )
+
+
+def kubeModelDict(data, klass):
+    """Converts decoded kubernetes json (see KubeCommon.decodeResponse) into the same dict that the
+    kubernetes client's deserialization into klass (for instance "V1NamespaceList") followed by
+    to_dict() would return: snake_case keys, every model attribute present (None if not set), and
+    timestamps as datetimes, but without constructing (and validating) any model objects"""
+    if data is None:
+        return None
+    kind, detail = kubeModelType(klass)
+    if kind == "model":
+        return {attr: kubeModelDict(data.get(key), t) for attr, key, t in detail}
+    elif kind == "list":
+        return [kubeModelDict(i, detail) for i in data]
+    elif kind == "dict":
+        return {k: kubeModelDict(v, detail) for k, v in data.items()}
+    elif kind == "datetime":
+        try:
+            return datetime.fromisoformat(data.replace("Z", "+00:00"))
+        except ValueError:
+            from dateutil.parser import parse
+
+            return parse(data)
+    elif kind == "date":
+        return date.fromisoformat(data)
+    return data
+
+
+def jsonLoads(data):
+    """Decodes a json document (str or bytes) with orjson if it's installed, otherwise with the
+    standard library json module. Invalid documents raise a ValueError in either case.
+    Decoding a large document allocates millions of containers, which would otherwise trigger
+    many (pointless, since decoded json can't contain reference cycles) garbage collections, so
+    the garbage collector is paused while decoding."""
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    finally:
+        if gcEnabled:
+            gc.enable()
+
+
+def jsonDumps(obj, default=None, compact=False):
+    """Encodes obj as a json str. By default this is exactly json.dumps(obj, default=default), as
+    it's what the SDK classes print, and the printed output shouldn't change depending on which
+    packages are installed. With compact=True, orjson is used if it's installed, whose output
+    doesn't contain whitespace between items, doesn't escape non-ASCII characters, and may format
+    floats differently. Objects which orjson can't encode (such as integers wider than 64 bits)
+    fall back to the json module, and datetimes are passed to default (like the json module)
+    rather than encoded natively."""
+    if compact and orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            ).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default)
+
+
+class ItemWriter:
+    """Writes items to stdout as they become available, rather than formatting a complete
+    collection at the end, in one of the STREAM_OUTPUTS formats:
+     - ndjson: a json document per line
+     - yaml-stream: a yaml document (starting with '---') per item
+     - table-stream: a fixed width table, whose column widths are set by the first batch of
+       items (up to STREAM_TABLE_MAX_WIDTH characters), so it can be written without knowing
+       every row up front. Longer values of later items are not truncated."""
+
+    def __init__(self, output, tabHeader=None, tabKeys=None, quiet=False):
+        self.output = output
+        self.tabHeader = tabHeader or []
+        self.getters = [compilePath(k) for k in tabKeys or []]
+        self.quiet = quiet
+        self.widths = None
+
+    def row(self, item):
+        """Returns the table cells of item, in the same manner as basicTable"""
+        cells = []
+        for getter in self.getters:
+            cell = getter(item, [])
+            if type(cell) is list:
+                cell = ", ".join(cell)
+            cells.append("" if cell is None else " ".join(str(cell).split()))
+        return cells
+
+    def formatRow(self, cells):
+        return "  ".join(c.ljust(w) for c, w in zip(cells, self.widths)).rstrip() + "\n"
+
+    def write(self, items):
+        """Writes a batch of items (for instance a page of a collection), then flushes stdout"""
+        if self.quiet:
+            return
+        lines = []
+        if self.output == "ndjson":
+            lines = [jsonDumps(item, default=str, compact=True) + "\n" for item in items]
+        elif self.output == "yaml-stream":
+            lines = [yaml.dump(item, explicit_start=True) for item in items]
+        elif self.output == "table-stream":
+            rows = [self.row(item) for item in items]
+            if self.widths is None and rows:
+                self.widths = [
+                    min(max([len(h)] + [len(r[c]) for r in rows]), STREAM_TABLE_MAX_WIDTH)
+                    for c, h in enumerate(self.tabHeader)
+                ]
+                lines.append(self.formatRow(self.tabHeader))
+                lines.append(self.formatRow(["-" * w for w in self.widths]))
+            lines.extend(self.formatRow(r) for r in rows)
+        try:
+            sys.stdout.write("".join(lines))
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader (for instance '| head') has exited, so stop fetching, and point stdout at
+            # devnull so the interpreter doesn't raise again when flushing it at exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            raise SystemExit(1)
+
+    def close(self):
+        """Writes the table header if no items were written"""
+        if self.output == "table-stream" and self.widths is None and not self.quiet:
+            self.widths = [len(h) for h in self.tabHeader]
+            sys.stdout.write(self.formatRow(self.tabHeader))
+            sys.stdout.flush()
+
+
 class BaseCommon:
     def __init__(self):
         pass
@@ -112,52 +947,27 @@ class BaseCommon:
             sys.stderr.write(f"{RED}{ret}{ENDC}")
 
     def recursiveGet(self, k, item, conCatList=None):
-        """Recursion function which is just a wrapper around dict.get(key), to handle cases
-        where there's a dict or list within a dict:
-         - '.' in the key name ('metadata.creationTimestamp') is used to identify a dict
-         - '[]' in the key name ('spec.includedNamespaces[]') is used to identify a list
-         - '*' as a key represents a wildcard (returns first entry)
-         - 'KEYS' represents returning the keys rather than the vaules."""
-        if len(k.split(".")) > 1 and k.split(".")[0] == "":
-            return self.recursiveGet(k.split(".", 1)[1], item, conCatList)
-        elif (len(k.split(".")) > 1 and len(k.split("[]")) == 1) or (
-            len(k.split(".")[0]) < len(k.split("[]")[0])
-        ):
-            if k.split(".")[0] == "*":
-                return self.recursiveGet(k.split(".", 1)[1], item[next(iter(item))], conCatList)
-            elif k.split(".")[0] == "KEYS":
-                return self.recursiveGet(
-                    k.split(".", 1)[1], item[k.split(".")[0]].keys(), conCatList
-                )
-            try:
-                return self.recursiveGet(k.split(".", 1)[1], item[k.split(".")[0]], conCatList)
-            except KeyError:
-                return "None"
-        elif (len(k.split("[]")) > 1 and len(k.split(".")) == 1) or (
-            len(k.split("[]")[0]) < len(k.split(".")[0])
-        ):
-            if conCatList is None:
-                conCatList = []
-            for i in item[k.split("[]")[0]]:
-                if add := self.recursiveGet(k.split("[]", 1)[1], i, []):
-                    conCatList.append(add)
-            return ", ".join(conCatList)
-        if k == "KEYS":
-            return list(item.keys())
-        elif k == "*":
-            return item[next(iter(item))]
-        elif isinstance(item, dict) and isinstance(item.get(k), dict):
-            return str(item.get(k))
-        elif isinstance(item, dict):
-            return item.get(k)
-        return ""
+        """Wrapper around dict.get(key), to handle cases where there's a dict or list within a
+        dict (see compilePath() for the syntax of k). For repeated lookups of the same key, call
+        compilePath(k) once and then call the returned function with each item."""
+        return compilePath(k)(item, conCatList)
+
+    def filterItems(self, data, *predicates):
+        """Returns a shallow copy of data (a dict with an "items" list) containing only the items
+        for which every predicate(item) returns True. The result is built in a single pass, and
+        neither data nor its items are copied or modified."""
+        return {
+            **data,
+            "items": [i for i in data.get("items") or [] if all(p(i) for p in predicates)],
+        }
 
     def basicTable(self, tabHeader, tabKeys, dataDict, tablefmt="grid"):
         """Function to create a basic tabulate table for terminal printing"""
         tabData = []
+        getters = [compilePath(k) for k in tabKeys]
         for item in dataDict["items"]:
             # Generate a table row based on the keys list
-            row = [self.recursiveGet(k, item, []) for k in tabKeys]
+            row = [getter(item, []) for getter in getters]
             # Handle cases where table row has a nested list
             for c, r in enumerate(row):
                 if type(r) is list:
@@ -174,47 +984,156 @@ class SDKCommon(BaseCommon):
         self.conf = getConfig().main() if config is None else config
         self.session = self.conf.get("session")
         self.base = self.conf.get("base")
+        self.maxWorkers = self.conf.get("max_workers", DEFAULT_MAX_WORKERS)
+        self.maxRetries = self.conf.get("max_retries", DEFAULT_MAX_RETRIES)
+        self.retryBackoff = self.conf.get("retry_backoff", DEFAULT_RETRY_BACKOFF)
+        self.retryMaxBackoff = self.conf.get("retry_max_backoff", DEFAULT_RETRY_MAX_BACKOFF)
+        self.diagnoseErrors = self.conf.get("diagnose_errors", False)
+        self.timeout = self.conf.get("timeout", (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT))
+        # Configs built by hand (rather than via getConfig) still get a shared context and cache
+        self.context = self.conf.setdefault("context", ResourceContext())
+        self.responseCache = self.conf.setdefault("response_cache", ResponseCache())
         self.headers = {}
 
+    def fanOut(self, func, items):
+        """Call func(item) for every item in items, with at most self.maxWorkers calls in flight
+        at once. The results are returned as a list in the same order as items, so callers can
+        zip() them back together and report per-item errors exactly as a serial loop would.
+        Verbose mode runs serially so the request/response output isn't interleaved."""
+        return list(self.iterFanOut(func, items))
+
+    def iterFanOut(self, func, items):
+        """Generator equivalent of fanOut, which yields each result (in the same order as items)
+        as soon as it and every result before it are available"""
+        items = list(items)
+        workers = 1 if getattr(self, "verbose", False) else min(self.maxWorkers, len(items))
+        if workers <= 1:
+            for item in items:
+                yield func(item)
+            return
+        # Each call runs in a copy of the caller's context variables, so state kept in them (like
+        # the toolkit's per-command captured output) carries over to the worker threads
+        contexts = [contextvars.copy_context() for _ in items]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(lambda context, item: context.run(func, item), contexts, items)
+
+    def streamPages(self, pages, cook, tabHeader, tabKeys):
+        """Writes the items of every page yielded by pages (an iterPages generator) to stdout in
+        the self.output STREAM_OUTPUTS format as soon as each page is fetched, after passing the
+        page through cook(page) to apply any filters. Returns True, or False if a call failed."""
+        writer = ItemWriter(self.output, tabHeader, tabKeys, quiet=self.quiet)
+        for ret, page in pages:
+            if page is None:
+                if not self.quiet:
+                    self.printError(ret)
+                return False
+            writer.write(cook(page)["items"])
+        writer.close()
+        return True
+
     def apicall(self, method, url, data, headers, params, quiet=False, verbose=False):
         """Make a call using the requests module.
-        method can be get, put, post, patch, or delete"""
+        method can be get, put, post, patch, or delete
+
+        Idempotent methods (get, put, delete) are retried up to self.maxRetries times on
+        connection errors and 429/5xx responses, and any method is retried on a 429 (as the
+        request was not processed). The delay before each retry grows exponentially from
+        self.retryBackoff up to self.retryMaxBackoff with full jitter, unless the response
+        contains a Retry-After header, which is honored (up to self.retryMaxBackoff).
+
+        GET responses are cached in self.responseCache (see ResponseCache), and any successful
+        call of another method invalidates the cached responses it could affect."""
         try:
             r = getattr(self.session, method)
         except AttributeError as e:
             raise SystemExit(e)
-        try:
-            if verbose:
-                self.printVerbose(url, method, headers, data, params, self.session)
-            ret = r(url, json=data, headers=headers, params=params)
-        except requests.exceptions.RequestException as e:
-            raise SystemExit(e)
+        if verbose:
+            self.printVerbose(url, method, headers, data, params, self.session)
+        cacheKey, cached = None, None
+        if method == "get" and self.responseCache.maxBytes > 0 and url.startswith(self.base):
+            cacheKey = self.responseCache.key(url[len(self.base) :], params, headers)
+            cached, fresh = self.responseCache.get(cacheKey)
+            if fresh:
+                if verbose:
+                    print(f"{GREEN}API HTTP Status Code: {cached.status_code} (cached){ENDC}")
+                if profiler.active():
+                    profiler.request(
+                        "astra",
+                        method,
+                        self.profilePath(url),
+                        cached.status_code,
+                        len(cached.content or b""),
+                        time.perf_counter(),
+                        cached=True,
+                    )
+                return cached
+            if cached is not None:
+                headers = {**headers, **self.responseCache.conditionalHeaders(cached)}
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                ret = r(url, json=data, headers=headers, params=params, timeout=self.timeout)
+            except requests.exceptions.RequestException as e:
+                if profiler.active():
+                    profiler.request("astra", method, self.profilePath(url), None, None, start)
+                if (
+                    method in IDEMPOTENT_METHODS
+                    and isinstance(
+                        e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+                    )
+                    and attempt < self.maxRetries
+                ):
+                    self.retryWait(attempt, None, e, verbose)
+                    attempt += 1
+                    continue
+                raise SystemExit(e)
+            if profiler.active():
+                profiler.request(
+                    "astra",
+                    method,
+                    self.profilePath(url),
+                    ret.status_code,
+                    len(ret.content or b""),
+                    start,
+                )
+            retryable = ret.status_code == 429 or (
+                ret.status_code >= 500 and method in IDEMPOTENT_METHODS
+            )
+            if retryable and attempt < self.maxRetries:
+                self.retryWait(attempt, ret.headers.get("Retry-After"), ret, verbose)
+                attempt += 1
+                continue
+            break
+        if cacheKey is not None:
+            if ret.status_code == 304 and cached is not None:
+                self.responseCache.touch(cacheKey)
+                ret = cached
+            elif ret.ok:
+                self.responseCache.put(cacheKey, ret)
+        elif ret.ok and method != "get" and url.startswith(self.base):
+            self.context.invalidateEndpoint(url[len(self.base) :])
+            self.responseCache.invalidateEndpoint(url[len(self.base) :])
         if not ret.ok:
+            isCloudsGet = url.split("/")[-1] == "clouds" and method == "get"
             # GET clouds has more response information than other calls, so if
-            # there's an error make a second API call to improve error messaging
-            if (
-                url.split("/")[-1] != "clouds"
-                or (url.split("/")[-1] == "clouds" and method != "get")
-                or (url.split("/")[-1] == "clouds" and quiet is True)
-            ):
-                self.apicall(
-                    "get",
-                    self.base + "topology/v1/clouds",
-                    {},
-                    self.headers,
-                    {},
-                    quiet=False,
-                    verbose=False,
-                )
-            elif ret.status_code >= 400 and ret.status_code < 500:
-                if "x-pcloud-accountid" in ret.text:
-                    print(f"API call to Astra Control failed: {RED}check uid in config.json{ENDC}")
-                elif ret.status_code == 401:
-                    print(
-                        "API call to Astra Control failed: "
-                        f"{RED}check Authorization in config.json{ENDC}"
+            # there's an error (and it's enabled) make a second API call to improve error
+            # messaging. This is opt-in, as it doubles the load on an API which may be struggling.
+            if not isCloudsGet or quiet is True:
+                if self.diagnoseErrors:
+                    self.apicall(
+                        "get",
+                        self.base + "topology/v1/clouds",
+                        {},
+                        self.headers,
+                        {},
+                        quiet=False,
+                        verbose=False,
                     )
                 else:
+                    self.printAuthError(ret)
+            elif ret.status_code >= 400 and ret.status_code < 500:
+                if not self.printAuthError(ret):
                     print(
                         "API call to Astra Control failed: "
                         f"{RED}{ret.status_code} - {ret.reason}{ENDC}"
@@ -230,25 +1149,138 @@ class SDKCommon(BaseCommon):
             print(f"{GREEN}API HTTP Status Code: {ret.status_code}{ENDC}")
         return ret
 
+    def iterPages(self, url, headers, params=None, quiet=False, verbose=False):
+        """Generator which GETs a collection endpoint one page (of DEFAULT_PAGE_SIZE items) at a
+        time, yielding a (ret, page) tuple per page, where page is the decoded response. The next
+        page is requested with the continue token of the previous page if present, otherwise by
+        skipping the items seen so far, until a page comes back short. If a call fails, (ret,
+        None) is yielded and the generator stops. If params already contains a limit, only that
+        single page is requested."""
+        params = dict(params or {})
+        paginate = "limit" not in params
+        pageParams = {**params, "limit": DEFAULT_PAGE_SIZE} if paginate else params
+        skip, firstID = int(params.get("skip") or 0), None
+        while True:
+            ret = self.apicall("get", url, {}, headers, pageParams, quiet=quiet, verbose=verbose)
+            page = self.jsonifyResults(ret) if ret.ok else None
+            if page is None:
+                yield ret, None
+                return
+            items = page.get("items") or []
+            # If the endpoint ignores skip (returning the same page again), fall back to a single
+            # unpaginated call for the remaining items
+            if firstID is not None and items and items[0].get("id") == firstID:
+                ret = self.apicall("get", url, {}, headers, params, quiet=quiet, verbose=verbose)
+                page = self.jsonifyResults(ret) if ret.ok else None
+                if page is not None:
+                    page["items"] = (page.get("items") or [])[skip:]
+                yield ret, page
+                return
+            yield ret, page
+            token = (page.get("metadata") or {}).get("continue")
+            if not paginate or not items:
+                return
+            elif token:
+                pageParams = {**params, "limit": DEFAULT_PAGE_SIZE, "continue": token}
+            elif len(items) == DEFAULT_PAGE_SIZE:
+                skip += len(items)
+                pageParams = {**params, "limit": DEFAULT_PAGE_SIZE, "skip": skip}
+            else:
+                return
+            firstID = items[0].get("id")
+
+    def pageItems(self, url, headers, params=None, quiet=False, verbose=False):
+        """Generator which lazily yields every item of a collection endpoint, only holding a
+        single page in memory at a time (see iterPages). Iteration stops if a call fails; use
+        iterPages directly to handle the failed response."""
+        for ret, page in self.iterPages(url, headers, params, quiet=quiet, verbose=verbose):
+            if page is None:
+                return
+            yield from page.get("items") or []
+
+    def getPages(self, url, headers, params=None, quiet=False, verbose=False):
+        """Returns a (ret, collection) tuple, where collection is the last page of a collection
+        endpoint with the items of every page (see iterPages), or None if ret failed"""
+        collection, items = None, []
+        for ret, page in self.iterPages(url, headers, params, quiet=quiet, verbose=verbose):
+            if page is None:
+                return ret, None
+            items.extend(page.get("items") or [])
+            collection = page
+        collection["items"] = items
+        return ret, collection
+
+    def printAuthError(self, ret):
+        """Prints a hint if a failed response was due to the uid or Authorization in the config
+        file, returning whether or not a hint was printed"""
+        if ret.status_code >= 400 and ret.status_code < 500 and "x-pcloud-accountid" in ret.text:
+            print(f"API call to Astra Control failed: {RED}check uid in config.json{ENDC}")
+        elif ret.status_code == 401:
+            print(
+                f"API call to Astra Control failed: {RED}check Authorization in config.json{ENDC}"
+            )
+        else:
+            return False
+        return True
+
+    def retryWait(self, attempt, retryAfter, reason, verbose):
+        """Sleeps prior to retrying a failed API call, either for the Retry-After header value
+        (seconds or an HTTP date) or a jittered exponential backoff, capped at retryMaxBackoff"""
+        delay = None
+        if retryAfter:
+            try:
+                delay = float(retryAfter)
+            except ValueError:
+                try:
+                    delay = (
+                        parsedate_to_datetime(retryAfter) - datetime.now(timezone.utc)
+                    ).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+        if delay is None:
+            delay = random.uniform(0, self.retryBackoff * 2**attempt)
+        delay = min(max(delay, 0), self.retryMaxBackoff)
+        if verbose:
+            if hasattr(reason, "status_code"):
+                reason = f"{reason.status_code} - {reason.reason}"
+            print(
+                f"{GREEN}API call failed ({reason}), retry {attempt + 1} of {self.maxRetries} "
+                f"in {delay:.2f}s{ENDC}"
+            )
+        time.sleep(delay)
+
     def downloadFile(self, url, data, headers, params, filetype="tgz", quiet=False, verbose=False):
         """Download a file using the requests module"""
+        start, status, nbytes = time.perf_counter(), None, None
         try:
             if verbose:
                 self.printVerbose(url, "get", headers, data, params, self.session)
             filename = f"{url.split('/')[-1]}.{filetype}"
-            with self.session.get(url, json=data, headers=headers, params=params, stream=True) as s:
+            with self.session.get(
+                url, json=data, headers=headers, params=params, stream=True, timeout=self.timeout
+            ) as s:
+                status = s.status_code
                 if s.ok:
                     with open(filename, "wb") as f:
                         shutil.copyfileobj(s.raw, f)
+                        nbytes = f.tell()
                 else:
                     filename = False
+                    nbytes = len(s.content or b"")
             return s, filename
         except requests.exceptions.RequestException as e:
             raise SystemExit(e)
+        finally:
+            if profiler.active():
+                profiler.request("astra", "get", self.profilePath(url), status, nbytes, start)
+
+    def profilePath(self, url):
+        """Returns url relative to self.base (if it's an Astra Control URL), for the profiler"""
+        return url[len(self.base) :] if url.startswith(self.base) else url
 
     def jsonifyResults(self, requestsObject):
         try:
-            results = requestsObject.json()
+            results = jsonLoads(requestsObject.content)
         except ValueError as e:
             print(f"response contained invalid JSON: {e}")
             results = None
@@ -267,12 +1299,27 @@ class SDKCommon(BaseCommon):
 
 class KubeCommon(BaseCommon):
     def __init__(self, config_context=None, client_configuration=None, silently_fail=False):
+        # kubernetes takes longer to import than the rest of the toolkit combined, so only import
+        # it when a kubernetes class is actually used
+        import kubernetes
+
         super().__init__()
-        if (
-            isinstance(client_configuration, kubernetes.client.configuration.Configuration)
-            and client_configuration.verify_ssl is False
-        ):
-            disable_warnings()
+        if isinstance(client_configuration, kubernetes.client.configuration.Configuration):
+            if client_configuration.verify_ssl is False:
+                disable_warnings()
+            key = (config_context, client_configuration.verify_ssl, client_configuration.debug)
+        else:
+            key = (config_context, None, None)
+        self.api_client = kubeClients.get(
+            key,
+            config_context,
+            lambda: self.loadApiClient(config_context, client_configuration, silently_fail),
+        )
+
+    def loadApiClient(self, config_context, client_configuration, silently_fail):
+        """Loads the kubeconfig (or incluster config) and returns a new ApiClient, or None if
+        silently_fail and the config could not be loaded"""
+        import kubernetes
 
         # Setup the config_file and context based on the config_context input
         config_file, context = None, None
@@ -304,13 +1351,17 @@ class KubeCommon(BaseCommon):
             kubernetes.config.load_kube_config(
                 config_file=config_file, context=context, client_configuration=client_configuration
             )
-            self.api_client = kubernetes.client.ApiClient(configuration=client_configuration)
+            return profiler.instrumentApiClient(
+                kubernetes.client.ApiClient(configuration=client_configuration)
+            )
 
         # If that fails, then try an incluster config
         except kubernetes.config.config_exception.ConfigException as err:
             try:
-                self.api_client = kubernetes.client.ApiClient(
-                    configuration=kubernetes.config.load_incluster_config()
+                return profiler.instrumentApiClient(
+                    kubernetes.client.ApiClient(
+                        configuration=kubernetes.config.load_incluster_config()
+                    )
                 )
             except kubernetes.config.config_exception.ConfigException:
                 if not silently_fail:
@@ -321,7 +1372,7 @@ class KubeCommon(BaseCommon):
                         "network connectivity to the cluster.\n"
                     )
                     raise SystemExit()
-                self.api_client = None
+                return None
 
         # Catch other errors (like malformed files), print error message, and exit
         except Exception as err:
@@ -331,7 +1382,64 @@ class KubeCommon(BaseCommon):
                 )
                 self.printError(f"{err}\n")
                 raise SystemExit()
-            self.api_client = None
+            return None
+
+    def serverSelectors(self, filters):
+        """Splits a list of getResources-style filters into the field_selector / label_selector
+        keyword arguments of a kubernetes list call (for exact matches on metadata.name or on a
+        metadata.labels key), and the remaining filters which must be applied client-side"""
+        fields, labels, remaining = [], [], []
+        for f in filters or []:
+            key, val = f.get("keyFilter"), f.get("valFilter")
+            if not key or not val or f.get("inMatch") or not isinstance(val, str):
+                remaining.append(f)
+            elif key == "metadata.name" and KUBE_NAME.match(val):
+                fields.append(f"metadata.name={val}")
+            elif (
+                key.startswith("metadata.labels.")
+                and KUBE_LABEL_KEY.match(key[16:])
+                and KUBE_LABEL_VALUE.match(val)
+            ):
+                labels.append(f"{key[16:]}={val}")
+            else:
+                remaining.append(f)
+        selectors = {}
+        if fields:
+            selectors["field_selector"] = ",".join(fields)
+        if labels:
+            selectors["label_selector"] = ",".join(labels)
+        return selectors, remaining
+
+    def iterChunks(self, listFunc, *args, limit=DEFAULT_KUBE_LIST_LIMIT, **kwargs):
+        """Generator which calls a kubernetes custom object list function in chunks of limit items
+        (following the continue token of each chunk), and yields each chunk's list response.
+        Responses are decoded with jsonLoads rather than by the kubernetes client."""
+        kwargs["_preload_content"] = False
+        resp = self.decodeResponse(listFunc(*args, limit=limit, **kwargs))
+        yield resp
+        while resp.get("metadata", {}).get("continue"):
+            resp = self.decodeResponse(
+                listFunc(*args, limit=limit, _continue=resp["metadata"]["continue"], **kwargs)
+            )
+            yield resp
+
+    def decodeResponse(self, resp):
+        """Decodes the body of a kubernetes client call made with _preload_content=False, which
+        returns the raw urllib3 response rather than deserializing it"""
+        try:
+            return jsonLoads(resp.data)
+        finally:
+            resp.release_conn()
+
+    def listChunks(self, listFunc, *args, limit=DEFAULT_KUBE_LIST_LIMIT, **kwargs):
+        """Calls a kubernetes custom object list function in chunks of limit items, and returns a
+        single list response of every item, so large collections aren't transferred in one
+        enormous response"""
+        items = []
+        for resp in self.iterChunks(listFunc, *args, limit=limit, **kwargs):
+            items.extend(resp["items"])
+        resp["items"] = items
+        return resp
 
     def notInstalled(self, path):
         server = self.api_client.configuration.host.split("//")[-1].split(":")[0].split("/")[0]
@@ -16,11 +16,9 @@
 """
 
 import yaml
-import json
-import copy
 from tabulate import tabulate
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getCredentials(SDKCommon):
@@ -40,32 +38,22 @@ class getCredentials(SDKCommon):
         endpoint = "core/v1/credentials"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, creds = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            creds = super().jsonifyResults(ret)
-            credsCooked = copy.deepcopy(creds)
-            if kubeconfigOnly:
-                for counter, cred in enumerate(creds.get("items")):
-                    delCred = True
-                    if cred["metadata"].get("labels"):
-                        for label in cred["metadata"]["labels"]:
-                            if label["name"] == "astra.netapp.io/labels/read-only/credType":
-                                if label["value"] == "kubeconfig":
-                                    delCred = False
-                    if delCred:
-                        credsCooked["items"].remove(creds["items"][counter])
+        if ret.ok and creds is not None:
+            credsCooked = self.filterItems(
+                creds,
+                lambda cred: not kubeconfigOnly
+                or any(
+                    label["name"] == "astra.netapp.io/labels/read-only/credType"
+                    and label["value"] == "kubeconfig"
+                    for label in cred["metadata"].get("labels") or []
+                ),
+            )
             if self.output == "json":
                 dataReturn = credsCooked
             elif self.output == "yaml":
@@ -96,7 +84,7 @@ class getCredentials(SDKCommon):
                     )
                 dataReturn = tabulate(tabData, tabHeader, tablefmt="grid")
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -164,7 +152,7 @@ class createCredential(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -249,7 +237,7 @@ class updateCredential(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -16,9 +16,8 @@
 """
 
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getEntitlements(SDKCommon):
@@ -41,21 +40,13 @@ class getEntitlements(SDKCommon):
         endpoint = "core/v1/entitlements"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, entitlements = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            entitlements = super().jsonifyResults(ret)
+        if ret.ok and entitlements is not None:
             if self.output == "json":
                 dataReturn = entitlements
             elif self.output == "yaml":
@@ -73,7 +64,7 @@ class getEntitlements(SDKCommon):
                     entitlements,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -15,11 +15,9 @@
    limitations under the License.
 """
 
-import copy
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 YELLOW = "\033[33m"
@@ -45,21 +43,13 @@ class getGroups(SDKCommon):
         endpoint = "core/v1/groups"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, groups = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            groups = super().jsonifyResults(ret)
+        if ret.ok and groups is not None:
 
             if self.output == "json":
                 dataReturn = groups
@@ -72,7 +62,7 @@ class getGroups(SDKCommon):
                     groups,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -123,7 +113,7 @@ class createGroup(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -226,12 +216,11 @@ class getLdapGroups(SDKCommon):
         if ret.ok:
             groups = super().jsonifyResults(ret)
             if matchType == "eq":
-                groupsCopy = copy.deepcopy(groups)
-                for counter, g in enumerate(groupsCopy.get("items")):
-                    if cnFilter and cnFilter != g["cn"]:
-                        groups["items"].remove(groupsCopy["items"][counter])
-                    elif dnFilter and dnFilter != g["dn"]:
-                        groups["items"].remove(groupsCopy["items"][counter])
+                groups = self.filterItems(
+                    groups,
+                    lambda g: not cnFilter or cnFilter == g["cn"],
+                    lambda g: not dnFilter or dnFilter == g["dn"],
+                )
 
             if self.output == "json":
                 dataReturn = groups
@@ -246,7 +235,7 @@ class getLdapGroups(SDKCommon):
                     + contStr
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
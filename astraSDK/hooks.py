@@ -16,9 +16,8 @@
 """
 
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 from .apps import getApps
 
 
@@ -36,7 +35,9 @@ class getHooks(SDKCommon):
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.apps = getApps(quiet=True, verbose=verbose, config=config).main()
+        self.apps = self.context.get(
+            "apps", lambda: getApps(quiet=True, verbose=verbose, config=self.conf).main()
+        )
 
     def main(self, appFilter=None):
         if self.apps is False:
@@ -46,26 +47,25 @@ class getHooks(SDKCommon):
         hooks = {}
         hooks["items"] = []
 
-        for app in self.apps["items"]:
-            if appFilter:
-                if app["name"] != appFilter and app["id"] != appFilter:
-                    continue
-            endpoint = f"k8s/v1/apps/{app['id']}/executionHooks"
-            url = self.base + endpoint
-
-            data = {}
-            params = {}
-
-            ret = super().apicall(
+        apps = [
+            app
+            for app in self.apps["items"]
+            if not appFilter or appFilter in (app["name"], app["id"])
+        ]
+        rets = self.fanOut(
+            lambda app: self.apicall(
                 "get",
-                url,
-                data,
+                self.base + f"k8s/v1/apps/{app['id']}/executionHooks",
+                {},
                 self.headers,
-                params,
+                {},
                 quiet=self.quiet,
                 verbose=self.verbose,
-            )
+            ),
+            apps,
+        )
 
+        for app, ret in zip(apps, rets):
             if ret.ok:
                 results = super().jsonifyResults(ret)
                 if results is None:
@@ -75,7 +75,7 @@ class getHooks(SDKCommon):
                 if not self.quiet and self.verbose:
                     print(f"Execution hooks for {app['id']}")
                     if self.output == "json":
-                        print(json.dumps(results))
+                        print(jsonDumps(results))
                     elif self.output == "yaml":
                         print(yaml.dump(results))
                     elif self.output == "table":
@@ -103,7 +103,7 @@ class getHooks(SDKCommon):
             )
 
         if not self.quiet:
-            print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+            print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
         return dataReturn
 
 
@@ -167,7 +167,7 @@ class createHook(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
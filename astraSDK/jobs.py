@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import threading
+import time
+import urllib3
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from .common import (
+    DEFAULT_JOB_MAX_GETS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_WAIT_MAX_INTERVAL,
+    KubeCommon,
+    SDKCommon,
+)
+
+
+class JobDriver:
+    """A single driver thread which checks every pending job once per cycle, rather than a
+    polling loop per job. Jobs are registered with track(), which returns a
+    concurrent.futures.Future, so any number of jobs can be waited on (or given done callbacks)
+    with concurrent.futures.wait() / as_completed().
+
+    Each cycle the pending jobs are grouped by collection, and pollGroup(collection, ids) is
+    called once per collection. Subclasses implement pollGroup, which returns a dict of
+    id: resource (None if the resource doesn't exist), or False if the call failed, and
+    stateOf(resource). The driver thread is started when a job is tracked, and exits once there
+    are no pending jobs.
+
+    The delay between cycles starts at pollTimer and grows by half after every cycle in which no
+    job's state changed, up to maxPollTimer, and is reset whenever a state changes or a new job
+    is tracked."""
+
+    def initDriver(self, pollTimer, maxPollTimer, timeout):
+        self.pollTimer = pollTimer
+        self.maxPollTimer = max(pollTimer, maxPollTimer)
+        self.jobTimeout = timeout
+        self.jobs = []
+        self.thread = None
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+
+    def track(self, collection, id, states, failedStates, label, missingOk=False, onUpdate=None):
+        """Returns a Future whose result is the resource once its state is in states, or False
+        if its state is in failedStates, it couldn't be retrieved three consecutive times (or
+        doesn't exist, unless missingOk), or the tracker's timeout elapses first.
+        onUpdate(resource), if provided, is called after every check which doesn't finish the
+        job (useful for progress output)."""
+        future = Future()
+        job = {
+            "collection": collection,
+            "id": id,
+            "states": states,
+            "failedStates": failedStates,
+            "label": label,
+            "missingOk": missingOk,
+            "onUpdate": onUpdate,
+            "deadline": self.jobTimeout and time.monotonic() + self.jobTimeout,
+            "future": future,
+            "state": None,
+            "errors": 0,
+        }
+        with self.lock:
+            self.jobs.append(job)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.drive, daemon=True)
+                self.thread.start()
+        self.wakeup.set()
+        return future
+
+    def pending(self):
+        """Returns the number of jobs which haven't finished"""
+        with self.lock:
+            return sum(not job["future"].done() for job in self.jobs)
+
+    def pollGroups(self, groups):
+        """Returns the pollGroup() result of every (collection, ids) item of groups, serially"""
+        return [self.pollGroup(collection, ids) for collection, ids in groups]
+
+    def finish(self, job, result, error=None):
+        if error and not self.quiet:
+            self.printError(f"Error: {job['label']} {error}\n")
+        if not job["future"].done():
+            job["future"].set_result(result)
+
+    def drive(self):
+        try:
+            self.pollLoop()
+        except Exception as err:
+            # Rather than leaving every pending Future unresolved
+            with self.lock:
+                jobs, self.jobs, self.thread = self.jobs, [], None
+            for job in jobs:
+                if not job["future"].done():
+                    job["future"].set_exception(err)
+
+    def pollLoop(self):
+        interval = self.pollTimer
+        while True:
+            with self.lock:
+                # Finished (or cancelled) jobs are dropped, and the thread exits once none remain
+                self.jobs = [job for job in self.jobs if not job["future"].done()]
+                if not self.jobs:
+                    self.thread = None
+                    return
+                jobs = list(self.jobs)
+            self.wakeup.clear()
+
+            groups = {}
+            for job in jobs:
+                groups.setdefault(job["collection"], []).append(job)
+            results = self.pollGroups(
+                [(collection, [job["id"] for job in group]) for collection, group in groups.items()]
+            )
+
+            changed = False
+            for group, resources in zip(groups.values(), results):
+                for job in group:
+                    missing = resources and resources[job["id"]] is None
+                    if resources is False or (missing and not job["missingOk"]):
+                        job["errors"] += 1
+                        if job["errors"] >= 3:
+                            self.finish(job, False, "could not be retrieved")
+                        continue
+                    job["errors"] = 0
+                    resource = resources[job["id"]]
+                    state = resource and self.stateOf(resource)
+                    if state != job["state"]:
+                        job["state"], changed = state, True
+                    if state in job["states"]:
+                        self.finish(job, resource)
+                    elif state in job["failedStates"]:
+                        self.finish(job, False, f"is in a {state} state")
+                    elif job["deadline"] and time.monotonic() >= job["deadline"]:
+                        self.finish(job, False, f"timed out (state: {state})")
+                    elif job["onUpdate"]:
+                        job["onUpdate"](resource)
+
+            # Sleep until the next cycle, or until a new job is tracked
+            interval = self.pollTimer if changed else min(interval * 1.5, self.maxPollTimer)
+            if self.wakeup.wait(interval):
+                interval = self.pollTimer
+
+
+class JobTracker(JobDriver, SDKCommon):
+    """Track any number of long-running Astra Control operations (app clones / restores,
+    backups, and snapshots) with a single driver thread (see JobDriver). Every cycle, a collection
+    with a single pending job is checked with a GET of that job's resource, and a collection with
+    several pending jobs is checked with one GET of the whole collection (apps, or an app's
+    backups / snapshots), with the collections checked concurrently."""
+
+    def __init__(
+        self,
+        quiet=True,
+        verbose=False,
+        pollTimer=5,
+        maxPollTimer=DEFAULT_WAIT_MAX_INTERVAL,
+        timeout=None,
+        config=None,
+    ):
+        """quiet: Will there be CLI output or just return (datastructure)
+        verbose: Print all of the ReST call info: URL, Method, Headers, Request Body
+        pollTimer: the initial number of seconds between checks
+        maxPollTimer: the maximum number of seconds between checks
+        timeout: optionally fail jobs which haven't finished after this many seconds
+        config: optionally provide a pre-populated common.getConfig().main() object"""
+        self.quiet = quiet
+        self.verbose = verbose
+        super().__init__(config=config)
+        self.initDriver(pollTimer, maxPollTimer, timeout)
+
+    def trackApp(self, appID, states=None, failedStates=None, onUpdate=None):
+        """Track a cloned or restored app, which may not exist yet, until it's in one of states
+        (defaults to ["ready"]) or failedStates (defaults to ["failed"])"""
+        return self.track(
+            "k8s/v2/apps",
+            appID,
+            ["ready"] if states is None else states,
+            ["failed"] if failedStates is None else failedStates,
+            f"app {appID}",
+            missingOk=True,
+            onUpdate=onUpdate,
+        )
+
+    def trackBackup(self, appID, backupID, onUpdate=None):
+        """Track a backup (as returned by backups.takeBackup) of appID"""
+        return self.track(
+            f"k8s/v1/apps/{appID}/appBackups",
+            backupID,
+            ["completed"],
+            ["failed", "error"],
+            f"backup {backupID} of app {appID}",
+            onUpdate=onUpdate,
+        )
+
+    def trackSnapshot(self, appID, snapshotID, onUpdate=None):
+        """Track a snapshot (as returned by snapshots.takeSnap) of appID"""
+        return self.track(
+            f"k8s/v1/apps/{appID}/appSnaps",
+            snapshotID,
+            ["completed"],
+            ["failed", "error"],
+            f"snapshot {snapshotID} of app {appID}",
+            onUpdate=onUpdate,
+        )
+
+    def stateOf(self, resource):
+        return resource.get("state")
+
+    def pollGroups(self, groups):
+        return self.fanOut(lambda group: self.pollGroup(*group), groups)
+
+    def pollGroup(self, collection, ids):
+        try:
+            if len(ids) == 1:
+                ret = self.apicall(
+                    "get",
+                    self.base + f"{collection}/{ids[0]}",
+                    {},
+                    self.headers,
+                    {},
+                    quiet=True,
+                    verbose=self.verbose,
+                )
+                if ret.status_code == 404:
+                    return {ids[0]: None}
+                return ret.ok and {ids[0]: self.jsonifyResults(ret) or None}
+            ret, results = self.getPages(
+                self.base + collection, self.headers, quiet=True, verbose=self.verbose
+            )
+        # A connection error after every retry is counted like any other failed check
+        except SystemExit:
+            return False
+        if not ret.ok or results is None:
+            return False
+        resources = {r.get("id"): r for r in results["items"]}
+        return {id: resources.get(id) for id in ids}
+
+
+class KubeJobTracker(JobDriver, KubeCommon):
+    """Track any number of namespace scoped custom resources (backups, snapshots, restores, etc.)
+    until they reach a final status.state, with a single driver thread (see JobDriver). Every
+    cycle, a plural with up to maxGets pending jobs is checked with a GET of each job's resource
+    (concurrently), and a plural with more is checked with one list of the whole plural."""
+
+    def __init__(
+        self,
+        quiet=True,
+        verbose=False,
+        config_context=None,
+        skip_tls_verify=False,
+        pollTimer=5,
+        maxPollTimer=DEFAULT_WAIT_MAX_INTERVAL,
+        timeout=None,
+        maxGets=DEFAULT_JOB_MAX_GETS,
+    ):
+        """quiet: Will there be CLI output or just return (datastructure)
+        verbose: Print all of the rest call info: URL, Method, Headers, Request Body
+        config_context: the kubeconfig:context mapping to execute against
+                        None: use system defaults
+                        str "None:<context>": use default kubeconfig w/ specified context
+                        str "<config_file>:<context>": use specified file and context
+        skip_tls_verify: Whether to skip TLS/SSL verification
+        pollTimer: the initial number of seconds between checks
+        maxPollTimer: the maximum number of seconds between checks
+        timeout: optionally fail jobs which haven't finished after this many seconds
+        maxGets: the most pending jobs of a plural to check with a GET each, rather than a list"""
+        import kubernetes
+
+        self.quiet = quiet
+        self.verbose = verbose
+        self.skip_tls_verify = skip_tls_verify
+        self.maxGets = maxGets
+        self.conf = kubernetes.client.Configuration()
+        self.conf.debug = self.verbose
+        self.conf.verify_ssl = not self.skip_tls_verify
+        super().__init__(config_context=config_context, client_configuration=self.conf)
+        self.initDriver(pollTimer, maxPollTimer, timeout)
+
+    def trackResource(
+        self,
+        plural,
+        name,
+        states=None,
+        failedStates=None,
+        namespace="astra-connector",
+        version="v1",
+        group="astra.netapp.io",
+        onUpdate=None,
+    ):
+        """Track the 'name' custom resource until its status.state is in states (defaults to
+        ["Completed"]) or failedStates (defaults to ["Failed", "Error"])"""
+        return self.track(
+            (group, version, namespace, plural),
+            name,
+            ["Completed"] if states is None else states,
+            ["Failed", "Error"] if failedStates is None else failedStates,
+            f"{plural} {name}",
+            onUpdate=onUpdate,
+        )
+
+    def stateOf(self, resource):
+        return (resource.get("status") or {}).get("state")
+
+    def pollGroup(self, collection, names):
+        import kubernetes
+
+        api_instance = kubernetes.client.CustomObjectsApi(self.api_client)
+        if len(names) > self.maxGets:
+            try:
+                resp = self.listChunks(api_instance.list_namespaced_custom_object, *collection)
+            except (kubernetes.client.rest.ApiException, urllib3.exceptions.HTTPError):
+                return False
+            resources = {r["metadata"]["name"]: r for r in resp["items"]}
+            return {name: resources.get(name) for name in names}
+
+        def get(name):
+            try:
+                return api_instance.get_namespaced_custom_object(*collection, name)
+            except kubernetes.client.rest.ApiException as e:
+                if e.status == 404:
+                    return None
+                return False
+            except urllib3.exceptions.HTTPError:
+                return False
+
+        workers = 1 if self.verbose else min(len(names), DEFAULT_MAX_WORKERS)
+        if workers <= 1:
+            resources = [get(name) for name in names]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                resources = list(executor.map(get, names))
+        if any(r is False for r in resources):
+            return False
+        return dict(zip(names, resources))
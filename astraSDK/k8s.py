@@ -16,15 +16,23 @@
 """
 
 import base64
-import copy
 import json
 import kubernetes
 import sys
+import time
 import urllib3
 import yaml
 from datetime import datetime, timedelta, timezone
 
-from .common import KubeCommon, SDKCommon
+from .common import (
+    KubeCommon,
+    SDKCommon,
+    ItemWriter,
+    STREAM_OUTPUTS,
+    compilePath,
+    jsonDumps,
+    kubeModelDict,
+)
 
 
 class getResources(KubeCommon):
@@ -37,6 +45,9 @@ class getResources(KubeCommon):
         output: table: pretty print the data
                 json: (default) output in JSON
                 yaml: output in yaml
+                ndjson, yaml-stream, table-stream: write each resource as soon as its chunk is
+                                                   fetched (see common.ItemWriter), and return
+                                                   True rather than the resources
         verbose: Print all of the rest call info: URL, Method, Headers, Request Body
         config_context: the kubeconfig:context mapping to execute against
                         None: use system defaults
@@ -64,29 +75,44 @@ class getResources(KubeCommon):
         inMatch to True to use "in" comparison instead of "=="): [
           {"keyFilter": "keyname1", "valFilter": "value1", inMatch=True},
           {"keyFilter": "keyname2", "valFilter": "value2"}
-        ]"""
+        ]
+        Exact matches on "metadata.name" or "metadata.labels.<key>" are selected by the API server
+        (fieldSelector / labelSelector), all other filters are applied client-side."""
         api_instance = kubernetes.client.CustomObjectsApi(self.api_client)
         try:
             if self.verbose:
                 self.verbose_log = self.WriteVerbose()
                 sys.stdout = self.verbose_log
-            resp = api_instance.list_namespaced_custom_object(
-                group=group,
-                version=version,
-                namespace=namespace,
-                plural=plural,
+            # Filters which the API server can select on are pushed down to it, so only the
+            # matching resources are transferred
+            selectors, filters = self.serverSelectors(filters)
+
+            def match(f):
+                getter = compilePath(f["keyFilter"])
+                if f.get("inMatch"):
+                    return lambda r: f["valFilter"] in getter(r)
+                return lambda r: getter(r) == f["valFilter"]
+
+            predicates = [match(f) for f in filters or [] if f["keyFilter"] and f["valFilter"]]
+            listFunc = api_instance.list_namespaced_custom_object
+            listKwargs = dict(
+                group=group, version=version, namespace=namespace, plural=plural, **selectors
             )
-            if isinstance(filters, list):
-                for f in filters:
-                    filterCopy = copy.deepcopy(resp)
-                    if f["keyFilter"] and f["valFilter"]:
-                        for counter, r in enumerate(filterCopy.get("items")):
-                            if f.get("inMatch"):
-                                if f["valFilter"] not in self.recursiveGet(f["keyFilter"], r):
-                                    resp["items"].remove(filterCopy["items"][counter])
-                            else:
-                                if self.recursiveGet(f["keyFilter"], r) != f["valFilter"]:
-                                    resp["items"].remove(filterCopy["items"][counter])
+            # Verbose output is only printed once the call(s) complete, so it isn't streamed
+            if self.output in STREAM_OUTPUTS and not self.verbose:
+                writer = ItemWriter(
+                    self.output,
+                    self.getTableInfo(plural, headers=True),
+                    self.getTableInfo(plural),
+                    quiet=self.quiet,
+                )
+                for chunk in self.iterChunks(listFunc, **listKwargs):
+                    writer.write(self.filterItems(chunk, *predicates)["items"])
+                writer.close()
+                return True
+            resp = self.listChunks(listFunc, **listKwargs)
+            if predicates:
+                resp = self.filterItems(resp, *predicates)
             self.formatPrint(resp, plural)
             return resp
 
@@ -103,7 +129,14 @@ class getResources(KubeCommon):
             output = self.output
         if verbose is None:
             verbose = self.verbose
-        if output == "yaml":
+        if output in STREAM_OUTPUTS:
+            writer = ItemWriter(
+                output,
+                self.getTableInfo(plural, headers=True),
+                self.getTableInfo(plural),
+                quiet=quiet,
+            )
+        elif output == "yaml":
             resp = yaml.dump(resp).rstrip()
         elif output == "table":
             resp = self.basicTable(
@@ -116,8 +149,11 @@ class getResources(KubeCommon):
             print(f"verify_ssl: {self.api_client.configuration.verify_ssl}")
             sys.stdout = sys.__stdout__
             self.verbose_log.print()
-        if not quiet:
-            print(json.dumps(resp) if type(resp) is dict else resp)
+        if output in STREAM_OUTPUTS:
+            writer.write(resp["items"])
+            writer.close()
+        elif not quiet:
+            print(jsonDumps(resp) if type(resp) is dict else resp)
 
     def getTableInfo(self, plural, headers=False):
         if plural == "applications":
@@ -275,6 +311,115 @@ class getResources(KubeCommon):
             ]
 
 
+class watchResource(KubeCommon):
+    """Wait for a single namespace scoped custom resource to reach a desired state"""
+
+    def __init__(self, quiet=True, verbose=False, config_context=None, skip_tls_verify=False):
+        """quiet: Will there be CLI output or just return (datastructure)
+        verbose: Print all of the rest call info: URL, Method, Headers, Request Body
+        config_context: the kubeconfig:context mapping to execute against
+                        None: use system defaults
+                        str "None:<context>": use default kubeconfig w/ specified context
+                        str "<config_file>:<context>": use specified file and context
+        skip_tls_verify: Whether to skip TLS/SSL verification"""
+        self.quiet = quiet
+        self.verbose = verbose
+        self.skip_tls_verify = skip_tls_verify
+        self.conf = kubernetes.client.Configuration()
+        self.conf.debug = self.verbose
+        self.conf.verify_ssl = not self.skip_tls_verify
+        super().__init__(config_context=config_context, client_configuration=self.conf)
+
+    def main(
+        self,
+        plural,
+        name,
+        condition,
+        namespace="astra-connector",
+        version="v1",
+        group="astra.netapp.io",
+        timeout=None,
+        watchTimeout=60,
+        onUpdate=None,
+    ):
+        """Returns the 'name' resource as soon as condition(resource) is True, the last seen
+        version of the resource if timeout seconds elapse first, or False if the resource is not
+        found, is deleted, or an error occurs.
+
+        Rather than repeatedly listing every resource of the plural, the resource is read once
+        and then watched (with a metadata.name field selector) from its resourceVersion, so a
+        change is seen as soon as it happens. The watch is reopened from the last seen
+        resourceVersion every watchTimeout seconds (or if the connection drops), and the resource
+        is read again if that resourceVersion has expired. onUpdate(resource), if provided, is
+        called for every change which does not satisfy condition, and every time the watch is
+        reopened (useful for progress output)."""
+        api_instance = kubernetes.client.CustomObjectsApi(self.api_client)
+        args = (group, version, namespace, plural)
+        fieldSelector = f"metadata.name={name}"
+        deadline = timeout and time.monotonic() + timeout
+        resource, resourceVersion = None, None
+        try:
+            while True:
+                if resourceVersion is None:
+                    resp = api_instance.list_namespaced_custom_object(
+                        *args, field_selector=fieldSelector
+                    )
+                    if not resp["items"]:
+                        self.printError(f"{plural} {name} not found in namespace {namespace}\n")
+                        return False
+                    resource = resp["items"][0]
+                    resourceVersion = resp["metadata"]["resourceVersion"]
+                    if condition(resource):
+                        return resource
+                remaining = deadline - time.monotonic() if deadline else watchTimeout
+                if remaining <= 0:
+                    return resource
+                watch, opened = kubernetes.watch.Watch(), time.monotonic()
+                try:
+                    for event in watch.stream(
+                        api_instance.list_namespaced_custom_object,
+                        *args,
+                        field_selector=fieldSelector,
+                        resource_version=resourceVersion,
+                        allow_watch_bookmarks=True,
+                        timeout_seconds=max(1, int(min(watchTimeout, remaining))),
+                    ):
+                        resourceVersion = event["raw_object"]["metadata"]["resourceVersion"]
+                        if event["type"] == "BOOKMARK":
+                            continue
+                        elif event["type"] == "DELETED":
+                            watch.stop()
+                            self.printError(f"{plural} {name} was deleted\n")
+                            return False
+                        resource = event["raw_object"]
+                        if condition(resource):
+                            watch.stop()
+                            return resource
+                        if onUpdate:
+                            onUpdate(resource)
+                except kubernetes.client.rest.ApiException as e:
+                    # The resourceVersion is too old to resume from, so read the resource again
+                    if e.status != 410:
+                        raise
+                    resourceVersion = None
+                except (
+                    urllib3.exceptions.ProtocolError,
+                    urllib3.exceptions.ReadTimeoutError,
+                ):
+                    pass
+                # Don't reopen the watch in a tight loop if the connection keeps getting closed
+                if resourceVersion is not None and time.monotonic() - opened < 1:
+                    time.sleep(1)
+                if onUpdate:
+                    onUpdate(resource)
+
+        except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
+            if hasattr(e, "status") and e.status == 404 and e.reason == "Not Found":
+                self.notInstalled(f"/apis/{group}/{version}/namespaces/{namespace}/{plural}")
+            self.printKubeError(e)
+            return False
+
+
 class getClusterResources(KubeCommon):
     """Get all cluster scoped resources of a specific CRD"""
 
@@ -312,16 +457,19 @@ class getClusterResources(KubeCommon):
             if self.verbose:
                 verbose_log = self.WriteVerbose()
                 sys.stdout = verbose_log
-            resp = api_instance.list_cluster_custom_object(
+            selectors, filters = self.serverSelectors(
+                [{"keyFilter": keyFilter, "valFilter": valFilter}]
+            )
+            resp = self.listChunks(
+                api_instance.list_cluster_custom_object,
                 group=group,
                 version=version,
                 plural=plural,
+                **selectors,
             )
-            if keyFilter and valFilter:
-                filterCopy = copy.deepcopy(resp)
-                for counter, r in enumerate(filterCopy.get("items")):
-                    if self.recursiveGet(keyFilter, r) != valFilter:
-                        resp["items"].remove(filterCopy["items"][counter])
+            if keyFilter and valFilter and filters:
+                getter = compilePath(keyFilter)
+                resp = self.filterItems(resp, lambda r: getter(r) == valFilter)
 
             if self.output == "yaml":
                 resp = yaml.dump(resp)
@@ -331,7 +479,7 @@ class getClusterResources(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp) if type(resp) is dict else resp)
+                print(jsonDumps(resp) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -392,7 +540,7 @@ class createResource(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp) if type(resp) is dict else resp)
+                print(jsonDumps(resp) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -453,7 +601,7 @@ class destroyResource(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp) if type(resp) is dict else resp)
+                print(jsonDumps(resp) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -507,7 +655,7 @@ class updateClusterResource(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp) if type(resp) is dict else resp)
+                print(jsonDumps(resp) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -553,7 +701,7 @@ class getNamespaces(KubeCommon):
             if self.verbose:
                 verbose_log = self.WriteVerbose()
                 sys.stdout = verbose_log
-            resp = api_instance.list_namespace().to_dict()
+            resp = kubeModelDict(self.listChunks(api_instance.list_namespace), "V1NamespaceList")
             if type(systemNS) is not list:
                 systemNS = [
                     "astra-connector-operator",
@@ -563,22 +711,15 @@ class getNamespaces(KubeCommon):
                     "kube-system",
                     "trident",
                 ]
-            namespaces = copy.deepcopy(resp)
-            for counter, ns in enumerate(namespaces.get("items")):
-                if ns.get("metadata").get("name") in systemNS:
-                    resp["items"].remove(namespaces["items"][counter])
-                elif nameFilter and nameFilter not in ns["metadata"].get("name"):
-                    resp["items"].remove(namespaces["items"][counter])
-                elif (
-                    unassociated
-                    and "managed-by-astra-application" in ns["metadata"].get("annotations").keys()
-                ):
-                    resp["items"].remove(namespaces["items"][counter])
-                elif minuteFilter and (
-                    datetime.now(timezone.utc) - ns["metadata"].get("creation_timestamp")
-                    > timedelta(minutes=minuteFilter)
-                ):
-                    resp["items"].remove(namespaces["items"][counter])
+            cutoff = minuteFilter and datetime.now(timezone.utc) - timedelta(minutes=minuteFilter)
+            resp = self.filterItems(
+                resp,
+                lambda ns: ns["metadata"].get("name") not in systemNS,
+                lambda ns: not nameFilter or nameFilter in ns["metadata"].get("name"),
+                lambda ns: not unassociated
+                or "managed-by-astra-application" not in (ns["metadata"].get("annotations") or {}),
+                lambda ns: not cutoff or ns["metadata"].get("creation_timestamp") >= cutoff,
+            )
 
             if self.output == "yaml":
                 resp = yaml.dump(resp)
@@ -600,7 +741,7 @@ class getNamespaces(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp, default=str) if type(resp) is dict else resp)
+                print(jsonDumps(resp, default=str) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -639,7 +780,9 @@ class getSecrets(KubeCommon):
             if self.verbose:
                 verbose_log = self.WriteVerbose()
                 sys.stdout = verbose_log
-            resp = api_instance.list_namespaced_secret(namespace).to_dict()
+            resp = kubeModelDict(
+                self.listChunks(api_instance.list_namespaced_secret, namespace), "V1SecretList"
+            )
 
             if self.output == "yaml":
                 resp = yaml.dump(resp)
@@ -656,7 +799,7 @@ class getSecrets(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp, default=str) if type(resp) is dict else resp)
+                print(jsonDumps(resp, default=str) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -705,7 +848,7 @@ class destroySecret(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp) if type(resp) is dict else resp)
+                print(jsonDumps(resp) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -741,7 +884,9 @@ class getStorageClasses(KubeCommon):
             if self.verbose:
                 verbose_log = self.WriteVerbose()
                 sys.stdout = verbose_log
-            resp = api_instance.list_storage_class().to_dict()
+            resp = kubeModelDict(
+                self.listChunks(api_instance.list_storage_class), "V1StorageClassList"
+            )
 
             if self.output == "yaml":
                 resp = yaml.dump(resp)
@@ -751,7 +896,7 @@ class getStorageClasses(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp, default=str) if type(resp) is dict else resp)
+                print(jsonDumps(resp, default=str) if type(resp) is dict else resp)
             return resp
 
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
@@ -800,7 +945,7 @@ class createV1Secret(KubeCommon):
                 sys.stdout = sys.__stdout__
                 verbose_log.print()
             if not self.quiet:
-                print(json.dumps(resp, default=str) if type(resp) is dict else resp)
+                print(jsonDumps(resp, default=str) if type(resp) is dict else resp)
             return resp
         except (kubernetes.client.rest.ApiException, urllib3.exceptions.MaxRetryError) as e:
             sys.stdout = sys.__stdout__
@@ -16,11 +16,9 @@
 """
 
 import yaml
-import json
-import copy
 from datetime import datetime, timedelta
 
-from .common import SDKCommon
+from .common import SDKCommon, STREAM_OUTPUTS, jsonDumps
 from .apps import getApps
 from .clusters import getClusters
 
@@ -32,14 +30,24 @@ class getNamespaces(SDKCommon):
         output: table: pretty print the data
                 json: (default) output in JSON
                 yaml: output in yaml
+                ndjson, yaml-stream, table-stream: write each namespace as soon as it's fetched
+                                                   (see common.ItemWriter), and return True
         config: optionally provide a pre-populated common.getConfig().main() object"""
         self.quiet = quiet
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.clusters = getClusters(quiet=True, verbose=verbose, config=config).main()
+        self.clusters = self.context.get(
+            "clusters",
+            lambda: getClusters(quiet=True, verbose=verbose, config=self.conf).main(),
+        )
         self.apps = (
-            getApps(quiet=True, verbose=verbose, config=config).main() if self.clusters else False
+            self.context.get(
+                "apps",
+                lambda: getApps(quiet=True, verbose=verbose, config=self.conf).main(),
+            )
+            if self.clusters
+            else False
         )
 
     def main(
@@ -65,72 +73,62 @@ class getNamespaces(SDKCommon):
             endpoint = "topology/v1/namespaces"
         url = self.base + endpoint
 
-        data = {}
         params = {}
+        tabHeader = ["name", "namespaceID", "namespaceState", "associatedApps", "clusterID"]
+        tabKeys = ["name", "id", "namespaceState", "associatedApps", "clusterID"]
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
-        )
+        systemNS = ["kube-node-lease", "kube-public", "kube-system", "trident"]
+        # Index the app names by (clusterID, namespace), rather than looping over every app for
+        # every namespace
+        appIndex = {}
+        for app in self.apps["items"]:
+            for nsr in app["namespaceScopedResources"]:
+                appIndex.setdefault((app["clusterID"], nsr["namespace"]), []).append(app["name"])
+        clusterList = {c["id"] for c in self.clusters["items"] if c["managedState"] == "managed"}
+        cutoff = minuteFilter and datetime.utcnow() - timedelta(minutes=minuteFilter)
 
-        if ret.ok:
-            systemNS = ["kube-node-lease", "kube-public", "kube-system", "trident"]
-            namespaces = super().jsonifyResults(ret)
-            # Add in a custom key/value "associatedApps"
+        def cook(namespaces):
+            """Add in a custom key/value "associatedApps", and only keep the namespaces which
+            match the filters"""
             for ns in namespaces["items"]:
-                ns["associatedApps"] = []
-                for app in self.apps["items"]:
-                    if ns["clusterID"] == app["clusterID"]:
-                        for nsr in app["namespaceScopedResources"]:
-                            if ns["name"] == nsr["namespace"]:
-                                ns["associatedApps"].append(app["name"])
-            # Delete the unneeded namespaces based on filters
-            namespacesCooked = copy.deepcopy(namespaces)
-            clusterList = []
-            for cluster in self.clusters["items"]:
-                if cluster["managedState"] == "managed":
-                    clusterList.append(cluster["id"])
-            for counter, namespace in enumerate(namespaces.get("items")):
-                if namespace.get("systemType") or namespace.get("name") in systemNS:
-                    namespacesCooked["items"].remove(namespaces["items"][counter])
-                elif nameFilter and nameFilter not in namespace.get("name"):
-                    namespacesCooked["items"].remove(namespaces["items"][counter])
-                elif not showRemoved and namespace.get("namespaceState") == "removed":
-                    namespacesCooked["items"].remove(namespaces["items"][counter])
-                elif namespace["clusterID"] not in clusterList:
-                    namespacesCooked["items"].remove(namespaces["items"][counter])
-                elif (
-                    unassociated
-                    and type(namespace.get("associatedApps")) is list
-                    and len(namespace["associatedApps"]) > 0
-                ):
-                    namespacesCooked["items"].remove(namespaces["items"][counter])
-                elif minuteFilter and (
-                    datetime.utcnow()
-                    - datetime.strptime(
-                        namespace.get("metadata").get("creationTimestamp"), "%Y-%m-%dT%H:%M:%SZ"
-                    )
-                    > timedelta(minutes=minuteFilter)
-                ):
-                    namespacesCooked["items"].remove(namespaces["items"][counter])
+                ns["associatedApps"] = list(appIndex.get((ns["clusterID"], ns["name"]), []))
+            return self.filterItems(
+                namespaces,
+                lambda ns: not ns.get("systemType") and ns.get("name") not in systemNS,
+                lambda ns: not nameFilter or nameFilter in ns.get("name"),
+                lambda ns: showRemoved or ns.get("namespaceState") != "removed",
+                lambda ns: ns["clusterID"] in clusterList,
+                lambda ns: not unassociated or not ns["associatedApps"],
+                lambda ns: not minuteFilter
+                or datetime.strptime(
+                    ns.get("metadata").get("creationTimestamp"), "%Y-%m-%dT%H:%M:%SZ"
+                )
+                >= cutoff,
+            )
+
+        if self.output in STREAM_OUTPUTS:
+            return self.streamPages(
+                self.iterPages(url, self.headers, params, quiet=self.quiet, verbose=self.verbose),
+                cook,
+                tabHeader,
+                tabKeys,
+            )
+
+        ret, namespaces = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
+        )
+
+        if ret.ok and namespaces is not None:
+            namespacesCooked = cook(namespaces)
 
             if self.output == "json":
                 dataReturn = namespacesCooked
             elif self.output == "yaml":
                 dataReturn = yaml.dump(namespacesCooked)
             elif self.output == "table":
-                dataReturn = self.basicTable(
-                    ["name", "namespaceID", "namespaceState", "associatedApps", "clusterID"],
-                    ["name", "id", "namespaceState", "associatedApps", "clusterID"],
-                    namespacesCooked,
-                )
+                dataReturn = self.basicTable(tabHeader, tabKeys, namespacesCooked)
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -16,11 +16,9 @@
 """
 
 import yaml
-import json
-import copy
 from datetime import datetime, timedelta
 
-from .common import SDKCommon
+from .common import SDKCommon, STREAM_OUTPUTS, jsonDumps
 
 YELLOW = "\033[33m"
 ENDC = "\033[0m"
@@ -35,6 +33,8 @@ class getNotifications(SDKCommon):
         output: table: pretty print the data
                 json: (default) output in JSON
                 yaml: output in yaml
+                ndjson, yaml-stream, table-stream: write each notification as soon as it's
+                                                   fetched (see common.ItemWriter), and return True
         config: optionally provide a pre-populated common.getConfig().main() object"""
         self.quiet = quiet
         self.verbose = verbose
@@ -45,35 +45,40 @@ class getNotifications(SDKCommon):
         endpoint = "core/v1/notifications"
         url = self.base + endpoint
 
-        data = {}
         params = {"orderBy": "eventTime desc", "count": "true"}
         if limit and int(limit) != 0:
             params["limit"] = limit
         if skip:
             params["skip"] = skip
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        # Rather than computing the age of every notification, compare against a cutoff
+        cutoff = minuteFilter and datetime.utcnow() - timedelta(minutes=minuteFilter)
+
+        def cook(notifications):
+            """Only keep the notifications which match the given filters"""
+            return self.filterItems(
+                notifications,
+                lambda notification: not minuteFilter
+                or datetime.strptime(notification.get("eventTime"), "%Y-%m-%dT%H:%M:%SZ")
+                >= cutoff,
+                lambda notification: not severityFilter
+                or severityFilter == notification.get("severity"),
+            )
+
+        if self.output in STREAM_OUTPUTS:
+            return self.streamPages(
+                self.iterPages(url, self.headers, params, quiet=self.quiet, verbose=self.verbose),
+                cook,
+                ["notificationID", "summary", "severity", "eventTime"],
+                ["id", "summary", "severity", "eventTime"],
+            )
+
+        ret, notifications = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            notifications = super().jsonifyResults(ret)
-            notificationsCooked = copy.deepcopy(notifications)
-            for counter, notification in enumerate(notifications.get("items")):
-                if minuteFilter and (
-                    datetime.utcnow()
-                    - datetime.strptime(notification.get("eventTime"), "%Y-%m-%dT%H:%M:%SZ")
-                    > timedelta(minutes=minuteFilter)
-                ):
-                    notificationsCooked["items"].remove(notifications["items"][counter])
-                elif severityFilter and severityFilter != notification.get("severity"):
-                    notificationsCooked["items"].remove(notifications["items"][counter])
+        if ret.ok and notifications is not None:
+            notificationsCooked = cook(notifications)
 
             if self.output == "json":
                 dataReturn = notificationsCooked
@@ -90,7 +95,7 @@ class getNotifications(SDKCommon):
                     f"{notificationsCooked['metadata']['count']}{ENDC}"
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -16,9 +16,8 @@
 """
 
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 from .apps import getApps
 
 
@@ -37,7 +36,10 @@ class getProtectionpolicies(SDKCommon):
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.apps = getApps(quiet=True, verbose=verbose, config=config).main()
+        self.apps = self.context.get(
+            "apps",
+            lambda: getApps(quiet=True, verbose=verbose, config=self.conf).main(),
+        )
 
     def main(self, appFilter=None, clusterFilter=None):
         if self.apps is False:
@@ -47,29 +49,26 @@ class getProtectionpolicies(SDKCommon):
         protections = {}
         protections["items"] = []
 
-        for app in self.apps["items"]:
-            if appFilter:
-                if app["name"] != appFilter and app["id"] != appFilter:
-                    continue
-            if clusterFilter:
-                if app["clusterName"] != clusterFilter and app["clusterID"] != clusterFilter:
-                    continue
-            endpoint = f"k8s/v1/apps/{app['id']}/schedules"
-            url = self.base + endpoint
-
-            data = {}
-            params = {}
-
-            ret = super().apicall(
+        apps = [
+            app
+            for app in self.apps["items"]
+            if (not appFilter or appFilter in (app["name"], app["id"]))
+            and (not clusterFilter or clusterFilter in (app["clusterName"], app["clusterID"]))
+        ]
+        rets = self.fanOut(
+            lambda app: self.apicall(
                 "get",
-                url,
-                data,
+                self.base + f"k8s/v1/apps/{app['id']}/schedules",
+                {},
                 self.headers,
-                params,
+                {},
                 quiet=self.quiet,
                 verbose=self.verbose,
-            )
+            ),
+            apps,
+        )
 
+        for app, ret in zip(apps, rets):
             if ret.ok:
                 results = super().jsonifyResults(ret)
                 if results is None:
@@ -82,7 +81,7 @@ class getProtectionpolicies(SDKCommon):
                 if not self.quiet and self.verbose:
                     print(f"Protection policies for {app['id']}")
                     if self.output == "json":
-                        print(json.dumps(results))
+                        print(jsonDumps(results))
                     elif self.output == "yaml":
                         print(yaml.dump(results))
                     elif self.output == "table":
@@ -149,7 +148,7 @@ class getProtectionpolicies(SDKCommon):
             )
 
         if not self.quiet:
-            print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+            print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
         return dataReturn
 
 
@@ -223,7 +222,7 @@ class createProtectionpolicy(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -293,7 +292,7 @@ class updateProtectionpolicy(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
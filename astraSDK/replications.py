@@ -16,11 +16,9 @@
 """
 
 import yaml
-import json
-import copy
 from tabulate import tabulate
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 from .apps import getApps
 
 
@@ -38,7 +36,9 @@ class getReplicationpolicies(SDKCommon):
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.apps = getApps(quiet=True, verbose=verbose, config=config).main()
+        self.apps = self.context.get(
+            "apps", lambda: getApps(quiet=True, verbose=verbose, config=self.conf).main()
+        )
 
     def main(self, appFilter=None):
         if self.apps is False:
@@ -48,39 +48,32 @@ class getReplicationpolicies(SDKCommon):
         endpoint = "k8s/v1/appMirrors"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, replPolicies = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            replPolicies = super().jsonifyResults(ret)
+        if ret.ok and replPolicies is not None:
             # Add custom app name entry
-            for app in self.apps["items"]:
-                for repl in replPolicies["items"]:
-                    if app["id"] == repl["sourceAppID"]:
-                        repl["sourceAppName"] = app["name"]
-                    elif app["id"] == repl["destinationAppID"]:
-                        repl["destinationAppName"] = app["name"]
-            # Deep copy to remove items that don't match appFilter
-            replCooked = copy.deepcopy(replPolicies)
-            if appFilter:
-                for counter, repl in enumerate(replPolicies.get("items")):
-                    if (
-                        appFilter != repl.get("sourceAppName")
-                        and appFilter != repl.get("destinationAppName")
-                        and appFilter != repl.get("sourceAppID")
-                        and appFilter != repl.get("destinationAppID")
-                    ):
-                        replCooked["items"].remove(replPolicies["items"][counter])
+            appNames = {app["id"]: app["name"] for app in self.apps["items"]}
+            for repl in replPolicies["items"]:
+                if repl["sourceAppID"] in appNames:
+                    repl["sourceAppName"] = appNames[repl["sourceAppID"]]
+                if repl["destinationAppID"] in appNames:
+                    repl["destinationAppName"] = appNames[repl["destinationAppID"]]
+            # Only keep the items that match appFilter
+            replCooked = self.filterItems(
+                replPolicies,
+                lambda repl: not appFilter
+                or appFilter
+                in (
+                    repl.get("sourceAppName"),
+                    repl.get("destinationAppName"),
+                    repl.get("sourceAppID"),
+                    repl.get("destinationAppID"),
+                ),
+            )
 
             if self.output == "json":
                 dataReturn = replCooked
@@ -115,7 +108,7 @@ class getReplicationpolicies(SDKCommon):
                     )
                 dataReturn = tabulate(tabData, tabHeader, tablefmt="grid")
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -175,7 +168,7 @@ class createReplicationpolicy(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -238,7 +231,7 @@ class updateReplicationpolicy(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -16,10 +16,8 @@
 """
 
 import yaml
-import json
-import copy
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getRolebindings(SDKCommon):
@@ -41,25 +39,17 @@ class getRolebindings(SDKCommon):
         endpoint = "core/v1/roleBindings"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, rbindings = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            rbindings = super().jsonifyResults(ret)
-            rbindingsCooked = copy.deepcopy(rbindings)
-            for counter, binding in enumerate(rbindings.get("items")):
-                if idFilter and idFilter != binding["userID"] and idFilter != binding["groupID"]:
-                    rbindingsCooked["items"].remove(rbindings["items"][counter])
+        if ret.ok and rbindings is not None:
+            rbindingsCooked = self.filterItems(
+                rbindings,
+                lambda binding: not idFilter or idFilter in (binding["userID"], binding["groupID"]),
+            )
 
             if self.output == "json":
                 dataReturn = rbindingsCooked
@@ -72,7 +62,7 @@ class getRolebindings(SDKCommon):
                     rbindingsCooked,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -130,7 +120,7 @@ class createRolebinding(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
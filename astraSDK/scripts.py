@@ -16,10 +16,8 @@
 """
 
 import yaml
-import json
-import copy
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getScripts(SDKCommon):
@@ -41,25 +39,16 @@ class getScripts(SDKCommon):
         endpoint = "core/v1/hookSources"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, scripts = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            scripts = super().jsonifyResults(ret)
-            scriptsCooked = copy.deepcopy(scripts)
-            for counter, script in enumerate(scripts.get("items")):
-                if nameFilter and nameFilter not in script.get("name"):
-                    scriptsCooked["items"].remove(scripts["items"][counter])
+        if ret.ok and scripts is not None:
+            scriptsCooked = self.filterItems(
+                scripts, lambda script: not nameFilter or nameFilter in script.get("name")
+            )
 
             if self.output == "json":
                 dataReturn = scriptsCooked
@@ -72,7 +61,7 @@ class getScripts(SDKCommon):
                     scriptsCooked,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -126,7 +115,7 @@ class createScript(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -221,7 +210,7 @@ class updateScript(SDKCommon):
             # the scripts/ endpoint doesn't return a dict for PUTs, so calling getScripts
             results = next(s for s in getScripts().main()["items"] if s["id"] == scriptID)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -15,10 +15,9 @@
    limitations under the License.
 """
 
-import json
 import yaml
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getSettings(SDKCommon):
@@ -57,7 +56,7 @@ class getSettings(SDKCommon):
                 except StopIteration:
                     return False
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             return False
@@ -109,7 +108,7 @@ class getLdapSettings(SDKCommon):
                     ldap,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
         return False
 
@@ -175,7 +174,7 @@ class createLdap(SDKCommon):
             # the settings/ endpoint doesn't return a dict for PUTs, so calling getSettings
             results = next(x for x in getSettings().main()["items"] if x["id"] == settingID)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             return False
@@ -222,7 +221,7 @@ class manageLdap(SDKCommon):
             # the settings/ endpoint doesn't return a dict for PUTs, so calling getSettings
             results = next(x for x in getSettings().main()["items"] if x["id"] == settingID)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             return False
@@ -267,7 +266,7 @@ class unmanageLdap(SDKCommon):
             # the settings/ endpoint doesn't return a dict for PUTs, so calling getSettings
             results = next(x for x in getSettings().main()["items"] if x["id"] == settingID)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             return False
@@ -322,7 +321,7 @@ class destroyLdap(SDKCommon):
             # the settings/ endpoint doesn't return a dict for PUTs, so calling getSettings
             results = next(x for x in getSettings().main()["items"] if x["id"] == settingID)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             return False
@@ -16,9 +16,8 @@
 """
 
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, ItemWriter, STREAM_OUTPUTS, jsonDumps
 from .apps import getApps
 
 
@@ -35,12 +34,16 @@ class getSnaps(SDKCommon):
         output: table: pretty print the data
                 json: (default) output in JSON
                 yaml: output in yaml
+                ndjson, yaml-stream, table-stream: write each snapshot as soon as it's fetched
+                                                   (see common.ItemWriter), and return True
         config: optionally provide a pre-populated common.getConfig().main() object"""
         self.quiet = quiet
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.apps = getApps(quiet=True, verbose=verbose, config=config).main()
+        self.apps = self.context.get(
+            "apps", lambda: getApps(quiet=True, verbose=verbose, config=self.conf).main()
+        )
 
     def main(self, appFilter=None):
         if self.apps is False:
@@ -51,26 +54,31 @@ class getSnaps(SDKCommon):
         snaps = {}
         snaps["items"] = []
 
-        for app in self.apps["items"]:
-            if appFilter:
-                if app["name"] != appFilter and app["id"] != appFilter:
-                    continue
-            endpoint = f"k8s/v1/apps/{app['id']}/appSnaps"
-            url = self.base + endpoint
-
-            data = {}
-            params = {}
-
-            ret = super().apicall(
+        apps = [
+            app
+            for app in self.apps["items"]
+            if not appFilter or appFilter in (app["name"], app["id"])
+        ]
+        tabHeader = ["appID", "snapshotName", "snapshotID", "snapshotState", "creationTimestamp"]
+        tabKeys = ["appID", "name", "id", "state", "metadata.creationTimestamp"]
+        # Streaming outputs write each app's snapshots as soon as they're fetched
+        writer = None
+        if self.output in STREAM_OUTPUTS:
+            writer = ItemWriter(self.output, tabHeader, tabKeys, quiet=self.quiet)
+        rets = self.iterFanOut(
+            lambda app: self.apicall(
                 "get",
-                url,
-                data,
+                self.base + f"k8s/v1/apps/{app['id']}/appSnaps",
+                {},
                 self.headers,
-                params,
+                {},
                 quiet=self.quiet,
                 verbose=self.verbose,
-            )
+            ),
+            apps,
+        )
 
+        for app, ret in zip(apps, rets):
             if ret.ok:
                 results = super().jsonifyResults(ret)
                 if results is None:
@@ -79,11 +87,14 @@ class getSnaps(SDKCommon):
                     # Adding custom 'appID' key/value pair
                     if not item.get("appID"):
                         item["appID"] = app["id"]
-                    snaps["items"].append(item)
+                if writer:
+                    writer.write(results["items"])
+                else:
+                    snaps["items"].extend(results["items"])
                 if not self.quiet and self.verbose:
                     print(f"Snapshots for {app['id']}")
                     if self.output == "json":
-                        print(json.dumps(results))
+                        print(jsonDumps(results))
                     elif self.output == "yaml":
                         print(yaml.dump(results))
                     elif self.output == "table":
@@ -104,19 +115,19 @@ class getSnaps(SDKCommon):
                 if not self.quiet:
                     super().printError(ret)
                 continue
+        if writer:
+            writer.close()
+            return True
+
         if self.output == "json":
             dataReturn = snaps
         elif self.output == "yaml":
             dataReturn = yaml.dump(snaps)
         elif self.output == "table":
-            dataReturn = self.basicTable(
-                ["appID", "snapshotName", "snapshotID", "snapshotState", "creationTimestamp"],
-                ["appID", "name", "id", "state", "metadata.creationTimestamp"],
-                snaps,
-            )
+            dataReturn = self.basicTable(tabHeader, tabKeys, snaps)
 
         if not self.quiet:
-            print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+            print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
         return dataReturn
 
 
@@ -158,7 +169,7 @@ class takeSnap(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results.get("id") or True
         else:
             if not self.quiet:
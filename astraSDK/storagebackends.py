@@ -16,9 +16,8 @@
 """
 
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 class getStorageBackends(SDKCommon):
@@ -40,21 +39,13 @@ class getStorageBackends(SDKCommon):
         endpoint = "topology/v1/storageBackends"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, backends = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            backends = super().jsonifyResults(ret)
+        if ret.ok and backends is not None:
             if self.output == "json":
                 dataReturn = backends
             elif self.output == "yaml":
@@ -66,7 +57,7 @@ class getStorageBackends(SDKCommon):
                     backends,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -16,9 +16,8 @@
 """
 
 import yaml
-import json
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 from .clouds import getClouds
 from .clusters import getClusters
 
@@ -35,9 +34,17 @@ class getStorageClasses(SDKCommon):
         self.verbose = verbose
         self.output = output
         super().__init__(config=config)
-        self.clouds = getClouds(quiet=True, verbose=verbose, config=config).main()
+        self.clouds = self.context.get(
+            "clouds",
+            lambda: getClouds(quiet=True, verbose=verbose, config=self.conf).main(),
+        )
         self.clusters = (
-            getClusters(quiet=True, verbose=verbose, config=config).main() if self.clouds else False
+            self.context.get(
+                "clusters",
+                lambda: getClusters(quiet=True, verbose=verbose, config=self.conf).main(),
+            )
+            if self.clouds
+            else False
         )
 
     def main(self, cloudType=None, clusterStr=None, hideUnmanaged=False):
@@ -128,5 +135,5 @@ class getStorageClasses(SDKCommon):
             )
 
         if not self.quiet:
-            print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+            print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
         return dataReturn
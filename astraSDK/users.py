@@ -16,10 +16,8 @@
 """
 
 import yaml
-import json
-import copy
 
-from .common import SDKCommon
+from .common import SDKCommon, jsonDumps
 
 
 YELLOW = "\033[33m"
@@ -45,33 +43,23 @@ class getUsers(SDKCommon):
         endpoint = "core/v1/users"
         url = self.base + endpoint
 
-        data = {}
         params = {}
 
-        ret = super().apicall(
-            "get",
-            url,
-            data,
-            self.headers,
-            params,
-            quiet=self.quiet,
-            verbose=self.verbose,
+        ret, users = self.getPages(
+            url, self.headers, params, quiet=self.quiet, verbose=self.verbose
         )
 
-        if ret.ok:
-            users = super().jsonifyResults(ret)
+        if ret.ok and users is not None:
             # Add custom fullName entry
             for user in users["items"]:
                 if not user.get("fullName"):
                     user["fullName"] = user.get("firstName") + " " + user.get("lastName")
-            usersCooked = copy.deepcopy(users)
-            if nameFilter:
-                for counter, user in enumerate(users.get("items")):
-                    if (
-                        nameFilter.lower() not in user.get("firstName").lower()
-                        and nameFilter.lower() not in user.get("lastName").lower()
-                    ):
-                        usersCooked["items"].remove(users["items"][counter])
+            usersCooked = self.filterItems(
+                users,
+                lambda user: not nameFilter
+                or nameFilter.lower() in user.get("firstName").lower()
+                or nameFilter.lower() in user.get("lastName").lower(),
+            )
 
             if self.output == "json":
                 dataReturn = usersCooked
@@ -84,7 +72,7 @@ class getUsers(SDKCommon):
                     usersCooked,
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -149,7 +137,7 @@ class createUser(SDKCommon):
         if ret.ok:
             results = super().jsonifyResults(ret)
             if not self.quiet:
-                print(json.dumps(results))
+                print(jsonDumps(results))
             return results
         else:
             if not self.quiet:
@@ -272,7 +260,7 @@ class getLdapUsers(SDKCommon):
                     + contStr
                 )
             if not self.quiet:
-                print(json.dumps(dataReturn) if type(dataReturn) is dict else dataReturn)
+                print(jsonDumps(dataReturn) if type(dataReturn) is dict else dataReturn)
             return dataReturn
 
         else:
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from astraSDK import common  # noqa: E402
+
+
+def generateNotifications(count):
+    """Returns a core/v1/notifications response of count synthetic notifications"""
+    items = []
+    for i in range(count):
+        items.append(
+            {
+                "type": "application/astra-notification",
+                "version": "1.1",
+                "id": f"9b7c4e3a-0000-4000-8000-{i:012d}",
+                "summary": f"Backup of app 'wordpress-{i % 50}' completed successfully",
+                "description": "The backup was stored in bucket 'astra-bucket' in "
+                f"{i % 7 * 13.5:.1f} seconds, with a size of {i * 1024 % 9999991} bytes",
+                "severity": ["informational", "warning", "critical"][i % 3],
+                "eventTime": f"2024-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00Z",
+                "additionalDetails": {
+                    "appID": f"a{i % 50}",
+                    "sourceAsynchronous": i % 2 == 0,
+                    "retries": i % 4,
+                },
+                "metadata": {
+                    "labels": [{"name": "astra.netapp.io/labels/read-only/source", "value": "x"}],
+                    "creationTimestamp": "2024-01-01T00:00:00Z",
+                    "modificationTimestamp": "2024-01-01T00:00:00Z",
+                    "createdBy": "8146d293-d897-4e16-ab10-8dca934637ab",
+                },
+            }
+        )
+    return {"items": items, "metadata": {"count": count}}
+
+
+def generateApps(count):
+    """Returns a k8s/v2/apps response of count synthetic apps"""
+    items = []
+    for i in range(count):
+        items.append(
+            {
+                "type": "application/astra-app",
+                "version": "2.2",
+                "id": f"4a1b2c3d-0000-4000-8000-{i:012d}",
+                "name": f"app-{i}",
+                "namespaceScopedResources": [
+                    {"namespace": f"ns-{i}-{n}", "labelSelectors": [f"app=db-{n}"]}
+                    for n in range(3)
+                ],
+                "clusterScopedResources": [
+                    {"GVK": {"group": "rbac", "kind": "ClusterRole", "version": "v1"}}
+                ],
+                "state": "ready",
+                "stateTransitions": [{"to": ["pending"]}, {"to": ["provisioning", "ready"]}],
+                "stateDetails": [],
+                "protectionState": "full",
+                "namespaces": [f"ns-{i}-{n}" for n in range(3)],
+                "clusterName": f"cluster-{i % 4}",
+                "clusterID": f"c{i % 4}",
+                "clusterType": "openshift",
+                "metadata": {
+                    "labels": [],
+                    "creationTimestamp": "2024-01-01T00:00:00Z",
+                    "modificationTimestamp": "2024-01-01T00:00:00Z",
+                    "createdBy": "8146d293-d897-4e16-ab10-8dca934637ab",
+                },
+            }
+        )
+    return {"items": items, "metadata": {}}
+
+
+def timeCall(func, runs):
+    """Returns the wall times (in seconds) of calling func runs times"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the json codec on large API response payloads"
+    )
+    parser.add_argument("-r", "--runs", type=int, default=5, help="runs per payload")
+    parser.add_argument("-n", "--count", type=int, default=100000, help="items per payload")
+    args = parser.parse_args()
+
+    codec = "json module" if common.orjson is None else "orjson"
+    print(f"json module vs jsonLoads/jsonDumps ({codec}) on {args.count} items ({args.runs} runs)")
+    for name, generate in (("notifications", generateNotifications), ("apps", generateApps)):
+        data = generate(args.count)
+        body = json.dumps(data).encode("utf-8")
+        if common.jsonLoads(body) != json.loads(body):
+            raise SystemExit(f"{name}: jsonLoads decoded a different object")
+        if json.loads(common.jsonDumps(data, compact=True)) != data:
+            raise SystemExit(f"{name}: jsonDumps encoded a different object")
+        results = {
+            "decode": (
+                timeCall(lambda: json.loads(body), args.runs),
+                timeCall(lambda: common.jsonLoads(body), args.runs),
+            ),
+            "encode": (
+                timeCall(lambda: json.dumps(data), args.runs),
+                timeCall(lambda: common.jsonDumps(data, compact=True), args.runs),
+            ),
+        }
+        print(f"  {name} ({len(body) / 1024 / 1024:.1f} MiB)")
+        for stage, (before, after) in results.items():
+            before, after = statistics.median(before), statistics.median(after)
+            print(
+                f"    {stage:<7} before: {before:.3f}s  after: {after:.3f}s  "
+                f"speedup: {before / after:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from mockastra import MockAstra, MockAstraServer
+
+REPO = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+COMMANDS = [
+    "list apps",
+    "list backups",
+    "list snapshots",
+    "list clusters",
+    "list namespaces",
+    "list notifications",
+    "list storageclasses",
+    "list apps,backups,snapshots",
+    "create backup {app} bench -b",
+]
+
+# Runs a single toolkit command in the child process (with the config.yaml of its working
+# directory), and writes the wall time of toolkit.main() to the results file
+CHILD = """
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+from astraSDK.common import getConfig
+import toolkit
+
+config = getConfig().main()
+# getConfig() always builds an https:// base, while the mock server speaks plain http
+config["base"] = config["base"].replace("https://", "http://", 1)
+start, code = time.perf_counter(), 0
+try:
+    toolkit.main(["actoolkit"] + sys.argv[3:], config=config)
+except SystemExit as e:
+    code = e.code if isinstance(e.code, int) else 1
+with open(sys.argv[2], "w") as f:
+    json.dump({"wall": time.perf_counter() - start, "code": code}, f)
+"""
+
+
+def runCommand(argv, confDir, env):
+    """Runs toolkit argv in a new process, and returns a dict of the wall time of toolkit.main(),
+    the exit code, and the peak RSS (in MiB) of the process"""
+    resultsFile = os.path.join(confDir, "results.json")
+    proc = subprocess.Popen(
+        [sys.executable, "-c", CHILD, REPO, resultsFile] + argv,
+        cwd=confDir,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    # wait4() rather than wait(), for the resource usage of this child alone
+    _, status, rusage = os.wait4(proc.pid, 0)
+    proc.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+    with open(resultsFile) as f:
+        results = json.load(f)
+    os.remove(resultsFile)
+    # ru_maxrss is in KiB on Linux, and bytes on macOS
+    results["rss"] = rusage.ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark toolkit commands end to end against a mock Astra Control API"
+    )
+    parser.add_argument(
+        "-s", "--scales", default="10,100,1000", help="comma separated app counts (%(default)s)"
+    )
+    parser.add_argument("-r", "--runs", type=int, default=3, help="runs per command")
+    parser.add_argument("-b", "--backups", type=int, default=2, help="backups per app")
+    parser.add_argument("-n", "--notifications", type=int, default=1000)
+    parser.add_argument("-l", "--latency", type=float, default=0.005, help="seconds per request")
+    parser.add_argument("-e", "--error-rate", type=float, default=0, help="503 rate (0 to 1)")
+    parser.add_argument(
+        "-d", "--detail", action="store_true", help="print the requests of every command"
+    )
+    parser.add_argument(
+        "-c",
+        "--command",
+        action="append",
+        help="toolkit command to run, '{app}' is replaced with an app ID (repeatable, default: "
+        + "; ".join(COMMANDS)
+        + ")",
+    )
+    args = parser.parse_args()
+
+    env = dict(os.environ, ASTRATOOLKITS_CHOICES_TTL="0", PYTHONDONTWRITEBYTECODE="1")
+    print(
+        f"{args.runs} runs per command, {args.latency * 1000:g}ms latency, "
+        f"{args.error_rate:.0%} error rate"
+    )
+    for scale in [int(s) for s in args.scales.split(",")]:
+        mock = MockAstra(
+            apps=scale,
+            backups=args.backups,
+            snapshots=args.backups,
+            notifications=args.notifications,
+            latency=args.latency,
+            errorRate=args.error_rate,
+        )
+        server = MockAstraServer(mock).start()
+        print(f"{scale} apps")
+        print(
+            f"  {'command':<32} {'median':>8} {'min':>8} {'process':>8} {'requests':>9} "
+            f"{'peak RSS':>9}"
+        )
+        try:
+            with tempfile.TemporaryDirectory() as confDir:
+                # Found first as it's in the working directory of the child process
+                with open(os.path.join(confDir, "config.yaml"), "w") as f:
+                    f.write(
+                        "headers:\n  Authorization: Bearer placeholder\n"
+                        "uid: 00000000-0000-0000-0000-000000000000\n"
+                        f"astra_project: {server.address}\n"
+                    )
+                for command in args.command or COMMANDS:
+                    argv = command.format(app=next(iter(mock.apps), "")).split()
+                    walls, processes, requests, rss, codes = [], [], [], [], set()
+                    for _ in range(args.runs):
+                        mock.reset()
+                        start = time.perf_counter()
+                        results = runCommand(argv, confDir, env)
+                        processes.append(time.perf_counter() - start)
+                        counts = mock.reset()
+                        walls.append(results["wall"])
+                        requests.append(sum(counts.values()))
+                        rss.append(results["rss"])
+                        codes.add(results["code"])
+                    failed = "" if codes == {0} else f"  (exit codes: {sorted(codes)})"
+                    print(
+                        f"  {command:<32} {statistics.median(walls):>7.3f}s {min(walls):>7.3f}s "
+                        f"{statistics.median(processes):>7.3f}s "
+                        f"{statistics.median(requests):>9g} {max(rss):>6.1f}MiB{failed}"
+                    )
+                    if args.detail:
+                        for request, count in sorted(counts.items()):
+                            print(f"    {count:>7}  {request}")
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
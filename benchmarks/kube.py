@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from mockkube import ASTRA, MockKube, MockKubeServer, populate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import astraSDK  # noqa: E402
+
+NAMESPACE = "astra-connector"
+
+
+def timeCall(func, runs, mock):
+    """Returns the wall times (in seconds) of calling func runs times, and the requests and
+    response bytes of the last run"""
+    times = []
+    for _ in range(runs):
+        mock.reset()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    requests, sent = mock.reset()
+    return times, sum(requests.values()), sum(sent.values())
+
+
+def createJobs(context, plural, count):
+    """Creates count custom resources of plural, and returns their names"""
+    creator = astraSDK.k8s.createResource(config_context=context)
+    return [
+        creator.main(
+            plural,
+            NAMESPACE,
+            {
+                "apiVersion": ASTRA,
+                "kind": plural[:-1].capitalize(),
+                "metadata": {"generateName": "bench-"},
+                "spec": {"applicationRef": "app-0", "appVaultRef": "vault-0"},
+            },
+        )["metadata"]["name"]
+        for _ in range(count)
+    ]
+
+
+def waitWatch(context, plural, names, pollTimer):
+    """Waits for every resource with a watchResource each (in turn), returning name: seen time"""
+    watcher = astraSDK.k8s.watchResource(config_context=context)
+    seen = {}
+    for name in names:
+        watcher.main(
+            plural,
+            name,
+            lambda r: (r.get("status") or {}).get("state") in ["Completed", "Failed", "Error"],
+            watchTimeout=pollTimer,
+        )
+        seen[name] = time.monotonic()
+    return seen
+
+
+def waitTracker(context, plural, names, pollTimer):
+    """Waits for every resource with a single KubeJobTracker, returning name: seen time"""
+    tracker = astraSDK.jobs.KubeJobTracker(config_context=context, pollTimer=pollTimer)
+    seen = {}
+    futures = []
+    for name in names:
+        future = tracker.trackResource(plural, name)
+        future.add_done_callback(lambda f, name=name: seen.setdefault(name, time.monotonic()))
+        futures.append(future)
+    for future in futures:
+        future.result()
+    return seen
+
+
+def waitListPolling(context, plural, names, pollTimer):
+    """Waits for every resource by listing every resource of plural each pollTimer seconds (how
+    bulk protections were monitored before the job tracker), returning name: seen time"""
+    lister = astraSDK.k8s.getResources(config_context=context)
+    seen = {}
+    while len(seen) < len(names):
+        states = {
+            r["metadata"]["name"]: (r.get("status") or {}).get("state")
+            for r in lister.main(plural)["items"]
+        }
+        now = time.monotonic()
+        for name in names:
+            if name not in seen and states.get(name) in ["Completed", "Failed", "Error"]:
+                seen[name] = now
+        if len(seen) < len(names):
+            time.sleep(pollTimer)
+    return seen
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the --v3 code paths against a mock Kubernetes API server"
+    )
+    parser.add_argument(
+        "-n",
+        "--counts",
+        default="1000,5000",
+        help="comma separated numbers of backups, snapshots, namespaces and secrets (%(default)s)",
+    )
+    parser.add_argument("-r", "--runs", type=int, default=3, help="runs per list/filter call")
+    parser.add_argument("-l", "--latency", type=float, default=0.002, help="seconds per request")
+    parser.add_argument("-j", "--jobs", type=int, default=20, help="backups to wait for")
+    parser.add_argument("-t", "--pollTimer", type=float, default=1, help="seconds between polls")
+    args = parser.parse_args()
+
+    print(
+        f"{args.runs} runs per call, {args.latency * 1000:g}ms latency, waiting on {args.jobs} "
+        f"backups with a {args.pollTimer:g}s poll timer"
+    )
+    for count in [int(c) for c in args.counts.split(",")]:
+        mock = MockKube(latency=args.latency)
+        populate(mock, count)
+        server = MockKubeServer(mock).start()
+        try:
+            with tempfile.TemporaryDirectory() as confDir:
+                context = server.writeKubeconfig(os.path.join(confDir, "kubeconfig"))
+                getResources = astraSDK.k8s.getResources(config_context=context)
+
+                def byApp(keyFilter):
+                    return lambda: getResources.main(
+                        "backups", filters=[{"keyFilter": keyFilter, "valFilter": "app-1"}]
+                    )
+
+                print(f"{count} backups, snapshots, namespaces, and secrets")
+                print(f"  {'call':<44} {'median':>8} {'min':>8} {'requests':>9} {'bytes':>11}")
+                calls = [
+                    ("list backups", lambda: getResources.main("backups")),
+                    ("list applications", lambda: getResources.main("applications")),
+                    (
+                        "list namespaces",
+                        lambda: astraSDK.k8s.getNamespaces(config_context=context).main(),
+                    ),
+                    (
+                        "list secrets",
+                        lambda: astraSDK.k8s.getSecrets(config_context=context).main(),
+                    ),
+                    (
+                        "list storageclasses",
+                        lambda: astraSDK.k8s.getStorageClasses(config_context=context).main(),
+                    ),
+                    (
+                        "filter backups by metadata.name (server)",
+                        lambda: getResources.main(
+                            "backups",
+                            filters=[{"keyFilter": "metadata.name", "valFilter": "bkp-1"}],
+                        ),
+                    ),
+                    ("filter backups by metadata.labels (server)", byApp("metadata.labels.app")),
+                    ("filter backups by spec (client)", byApp("spec.applicationRef")),
+                ]
+                for name, func in calls:
+                    times, requests, sent = timeCall(func, args.runs, mock)
+                    print(
+                        f"  {name:<44} {statistics.median(times):>7.3f}s {min(times):>7.3f}s "
+                        f"{requests:>9} {sent:>11,}"
+                    )
+
+                print(f"  {'wait (lag from completion to detection)':<44} {'median':>8} {'max':>8}")
+                for name, wait in [
+                    ("watchResource (one at a time)", waitWatch),
+                    ("KubeJobTracker", waitTracker),
+                    ("list polling", waitListPolling),
+                ]:
+                    names = createJobs(context, "backups", args.jobs)
+                    mock.reset()
+                    seen = wait(context, "backups", names, args.pollTimer)
+                    requests, sent = mock.reset()
+                    key = (ASTRA, NAMESPACE, "backups")
+                    lags = [seen[n] - mock.finished[(key, n)] for n in names]
+                    print(
+                        f"  {name:<44} {statistics.median(lags):>7.3f}s {max(lags):>7.3f}s "
+                        f"{sum(requests.values()):>9} {sum(sent.values()):>11,}"
+                    )
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
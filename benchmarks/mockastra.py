@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+TIMESTAMP = "2024-01-01T00:00:00Z"
+SYSTEM_NAMESPACES = ["kube-system", "kube-public", "trident"]
+
+
+def mockID(kind, i):
+    """Returns a deterministic uuid-like ID for the i-th object of kind"""
+    return f"{kind:08x}-0000-4000-8000-{i:012d}"
+
+
+def metadata(labels=None):
+    return {
+        "labels": labels or [],
+        "creationTimestamp": TIMESTAMP,
+        "modificationTimestamp": TIMESTAMP,
+        "createdBy": "8146d293-d897-4e16-ab10-8dca934637ab",
+    }
+
+
+class MockAstra:
+    """A synthetic Astra Control account of apps apps (spread over one cluster per
+    appsPerCluster apps), each with backups backups, snapshots snapshots, and a namespace, plus
+    notifications notifications. Every request sleeps for latency seconds, and fails with a 503
+    at errorRate (0 to 1). Backups and snapshots created with a POST are "running" for
+    jobSeconds seconds, and then "completed".
+
+    handle() serves a single request, and counts it by method and path template in
+    self.requests (see reset())."""
+
+    def __init__(
+        self,
+        apps=100,
+        backups=2,
+        snapshots=2,
+        notifications=1000,
+        appsPerCluster=100,
+        latency=0,
+        errorRate=0,
+        jobSeconds=2,
+        seed=0,
+    ):
+        self.latency = latency
+        self.errorRate = errorRate
+        self.jobSeconds = jobSeconds
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = Counter()
+        self.created = 0
+        self.routes = [
+            ("GET", "topology/v1/clouds", self.getClouds),
+            ("GET", "topology/v1/clouds/{cloudID}/clusters", self.getClusters),
+            ("GET", "topology/v1/managedClusters", self.getClusters),
+            ("GET", "topology/v1/clusters/{clusterID}/namespaces", self.getNamespaces),
+            ("GET", "topology/v1/namespaces", self.getNamespaces),
+            (
+                "GET",
+                "topology/v1/clouds/{cloudID}/clusters/{clusterID}/storageClasses",
+                self.getStorageClasses,
+            ),
+            ("GET", "topology/v1/buckets", self.getBuckets),
+            ("GET", "core/v1/notifications", self.getNotifications),
+            ("GET", "core/v1/credentials", self.getEmpty),
+            ("GET", "core/v1/hookSources", self.getEmpty),
+            ("GET", "k8s/v1/appMirrors", self.getEmpty),
+            ("GET", "k8s/v2/apps", self.getApps),
+            ("GET", "k8s/v2/apps/{appID}", self.getApp),
+            ("GET", "k8s/v1/apps/{appID}/appBackups", self.getProtections),
+            ("GET", "k8s/v1/apps/{appID}/appSnaps", self.getProtections),
+            ("GET", "k8s/v1/apps/{appID}/appBackups/{id}", self.getProtection),
+            ("GET", "k8s/v1/apps/{appID}/appSnaps/{id}", self.getProtection),
+            ("GET", "k8s/v1/apps/{appID}/executionHooks", self.getEmpty),
+            ("GET", "k8s/v1/apps/{appID}/schedules", self.getEmpty),
+            ("POST", "k8s/v1/apps/{appID}/appBackups", self.createProtection),
+            ("POST", "k8s/v1/apps/{appID}/appSnaps", self.createProtection),
+        ]
+        self.patterns = [
+            (
+                method,
+                template,
+                re.compile(re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", template) + "$"),
+                handler,
+            )
+            for method, template, handler in self.routes
+        ]
+        self.generate(apps, backups, snapshots, notifications, appsPerCluster)
+
+    def generate(self, apps, backups, snapshots, notifications, appsPerCluster):
+        self.clouds = [
+            {
+                "type": "application/astra-cloud",
+                "id": mockID(1, 0),
+                "name": "private",
+                "cloudType": "private",
+                "state": "running",
+                "metadata": metadata(),
+            }
+        ]
+        self.buckets = [
+            {
+                "type": "application/astra-bucket",
+                "id": mockID(2, i),
+                "name": f"bucket-{i}",
+                "provider": "generic-s3",
+                "state": "available",
+                "metadata": metadata(),
+            }
+            for i in range(2)
+        ]
+        self.clusters = [
+            {
+                "type": "application/astra-cluster",
+                "id": mockID(3, i),
+                "name": f"cluster-{i}",
+                "cloudID": self.clouds[0]["id"],
+                "clusterType": "openshift",
+                "location": "",
+                "state": "running",
+                "managedState": "managed",
+                "defaultBucketID": self.buckets[0]["id"],
+                "metadata": metadata(),
+            }
+            for i in range(max(1, -(-apps // appsPerCluster)))
+        ]
+        self.storageClasses = {
+            cluster["id"]: [
+                {
+                    "type": "application/astra-storageClass",
+                    "id": mockID(4, c * 2 + i),
+                    "name": name,
+                    "provisioner": "csi.trident.netapp.io",
+                    "isDefault": "true" if i == 0 else "false",
+                    "metadata": metadata(),
+                }
+                for i, name in enumerate(["ontap-gold", "ontap-silver"])
+            ]
+            for c, cluster in enumerate(self.clusters)
+        }
+        self.apps, self.namespaces = {}, []
+        for i in range(apps):
+            cluster = self.clusters[i // appsPerCluster]
+            app = {
+                "type": "application/astra-app",
+                "version": "2.2",
+                "id": mockID(5, i),
+                "name": f"app-{i}",
+                "namespaceScopedResources": [{"namespace": f"app-{i}"}],
+                "clusterScopedResources": [],
+                "state": "ready",
+                "protectionState": "full",
+                "namespaces": [f"app-{i}"],
+                "clusterName": cluster["name"],
+                "clusterID": cluster["id"],
+                "clusterType": "openshift",
+                "metadata": metadata(
+                    [{"name": "tier", "value": ["gold", "silver", "bronze"][i % 3]}]
+                ),
+            }
+            self.apps[app["id"]] = app
+        for i, name in enumerate(
+            [a["name"] for a in self.apps.values()]
+            + [ns for _ in self.clusters for ns in SYSTEM_NAMESPACES]
+        ):
+            clusterID = (
+                self.apps[mockID(5, i)]["clusterID"]
+                if i < apps
+                else self.clusters[(i - apps) // len(SYSTEM_NAMESPACES)]["id"]
+            )
+            self.namespaces.append(
+                {
+                    "type": "application/astra-namespace",
+                    "id": mockID(6, i),
+                    "name": name,
+                    "namespaceState": "discovered",
+                    "clusterID": clusterID,
+                    "metadata": metadata(),
+                }
+            )
+        self.protections = {}
+        for appIndex, appID in enumerate(self.apps):
+            for kind, endpoint, count in [(7, "appBackups", backups), (8, "appSnaps", snapshots)]:
+                self.protections[(appID, endpoint)] = {}
+                for i in range(count):
+                    protection = {
+                        "id": mockID(kind, appIndex * count + i),
+                        "name": f"{endpoint[3:-1].lower()}-{i}",
+                        "state": "completed",
+                        "bucketID": self.buckets[0]["id"],
+                        "metadata": metadata(),
+                    }
+                    self.protections[(appID, endpoint)][protection["id"]] = protection
+        self.notifications = [
+            {
+                "type": "application/astra-notification",
+                "id": mockID(9, i),
+                "summary": f"Backup of app 'app-{i % max(apps, 1)}' completed successfully",
+                "severity": ["informational", "warning", "critical"][i % 3],
+                "eventTime": TIMESTAMP,
+                "metadata": metadata(),
+            }
+            for i in range(notifications)
+        ]
+
+    def reset(self):
+        """Returns and clears the counts of the requests served so far"""
+        with self.lock:
+            requests, self.requests = self.requests, Counter()
+        return requests
+
+    def collection(self, items, query):
+        """Returns a collection response of items, paginated by the limit and skip params"""
+        skip = int(query.get("skip", 0))
+        limit = int(query["limit"]) if "limit" in query else None
+        page = items[skip : skip + limit if limit is not None else None]
+        meta = {"count": len(items)} if query.get("count") == "true" else {}
+        return 200, {"items": page, "metadata": meta}
+
+    def getClouds(self, query, **kw):
+        return self.collection(self.clouds, query)
+
+    def getClusters(self, query, cloudID=None, **kw):
+        return self.collection(self.clusters, query)
+
+    def getNamespaces(self, query, clusterID=None, **kw):
+        return self.collection(
+            [ns for ns in self.namespaces if not clusterID or ns["clusterID"] == clusterID], query
+        )
+
+    def getStorageClasses(self, query, clusterID, **kw):
+        if clusterID not in self.storageClasses:
+            return 404, {"detail": f"cluster {clusterID} not found"}
+        return self.collection(self.storageClasses[clusterID], query)
+
+    def getBuckets(self, query, **kw):
+        return self.collection(self.buckets, query)
+
+    def getNotifications(self, query, **kw):
+        return self.collection(self.notifications, query)
+
+    def getEmpty(self, query, **kw):
+        return self.collection([], query)
+
+    def getApps(self, query, **kw):
+        return self.collection(list(self.apps.values()), query)
+
+    def getApp(self, query, appID, **kw):
+        if appID not in self.apps:
+            return 404, {"detail": f"app {appID} not found"}
+        return 200, self.apps[appID]
+
+    def refresh(self, protection):
+        """Completes a created backup/snapshot once it's been running for jobSeconds"""
+        started = protection.pop("started", None)
+        if started is not None and time.monotonic() - started < self.jobSeconds:
+            protection["started"] = started
+        elif started is not None:
+            protection["state"] = "completed"
+        return {k: v for k, v in protection.items() if k != "started"}
+
+    def getProtections(self, query, appID, endpoint, **kw):
+        if appID not in self.apps:
+            return 404, {"detail": f"app {appID} not found"}
+        with self.lock:
+            items = [self.refresh(p) for p in self.protections[(appID, endpoint)].values()]
+        return self.collection(items, query)
+
+    def getProtection(self, query, appID, endpoint, id, **kw):
+        protection = self.protections.get((appID, endpoint), {}).get(id)
+        if protection is None:
+            return 404, {"detail": f"{endpoint} {id} not found"}
+        with self.lock:
+            return 200, self.refresh(protection)
+
+    def createProtection(self, query, appID, endpoint, body, **kw):
+        if appID not in self.apps:
+            return 404, {"detail": f"app {appID} not found"}
+        with self.lock:
+            protections = self.protections[(appID, endpoint)]
+            protection = {
+                "id": mockID(10, self.created),
+                "name": (body or {}).get("name", "protection"),
+                "state": "running",
+                "bucketID": (body or {}).get("bucketID", self.buckets[0]["id"]),
+                "metadata": metadata(),
+                "started": time.monotonic(),
+            }
+            protections[protection["id"]] = protection
+            self.created += 1
+            return 201, self.refresh(protection)
+
+    def handle(self, method, path, body=None):
+        """Returns the (status, response dict) of a request for path (which starts with
+        /accounts/<account ID>/), and counts the request"""
+        url = urlsplit(path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        endpoint = url.path.split("/", 3)[-1] if url.path.startswith("/accounts/") else ""
+        for routeMethod, template, pattern, handler in self.patterns:
+            match = pattern.match(endpoint)
+            if routeMethod == method and match:
+                break
+        else:
+            template, handler = None, None
+        with self.lock:
+            self.requests[f"{method} {template or endpoint}"] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self.errorRate and self.random.random() < self.errorRate:
+            return 503, {"detail": "injected error"}
+        if handler is None:
+            return 404, {"detail": f"{method} {endpoint} is not implemented"}
+        kwargs = match.groupdict()
+        if template.startswith("k8s/v1/apps/"):
+            kwargs["endpoint"] = template.split("/")[4]
+        return handler(query, body=body, **kwargs)
+
+
+class MockAstraHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and body are written separately, which would otherwise wait on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def respond(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        status, payload = self.server.mock.handle(method, self.path, body)
+        content = json.dumps(payload).encode("utf-8")
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+        if method == "GET" and status == 200 and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        if method == "GET" and status == 200:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self):
+        self.respond("GET")
+
+    def do_POST(self):
+        self.respond("POST")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockAstraServer(ThreadingHTTPServer):
+    """Serves a MockAstra over plain http on host:port (port 0 picks a free port) from a
+    background thread, once started with start()"""
+
+    daemon_threads = True
+
+    def __init__(self, mock, host="127.0.0.1", port=0):
+        super().__init__((host, port), MockAstraHandler)
+        self.mock = mock
+        self.thread = None
+
+    @property
+    def address(self):
+        return f"{self.server_address[0]}:{self.server_address[1]}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock Astra Control API over http")
+    parser.add_argument("-p", "--port", type=int, default=8080, help="port to listen on")
+    parser.add_argument("-a", "--apps", type=int, default=100, help="number of apps")
+    parser.add_argument("-b", "--backups", type=int, default=2, help="backups per app")
+    parser.add_argument("-s", "--snapshots", type=int, default=2, help="snapshots per app")
+    parser.add_argument("-n", "--notifications", type=int, default=1000)
+    parser.add_argument("-l", "--latency", type=float, default=0, help="seconds per request")
+    parser.add_argument("-e", "--error-rate", type=float, default=0, help="503 rate (0 to 1)")
+    args = parser.parse_args()
+
+    mock = MockAstra(
+        apps=args.apps,
+        backups=args.backups,
+        snapshots=args.snapshots,
+        notifications=args.notifications,
+        latency=args.latency,
+        errorRate=args.error_rate,
+    )
+    server = MockAstraServer(mock, port=args.port)
+    print(f"Serving {args.apps} apps at http://{server.address}/accounts/<any account ID>/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    for request, count in sorted(mock.reset().items()):
+        print(f"{count:>8}  {request}")
+
+
+if __name__ == "__main__":
+    main()
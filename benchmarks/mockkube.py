@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import argparse
+import copy
+import heapq
+import itertools
+import json
+import random
+import re
+import string
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+ASTRA = "astra.netapp.io/v1"
+KINDS = {
+    "applications": "Application",
+    "appvaults": "AppVault",
+    "backups": "Backup",
+    "snapshots": "Snapshot",
+    "backuprestores": "BackupRestore",
+    "backupinplacerestores": "BackupInplaceRestore",
+    "snapshotrestores": "SnapshotRestore",
+    "snapshotinplacerestores": "SnapshotInplaceRestore",
+    "exechooks": "ExecHook",
+    "schedules": "Schedule",
+    "namespaces": "Namespace",
+    "secrets": "Secret",
+    "storageclasses": "StorageClass",
+}
+# The status.state of a newly created custom resource over time, as (seconds, state) tuples
+DEFAULT_TRANSITIONS = {
+    "backups": [(0, "Pending"), (1, "Running"), (2, "Completed")],
+    "snapshots": [(0, "Pending"), (0.5, "Running"), (1, "Completed")],
+    "backuprestores": [(0, "Pending"), (1, "Running"), (3, "Completed")],
+    "backupinplacerestores": [(0, "Pending"), (1, "Running"), (3, "Completed")],
+    "snapshotrestores": [(0, "Pending"), (1, "Running"), (2, "Completed")],
+    "snapshotinplacerestores": [(0, "Pending"), (1, "Running"), (2, "Completed")],
+}
+FINAL_STATES = ["Completed", "Failed", "Error"]
+PATHS = [
+    # Core namespaces are cluster scoped, so they must be matched before namespaced core objects
+    (re.compile(r"^/api/v1/(?P<plural>namespaces)(?:/(?P<name>[^/]+))?$"), "v1"),
+    (
+        re.compile(r"^/api/v1/namespaces/(?P<ns>[^/]+)/(?P<plural>[^/]+)(?:/(?P<name>[^/]+))?$"),
+        "v1",
+    ),
+    (
+        re.compile(
+            r"^/apis/(?P<gv>[^/]+/[^/]+)/namespaces/(?P<ns>[^/]+)/(?P<plural>[^/]+)"
+            r"(?:/(?P<name>[^/]+))?$"
+        ),
+        None,
+    ),
+    (re.compile(r"^/apis/(?P<gv>[^/]+/[^/]+)/(?P<plural>[^/]+)(?:/(?P<name>[^/]+))?$"), None),
+]
+
+
+def timestamp():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def mergePatch(target, patch):
+    """Applies a JSON merge patch (RFC 7386) to target in place"""
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            mergePatch(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
+def selectorMatch(obj, labelSelector, fieldSelector):
+    """Returns whether obj matches the equality based label and field selectors"""
+    labels = obj["metadata"].get("labels") or {}
+    for term in filter(None, (labelSelector or "").split(",")):
+        key, op, value = re.match(r"^([^!=]+)(!=|==|=)?(.*)$", term).groups()
+        if op is None and key not in labels:
+            return False
+        elif op == "!=" and labels.get(key) == value:
+            return False
+        elif op in ["=", "=="] and labels.get(key) != value:
+            return False
+    fields = {"metadata.name": obj["metadata"]["name"]}
+    fields["metadata.namespace"] = obj["metadata"].get("namespace")
+    for term in filter(None, (fieldSelector or "").split(",")):
+        key, op, value = re.match(r"^([^!=]+)(!=|==|=)(.*)$", term).groups()
+        if (fields.get(key) == value) != (op != "!="):
+            return False
+    return True
+
+
+class MockKube:
+    """An in-memory Kubernetes API server of custom resources (namespace scoped astra.netapp.io/v1
+    applications, appvaults, backups, snapshots, restores, exechooks, schedules, etc.), plus core
+    namespaces, secrets, and storage classes.
+
+    Lists honor equality based label and field selectors, and limit/continue pagination. Every
+    change is recorded with a new resourceVersion, which watches (watch=true) stream from.
+    The status.state of a newly created custom resource follows transitions[plural] (a list of
+    (seconds after creation, state) tuples, see DEFAULT_TRANSITIONS), and the time every resource
+    reached a state in FINAL_STATES is kept in self.finished. Every request sleeps for latency
+    seconds, and is counted by method, path template, and whether it was a watch, in
+    self.requests (see reset()), with the response bytes in self.bytes."""
+
+    def __init__(self, latency=0, transitions=None):
+        self.latency = latency
+        self.transitions = DEFAULT_TRANSITIONS if transitions is None else transitions
+        self.objects = {}
+        self.events = []
+        self.resourceVersion = 0
+        self.finished = {}
+        self.requests, self.bytes = Counter(), Counter()
+        self.changed = threading.Condition()
+        self.scheduled, self.sequence = [], itertools.count()
+        self.scheduler = None
+        self.random = random.Random(0)
+
+    def reset(self):
+        """Returns and clears the (requests, bytes) counts of the requests served so far"""
+        with self.changed:
+            counts = (self.requests, self.bytes)
+            self.requests, self.bytes = Counter(), Counter()
+        return counts
+
+    def collectionKey(self, groupVersion, namespace, plural):
+        # Cluster scoped kinds are stored without a namespace, whatever the request path
+        if plural in ["namespaces", "storageclasses"]:
+            namespace = None
+        return (groupVersion, namespace, plural)
+
+    def record(self, key, eventType, obj):
+        """Stores (or removes) obj with a new resourceVersion, and wakes up any watches. The
+        caller must hold self.changed."""
+        self.resourceVersion += 1
+        obj["metadata"]["resourceVersion"] = str(self.resourceVersion)
+        if eventType == "DELETED":
+            self.objects.get(key, {}).pop(obj["metadata"]["name"], None)
+        else:
+            self.objects.setdefault(key, {})[obj["metadata"]["name"]] = obj
+        state = (obj.get("status") or {}).get("state")
+        if state in FINAL_STATES and (key, obj["metadata"]["name"]) not in self.finished:
+            self.finished[(key, obj["metadata"]["name"])] = time.monotonic()
+        self.events.append((self.resourceVersion, key, eventType, copy.deepcopy(obj)))
+        self.changed.notify_all()
+
+    def create(self, groupVersion, namespace, plural, body, dryRun=False):
+        """Returns the (status, object) of creating body"""
+        key = self.collectionKey(groupVersion, namespace, plural)
+        obj = copy.deepcopy(body)
+        meta = obj.setdefault("metadata", {})
+        with self.changed:
+            if not meta.get("name") and meta.get("generateName"):
+                while not meta.get("name") or meta["name"] in self.objects.get(key, {}):
+                    suffix = self.random.choices(string.ascii_lowercase + string.digits, k=5)
+                    meta["name"] = meta["generateName"] + "".join(suffix)
+            if not meta.get("name"):
+                return 422, self.status(422, "Invalid", "metadata.name: Required value")
+            if meta["name"] in self.objects.get(key, {}):
+                return 409, self.status(409, "AlreadyExists", f"{plural} {meta['name']} exists")
+            obj.setdefault("apiVersion", groupVersion)
+            obj.setdefault("kind", KINDS.get(plural, plural[:-1].capitalize()))
+            meta["uid"] = str(uuid.UUID(int=self.random.getrandbits(128)))
+            meta["creationTimestamp"] = timestamp()
+            if key[1]:
+                meta["namespace"] = key[1]
+            if dryRun:
+                return 201, obj
+            transitions = self.transitions.get(plural, []) if groupVersion != "v1" else []
+            if transitions and transitions[0][0] <= 0:
+                obj.setdefault("status", {})["state"] = transitions[0][1]
+                transitions = transitions[1:]
+            self.record(key, "ADDED", obj)
+            for delay, state in transitions:
+                self.schedule(delay, key, meta["name"], state)
+            return 201, copy.deepcopy(obj)
+
+    def schedule(self, delay, key, name, state):
+        """Sets the status.state of the name object to state in delay seconds. The caller must hold
+        self.changed."""
+        heapq.heappush(
+            self.scheduled, (time.monotonic() + delay, next(self.sequence), key, name, state)
+        )
+        if self.scheduler is None:
+            self.scheduler = threading.Thread(target=self.runTransitions, daemon=True)
+            self.scheduler.start()
+        self.changed.notify_all()
+
+    def runTransitions(self):
+        with self.changed:
+            while True:
+                if not self.scheduled:
+                    self.changed.wait()
+                    continue
+                when, _, key, name, state = self.scheduled[0]
+                if when > time.monotonic():
+                    self.changed.wait(when - time.monotonic())
+                    continue
+                heapq.heappop(self.scheduled)
+                obj = self.objects.get(key, {}).get(name)
+                if obj is not None:
+                    obj = copy.deepcopy(obj)
+                    obj.setdefault("status", {})["state"] = state
+                    self.record(key, "MODIFIED", obj)
+
+    def populate(self, plural, count, factory, namespace="astra-connector", groupVersion=ASTRA):
+        """Creates count objects of plural, where factory(i) returns the i-th object (status
+        transitions aren't applied, so the objects keep the status they're given)"""
+        key = self.collectionKey(groupVersion, namespace, plural)
+        with self.changed:
+            for i in range(count):
+                obj = factory(i)
+                obj.setdefault("apiVersion", groupVersion)
+                obj.setdefault("kind", KINDS.get(plural, plural[:-1].capitalize()))
+                meta = obj["metadata"]
+                meta.setdefault("uid", str(uuid.UUID(int=self.random.getrandbits(128))))
+                meta.setdefault("creationTimestamp", timestamp())
+                if key[1]:
+                    meta["namespace"] = key[1]
+                self.record(key, "ADDED", obj)
+
+    def status(self, code, reason, message):
+        return {
+            "kind": "Status",
+            "apiVersion": "v1",
+            "metadata": {},
+            "status": "Failure" if code >= 400 else "Success",
+            "message": message,
+            "reason": reason,
+            "code": code,
+        }
+
+    def matching(self, groupVersion, namespace, plural, query):
+        """Returns the objects of a collection (or of every namespace if namespace is None) which
+        match the selectors of query. The caller must hold self.changed."""
+        objects = []
+        for (gv, ns, p), collection in self.objects.items():
+            if gv == groupVersion and p == plural and (namespace is None or ns == namespace):
+                objects.extend(collection.values())
+        return [
+            obj
+            for obj in objects
+            if selectorMatch(obj, query.get("labelSelector"), query.get("fieldSelector"))
+        ]
+
+    def list(self, groupVersion, namespace, plural, query):
+        key = self.collectionKey(groupVersion, namespace, plural)
+        with self.changed:
+            items = self.matching(groupVersion, key[1], plural, query)
+            meta = {"resourceVersion": str(self.resourceVersion)}
+            start = int(query.get("continue") or 0)
+            if query.get("limit"):
+                end = start + int(query["limit"])
+                if end < len(items):
+                    meta["continue"] = str(end)
+                    meta["remainingItemCount"] = len(items) - end
+                items = items[start:end]
+            else:
+                items = items[start:]
+            kind = KINDS.get(plural, plural[:-1].capitalize())
+            return 200, {
+                "apiVersion": groupVersion,
+                "kind": f"{kind}List",
+                "metadata": meta,
+                "items": copy.deepcopy(items),
+            }
+
+    def handle(self, method, path, body=None):
+        """Returns the (status, response dict) of a request, or (200, generator of watch events)
+        for a watch, and counts the request"""
+        url = urlsplit(path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        for pattern, groupVersion in PATHS:
+            match = pattern.match(url.path)
+            if match:
+                break
+        else:
+            return 404, self.status(404, "NotFound", f"{url.path} not found")
+        groupVersion = groupVersion or match.group("gv")
+        namespace = match.groupdict().get("ns")
+        plural, name = match.group("plural"), match.group("name")
+        watch = (query.get("watch") or "").lower() in ["true", "1"]
+        template = (
+            f"/apis/{groupVersion}" if groupVersion != "v1" else "/api/v1"
+        ) + f"/{plural}{'/{name}' if name else ''}{' (watch)' if watch else ''}"
+        with self.changed:
+            self.requests[f"{method} {template}"] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+        key = self.collectionKey(groupVersion, namespace, plural)
+        if method == "GET" and watch:
+            return 200, self.watch(groupVersion, key[1], plural, query)
+        elif method == "GET" and not name:
+            return self.list(groupVersion, namespace, plural, query)
+        elif method == "POST" and not name:
+            return self.create(groupVersion, namespace, plural, body or {}, "dryRun" in query)
+        with self.changed:
+            obj = self.objects.get(key, {}).get(name)
+            if obj is None:
+                return 404, self.status(404, "NotFound", f'{plural} "{name}" not found')
+            elif method == "GET":
+                return 200, copy.deepcopy(obj)
+            elif method == "DELETE":
+                if "dryRun" not in query:
+                    self.record(key, "DELETED", copy.deepcopy(obj))
+                return 200, copy.deepcopy(obj)
+            elif method in ["PATCH", "PUT"] and isinstance(body, dict):
+                obj = copy.deepcopy(obj)
+                if method == "PUT":
+                    obj = {**body, "metadata": {**body.get("metadata", {}), **obj["metadata"]}}
+                else:
+                    mergePatch(obj, body)
+                if "dryRun" not in query:
+                    self.record(key, "MODIFIED", obj)
+                return 200, copy.deepcopy(obj)
+        return 405, self.status(405, "MethodNotAllowed", f"{method} is not supported")
+
+    def watch(self, groupVersion, namespace, plural, query):
+        """Generator of the watch events (after query's resourceVersion, or every matching
+        object as ADDED if it has none) until timeoutSeconds pass"""
+        deadline = time.monotonic() + int(query.get("timeoutSeconds") or 1800)
+        with self.changed:
+            if query.get("resourceVersion") in [None, "", "0"]:
+                since = self.resourceVersion
+                initial = copy.deepcopy(self.matching(groupVersion, namespace, plural, query))
+            else:
+                since, initial = int(query["resourceVersion"]), []
+        for obj in initial:
+            yield {"type": "ADDED", "object": obj}
+        position = 0
+        while True:
+            with self.changed:
+                while position < len(self.events) and self.events[position][0] <= since:
+                    position += 1
+                pending = self.events[position:]
+                position = len(self.events)
+                if not pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return
+                    self.changed.wait(remaining)
+                    continue
+            for rv, (gv, ns, p), eventType, obj in pending:
+                since = rv
+                if (
+                    gv == groupVersion
+                    and p == plural
+                    and (namespace is None or ns == namespace)
+                    and selectorMatch(obj, query.get("labelSelector"), query.get("fieldSelector"))
+                ):
+                    yield {"type": eventType, "object": obj}
+
+
+class MockKubeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and body are written separately, which would otherwise wait on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def count(self, method, sent):
+        """Adds sent to the response bytes of method, before the bytes are written (so a client
+        which has read the response and then calls reset() always sees them)"""
+        with self.server.mock.changed:
+            self.server.mock.bytes[method] += sent
+
+    def respond(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else None
+        status, payload = self.server.mock.handle(method, self.path, body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if isinstance(payload, dict):
+            content = json.dumps(payload).encode("utf-8")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.count(method, len(content))
+            self.wfile.write(content)
+        else:
+            # A watch, with one event per line in chunked encoding
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            try:
+                for event in payload:
+                    line = json.dumps(event).encode("utf-8") + b"\n"
+                    self.count(method, len(line))
+                    self.wfile.write(f"{len(line):x}\r\n".encode("ascii") + line + b"\r\n")
+                self.wfile.write(b"0\r\n\r\n")
+            except (BrokenPipeError, ConnectionResetError):
+                payload.close()
+                self.close_connection = True
+
+    def do_GET(self):
+        self.respond("GET")
+
+    def do_POST(self):
+        self.respond("POST")
+
+    def do_PUT(self):
+        self.respond("PUT")
+
+    def do_PATCH(self):
+        self.respond("PATCH")
+
+    def do_DELETE(self):
+        self.respond("DELETE")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockKubeServer(ThreadingHTTPServer):
+    """Serves a MockKube over plain http on host:port (port 0 picks a free port) from a
+    background thread, once started with start()"""
+
+    daemon_threads = True
+
+    def __init__(self, mock, host="127.0.0.1", port=0):
+        super().__init__((host, port), MockKubeHandler)
+        self.mock = mock
+        self.thread = None
+
+    @property
+    def address(self):
+        return f"{self.server_address[0]}:{self.server_address[1]}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def writeKubeconfig(self, path, context="mockkube"):
+        """Writes a kubeconfig of this server to path, and returns the toolkit's --v3
+        context@config_file for it"""
+        with open(path, "w") as f:
+            f.write(
+                "apiVersion: v1\nkind: Config\n"
+                f"clusters:\n- cluster: {{server: 'http://{self.address}'}}\n  name: {context}\n"
+                f"contexts:\n- context: {{cluster: {context}, user: {context}}}\n"
+                f"  name: {context}\n"
+                f"current-context: {context}\n"
+                f"users:\n- name: {context}\n  user: {{token: placeholder}}\n"
+            )
+        return f"{context}@{path}"
+
+
+def populate(mock, count, namespace="astra-connector"):
+    """Fills mock with count backups, snapshots, namespaces, and secrets, and one application,
+    exechook, and schedule per 10 of them (each app has 10 backups and snapshots), plus 2
+    appvaults and 3 storage classes"""
+    apps = max(1, count // 10)
+
+    def appRef(i):
+        return {"app": f"app-{i % apps}", "tier": ["gold", "silver", "bronze"][i % apps % 3]}
+
+    mock.populate(
+        "applications",
+        apps,
+        lambda i: {
+            "metadata": {"name": f"app-{i}", "labels": appRef(i)},
+            "spec": {"includedNamespaces": [{"namespace": f"ns-{i}"}]},
+            "status": {"conditions": [{"type": "Ready", "status": "True"}]},
+        },
+        namespace,
+    )
+    mock.populate(
+        "appvaults",
+        2,
+        lambda i: {
+            "metadata": {"name": f"vault-{i}"},
+            "spec": {"providerType": "generic-s3", "providerConfig": {"bucketName": f"b{i}"}},
+            "status": {"state": "available"},
+        },
+        namespace,
+    )
+    for plural, prefix in [("backups", "bkp"), ("snapshots", "snap")]:
+        mock.populate(
+            plural,
+            count,
+            lambda i, prefix=prefix: {
+                "metadata": {"name": f"{prefix}-{i}", "labels": appRef(i)},
+                "spec": {"applicationRef": f"app-{i % apps}", "appVaultRef": "vault-0"},
+                "status": {"state": "Completed", "completionTimestamp": timestamp()},
+            },
+            namespace,
+        )
+    for plural, spec in [
+        ("exechooks", {"action": "snapshot", "stage": "pre", "hookSource": "IyEvYmluL3No"}),
+        ("schedules", {"granularity": "hourly", "minute": "0", "backupRetention": "2"}),
+    ]:
+        mock.populate(
+            plural,
+            apps,
+            lambda i, plural=plural, spec=spec: {
+                "metadata": {"name": f"{plural[:-1]}-{i}", "labels": appRef(i)},
+                "spec": {"applicationRef": f"app-{i}", **spec},
+            },
+            namespace,
+        )
+    mock.populate(
+        "namespaces",
+        count,
+        lambda i: {
+            "metadata": {
+                "name": f"ns-{i}",
+                "annotations": {"managed-by-astra-application": f"app-{i}"} if i < apps else {},
+            },
+            "spec": {"finalizers": ["kubernetes"]},
+            "status": {"phase": "Active"},
+        },
+        groupVersion="v1",
+    )
+    mock.populate(
+        "secrets",
+        count,
+        lambda i: {
+            "metadata": {"name": f"secret-{i}"},
+            "type": "Opaque",
+            "data": {"accessKeyID": "cGxhY2Vob2xkZXI=", "secretAccessKey": "cGxhY2Vob2xkZXI="},
+        },
+        namespace,
+        groupVersion="v1",
+    )
+    mock.populate(
+        "storageclasses",
+        3,
+        lambda i: {
+            "metadata": {"name": ["ontap-gold", "ontap-silver", "ontap-nas"][i]},
+            "provisioner": "csi.trident.netapp.io",
+            "reclaimPolicy": "Delete",
+            "volumeBindingMode": "Immediate",
+        },
+        groupVersion="storage.k8s.io/v1",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock Kubernetes API over http")
+    parser.add_argument("-p", "--port", type=int, default=8081, help="port to listen on")
+    parser.add_argument(
+        "-n", "--count", type=int, default=1000, help="backups, snapshots, namespaces and secrets"
+    )
+    parser.add_argument("-l", "--latency", type=float, default=0, help="seconds per request")
+    parser.add_argument(
+        "-k", "--kubeconfig", default="mockkube.kubeconfig", help="kubeconfig file to write"
+    )
+    args = parser.parse_args()
+
+    mock = MockKube(latency=args.latency)
+    populate(mock, args.count)
+    server = MockKubeServer(mock, port=args.port)
+    context = server.writeKubeconfig(args.kubeconfig)
+    print(f"Serving {args.count} backups at http://{server.address}, run: actoolkit --v3 {context}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    requests, _ = mock.reset()
+    for request, count in sorted(requests.items()):
+        print(f"{count:>8}  {request}")
+
+
+if __name__ == "__main__":
+    main()
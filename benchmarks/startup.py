@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Imports every astraSDK and tkSrc module (plus kubernetes) and builds the entire parser tree up
+# front, which is how the toolkit started up prior to lazy imports and lazy parser construction
+EAGER = """
+import sys
+import kubernetes, astraSDK, tkSrc, toolkit
+for pkg in (astraSDK, tkSrc):
+    for name in pkg.__all__:
+        getattr(pkg, name)
+tkSrc.parser.ToolkitParser(tkSrc.classes.ArgparseChoicesLists()).main()
+toolkit.main(argv=sys.argv)
+"""
+
+
+def timeCommand(cmd, env, runs):
+    """Returns the wall times (in seconds) of running cmd in a new process runs times"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=REPO, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def importTime(module, env):
+    """Returns the cumulative import time (in seconds) of module as reported by -X importtime"""
+    ret = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    for line in ret.stderr.splitlines():
+        fields = [f.strip() for f in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000000
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the toolkit's cold start time")
+    parser.add_argument("-r", "--runs", type=int, default=10, help="runs per command")
+    parser.add_argument(
+        "command",
+        nargs="*",
+        default=["-f", "list", "apps", "-h"],
+        help="toolkit arguments to time (default: %(default)s, which exercises the full startup "
+        "path without making any API calls)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as confDir:
+        # A placeholder config.yaml, as getConfig() runs before the parser; no calls are made
+        with open(os.path.join(confDir, "config.yaml"), "w") as f:
+            f.write(
+                "headers:\n  Authorization: Bearer placeholder\n"
+                "uid: 00000000-0000-0000-0000-000000000000\n"
+                "astra_project: astra.example.com\n"
+            )
+        env = dict(os.environ, ASTRATOOLKITS_CONF=confDir, PYTHONDONTWRITEBYTECODE="1")
+
+        results = {
+            "lazy": timeCommand([sys.executable, "toolkit.py"] + args.command, env, args.runs),
+            "eager": timeCommand(
+                [sys.executable, "-c", EAGER, "toolkit.py"] + args.command, env, args.runs
+            ),
+        }
+        print(f"actoolkit {' '.join(args.command)} ({args.runs} runs)")
+        for name, times in results.items():
+            print(
+                f"  {name:<6} median: {statistics.median(times):.3f}s  "
+                f"min: {min(times):.3f}s  max: {max(times):.3f}s"
+            )
+        speedup = statistics.median(results["eager"]) / statistics.median(results["lazy"])
+        print(f"  speedup: {speedup:.2f}x")
+        print(f"import toolkit: {importTime('toolkit', env):.3f}s")
+        print(f"import kubernetes: {importTime('kubernetes', env):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import textwrap
+import time
+
+from tabulate import tabulate
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from astraSDK.common import BaseCommon  # noqa: E402
+from astraSDK.k8s import getResources  # noqa: E402
+
+PLURALS = ["applications", "appvaults", "backups", "exechooks"]
+
+
+class LegacyCommon(BaseCommon):
+    """BaseCommon's recursiveGet and basicTable prior to compiled key paths, which parse the key
+    path (via many str.split calls) at every level of every lookup"""
+
+    def recursiveGet(self, k, item, conCatList=None):
+        if len(k.split(".")) > 1 and k.split(".")[0] == "":
+            return self.recursiveGet(k.split(".", 1)[1], item, conCatList)
+        elif (len(k.split(".")) > 1 and len(k.split("[]")) == 1) or (
+            len(k.split(".")[0]) < len(k.split("[]")[0])
+        ):
+            if k.split(".")[0] == "*":
+                return self.recursiveGet(k.split(".", 1)[1], item[next(iter(item))], conCatList)
+            elif k.split(".")[0] == "KEYS":
+                return self.recursiveGet(
+                    k.split(".", 1)[1], item[k.split(".")[0]].keys(), conCatList
+                )
+            try:
+                return self.recursiveGet(k.split(".", 1)[1], item[k.split(".")[0]], conCatList)
+            except KeyError:
+                return "None"
+        elif (len(k.split("[]")) > 1 and len(k.split(".")) == 1) or (
+            len(k.split("[]")[0]) < len(k.split(".")[0])
+        ):
+            if conCatList is None:
+                conCatList = []
+            for i in item[k.split("[]")[0]]:
+                if add := self.recursiveGet(k.split("[]", 1)[1], i, []):
+                    conCatList.append(add)
+            return ", ".join(conCatList)
+        if k == "KEYS":
+            return list(item.keys())
+        elif k == "*":
+            return item[next(iter(item))]
+        elif isinstance(item, dict) and isinstance(item.get(k), dict):
+            return str(item.get(k))
+        elif isinstance(item, dict):
+            return item.get(k)
+        return ""
+
+    def basicTable(self, tabHeader, tabKeys, dataDict, tablefmt="grid"):
+        tabData = []
+        for item in dataDict["items"]:
+            row = [self.recursiveGet(k, item, []) for k in tabKeys]
+            for c, r in enumerate(row):
+                if type(r) is list:
+                    row[c] = ", ".join(r)
+            row = [textwrap.fill(r, width=80) if isinstance(r, str) else r for r in row]
+            tabData.append(row)
+        return tabulate(tabData, tabHeader, tablefmt=tablefmt)
+
+
+def generateCRs(plural, count):
+    """Returns a list response of count synthetic custom resources of the plural kind"""
+    items = []
+    for i in range(count):
+        item = {
+            "metadata": {
+                "name": f"{plural}-{i}",
+                "namespace": "astra-connector",
+                "creationTimestamp": "2024-01-01T00:00:00Z",
+            },
+            "spec": {
+                "applicationRef": f"app-{i % 100}",
+                "appVaultRef": f"vault-{i % 3}",
+                "includedNamespaces": [
+                    {"namespace": f"ns-{i}-{n}", "labelSelector": {"matchLabels": {"app": "db"}}}
+                    for n in range(2)
+                ],
+                "providerCredentials": {"accountKey": {"valueFromSecret": {"name": "s3-creds"}}},
+                "providerType": "aws",
+                "stage": "pre",
+                "action": "snapshot",
+                "arguments": ["--quiesce"],
+                "matchingCriteria": [{"type": "containerImage", "value": "mariadb"}],
+            },
+            "status": {
+                "state": "Completed",
+                "conditions": [{"type": "Ready"}, {"type": "Protected"}],
+            },
+        }
+        items.append(item)
+    return {"apiVersion": "v1", "items": items, "kind": "List"}
+
+
+def timeCall(func, runs):
+    """Returns the wall times (in seconds) of calling func runs times"""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the rendering of custom resource tables"
+    )
+    parser.add_argument("-r", "--runs", type=int, default=5, help="runs per plural")
+    parser.add_argument("-n", "--count", type=int, default=10000, help="custom resources per table")
+    args = parser.parse_args()
+
+    legacy, compiled = LegacyCommon(), BaseCommon()
+    print(f"basicTable of {args.count} custom resources ({args.runs} runs)")
+    for plural in PLURALS:
+        resp = generateCRs(plural, args.count)
+        headers = getResources.getTableInfo(None, plural, headers=True)
+        keys = getResources.getTableInfo(None, plural)
+        if legacy.basicTable(headers, keys, resp) != compiled.basicTable(headers, keys, resp):
+            raise SystemExit(f"{plural}: compiled key paths rendered a different table")
+        results = {}
+        for name, common in (("before", legacy), ("after", compiled)):
+            results[name] = {
+                "lookups": timeCall(
+                    lambda: [[common.recursiveGet(k, i, []) for k in keys] for i in resp["items"]],
+                    args.runs,
+                ),
+                "table": timeCall(lambda: common.basicTable(headers, keys, resp), args.runs),
+            }
+        print(f"  {plural}")
+        for stage in ("lookups", "table"):
+            before = statistics.median(results["before"][stage])
+            after = statistics.median(results["after"][stage])
+            print(
+                f"    {stage:<8} before: {before:.3f}s  after: {after:.3f}s  "
+                f"speedup: {before / after:.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -9,12 +9,13 @@ with open("requirements.txt", "r") as req:
 
 setuptools.setup(
     name="actoolkit",
-    py_modules=["toolkit"],
+    py_modules=["toolkit", "toolkitd"],
     packages=["astraSDK", "tkSrc", "tkSrc.templates.jinja"],
     include_package_data=True,
     use_scm_version=True,
     setup_requires=["setuptools_scm"],
     install_requires=all_reqs,
+    extras_require={"fast": ["orjson>=3.8.0"]},
     author="Michael Haigh",
     author_email="Michael.Haigh@netapp.com",
     description="Toolkit and SDK for interacting with Astra Control",
@@ -25,6 +26,8 @@ setuptools.setup(
     entry_points={
         "console_scripts": [
             "actoolkit=toolkit:main",
+            "actoolkitc=toolkitd:client",
+            "actoolkitd=toolkitd:main",
         ]
     },
     classifiers=[
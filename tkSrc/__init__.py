@@ -14,17 +14,33 @@
    limitations under the License.
 """
 
-from . import classes
-from . import clone
-from . import choices
-from . import copy
-from . import create
-from . import deploy
-from . import destroy
-from . import helpers
-from . import ipr
-from . import list
-from . import manage
-from . import parser
-from . import unmanage
-from . import update
+import importlib
+
+# Submodules are imported the first time they're accessed (astraSDK.apps, tkSrc.list, etc.), so
+# that each command only pays the import cost of the modules it actually uses
+__all__ = [
+    "classes",
+    "clone",
+    "choices",
+    "copy",
+    "create",
+    "deploy",
+    "destroy",
+    "helpers",
+    "ipr",
+    "list",
+    "manage",
+    "parser",
+    "unmanage",
+    "update",
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
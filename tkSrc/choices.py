@@ -16,8 +16,11 @@
 """
 
 
-import kubernetes
+import json
+import os
 import sys
+import threading
+import time
 
 import astraSDK
 from tkSrc import helpers
@@ -25,12 +28,222 @@ from tkSrc import helpers
 RED = "\033[31m"
 ENDC = "\033[0m"
 
+# Number of seconds a cached collection is valid for, 0 disables the cache
+DEFAULT_CACHE_TTL = 300
+# The on-disk layout of the cache, older layouts are ignored (and replaced on the next write)
+CACHE_VERSION = 2
+# These collections are never cached: credentials (and kubernetes secrets) hold sensitive data,
+# and kubernetes namespaces and storage classes contain datetimes
+UNCACHED_RESOURCES = ["credentials"]
+UNCACHED_V3_RESOURCES = ["credentials", "namespaces", "storageClasses"]
+# The cached collections which each command (or command and objectType) may change, any other
+# command which isn't a list/get drops every cached collection of its account or context
+MUTATED_COLLECTIONS = {
+    "clone": ["apps", "namespaces"],
+    "restore": ["apps", "namespaces"],
+    "ipr": ["apps"],
+    "copy asup": [],
+    "copy hooks": ["hooks"],
+    "copy protections": ["protections"],
+    "create asup": ["asups"],
+    "create backup": ["backups", "snapshots"],
+    "create cluster": ["clusters", "namespaces", "storageClasses"],
+    "create group": ["groups"],
+    "create hook": ["hooks"],
+    "create ldap": [],
+    "create protection": ["protections"],
+    "create replication": ["apps", "replications"],
+    "create script": ["scripts"],
+    "create snapshot": ["snapshots"],
+    "create user": ["users"],
+    "manage app": ["apps", "namespaces"],
+    "manage bucket": ["buckets"],
+    "manage cloud": ["clouds", "clusters"],
+    "manage cluster": ["clusters", "connectors", "namespaces", "storageClasses"],
+    "manage ldap": [],
+    "destroy backup": ["backups"],
+    "destroy cluster": ["clusters", "namespaces", "storageClasses"],
+    "destroy credential": [],
+    "destroy group": ["groups"],
+    "destroy hook": ["hooks"],
+    "destroy ldap": [],
+    "destroy protection": ["protections"],
+    "destroy replication": ["replications"],
+    "destroy script": ["scripts"],
+    "destroy snapshot": ["snapshots"],
+    "destroy user": ["users"],
+    "unmanage app": ["apps", "backups", "hooks", "namespaces", "protections", "snapshots"],
+    "unmanage bucket": ["buckets"],
+    "unmanage cloud": ["clouds", "clusters"],
+    "unmanage cluster": ["apps", "clusters", "connectors", "namespaces", "storageClasses"],
+    "unmanage ldap": [],
+    "update bucket": ["buckets"],
+    "update cloud": ["clouds"],
+    "update cluster": ["clusters"],
+    "update protection": ["protections"],
+    "update replication": ["apps", "replications"],
+    "update script": ["scripts"],
+}
+# subcommand and objectType aliases, mapped to the names used in MUTATED_COLLECTIONS
+COMMAND_ALIASES = {
+    "appVault": "bucket",
+    "application": "app",
+    "define": "manage",
+    "exechook": "hook",
+    "schedule": "protection",
+    "secret": "credential",
+}
 
-def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, config=None):
+
+def cacheFile():
+    """Returns the path of the on-disk choices cache, honoring XDG_CACHE_HOME"""
+    cacheHome = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cacheHome, "astra-toolkits", "choices.json")
+
+
+def cacheTTL():
+    """Returns the choices cache TTL (in seconds) from the ASTRATOOLKITS_CHOICES_TTL shell env
+    var, or DEFAULT_CACHE_TTL if it is not set or is invalid"""
+    try:
+        return max(int(os.environ.get("ASTRATOOLKITS_CHOICES_TTL", DEFAULT_CACHE_TTL)), 0)
+    except ValueError:
+        return DEFAULT_CACHE_TTL
+
+
+def cacheIdentity(v3, config):
+    """Returns the string which identifies the Astra Control account or kubeconfig context the
+    cached collections belong to, or None if there isn't one"""
+    if v3:
+        return v3 if type(v3) is str else None
+    if config and config.get("domain") and config.get("account_id"):
+        return f"{config['domain']}/{config['account_id']}"
+    return None
+
+
+def readCache():
+    try:
+        with open(cacheFile(), encoding="utf8") as f:
+            cache = json.load(f)
+        if type(cache) is dict and cache.get("version") == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {"version": CACHE_VERSION}
+
+
+def writeCache(cache):
+    """Atomically (via a rename) writes the cache to disk, silently ignoring any failures, as the
+    cache is only an optimization"""
+    path = cacheFile()
+    tmpPath = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # The cache holds API responses, so only the user may read it
+        fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "w", encoding="utf8") as f:
+            json.dump(cache, f)
+        os.replace(tmpPath, path)
+    except OSError:
+        try:
+            os.remove(tmpPath)
+        except OSError:
+            pass
+
+
+def mutatedCollections(subcommand, objectType=None):
+    """Returns the cached collections which a command may have created, modified, or deleted
+    resources of, or None if it may have changed any of them"""
+    if subcommand in ["list", "get"]:
+        return []
+    subcommand = COMMAND_ALIASES.get(subcommand, subcommand)
+    if subcommand in MUTATED_COLLECTIONS:
+        return MUTATED_COLLECTIONS[subcommand]
+    objectType = COMMAND_ALIASES.get(objectType, objectType)
+    return MUTATED_COLLECTIONS.get(f"{subcommand} {objectType}")
+
+
+def invalidateCache(identity, collections=None):
+    """Removes the cached collections (all of them if None) of an identity, which must be called
+    after any command which may have created, modified, or deleted a resource"""
+    if not identity or collections == []:
+        return
+    cache = readCache()
+    if identity not in cache:
+        return
+    if collections is None:
+        del cache[identity]
+    elif all([cache[identity].pop(name, None) is None for name in collections]):
+        return
+    writeCache(cache)
+
+
+class CollectionCache:
+    """The on-disk cache of the collections main() fetches for an identity. Each collection is
+    stored under its name and the arguments it was fetched with (for instance the snapshots of a
+    single app), so any command which needs the same collection reuses it for cacheTTL() seconds,
+    and a command which changes resources only drops the collections it could have changed (see
+    mutatedCollections). Failed fetches and the UNCACHED_RESOURCES are never stored."""
+
+    def __init__(self, identity, v3, ttl):
+        self.identity = identity if ttl else None
+        self.ttl = ttl
+        self.uncached = UNCACHED_V3_RESOURCES if v3 else UNCACHED_RESOURCES
+        self.cache = readCache() if self.identity else {}
+        self.changed = False
+
+    def get(self, name, fetch, **params):
+        """Returns the cached name collection fetched with params, calling fetch() to get (and
+        cache) it if it isn't cached or has expired"""
+        if not self.identity or name in self.uncached:
+            return fetch()
+        key = json.dumps(params, sort_keys=True)
+        entries = self.cache.setdefault(self.identity, {}).setdefault(name, {})
+        entry = entries.get(key)
+        if entry and 0 <= time.time() - entry.get("time", 0) < self.ttl:
+            return entry["value"]
+        value = fetch()
+        # Failed calls return False, which we don't want to hold on to until the TTL expires
+        if value is not False and value is not None:
+            entries[key] = {"time": time.time(), "value": value}
+            self.changed = True
+        return value
+
+    def shared(self, context, name, fetch):
+        """get() for the parent collections (apps, clouds, clusters) which the SDK classes share
+        through the config's ResourceContext (context), so that a cached collection is also
+        used by the classes which need it, like getBackups needing every app"""
+        return context.get(name, lambda: self.get(name, fetch))
+
+    def save(self):
+        """Writes any newly fetched collections to disk, dropping the expired ones"""
+        if not self.changed:
+            return
+        now = time.time()
+        for entries in self.cache[self.identity].values():
+            for key in [k for k, e in entries.items() if now - e.get("time", 0) >= self.ttl]:
+                del entries[key]
+        writeCache(self.cache)
+        self.changed = False
+
+
+def cachedMain(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, config=None):
+    """A wrapper around main() which caches the collections it fetches on disk, per Astra Control
+    account or kubeconfig context, for cacheTTL() seconds (see CollectionCache)"""
+    cache = CollectionCache(cacheIdentity(v3, config), v3, cacheTTL())
+    main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify, config, cache=cache)
+    cache.save()
+
+
+def main(
+    argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, config=None, cache=None
+):
     """This function builds the argparse choices lists. To build these lists, a variety of external
     calls need to be made. The results of these calls are stored in ard (an instantiation of
     AstraResourceDicts) so the same call doesn't have to be made again later. The choices lists are
-    stored in acl (an instantiation of ArgparseChoicesLists)"""
+    stored in acl (an instantiation of ArgparseChoicesLists). The calls are made through cache (a
+    CollectionCache), if provided, so collections fetched by a recent command are reused."""
+    if cache is None:
+        cache = CollectionCache(None, v3, 0)
 
     if verbs["deploy"]:
         # This expression translates to "Is there an arg after the verb we found?"
@@ -39,29 +252,45 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                 ard.charts = helpers.updateHelm()
                 acl.charts = ard.buildList("charts", "name")
                 if v3:
-                    ard.buckets = astraSDK.k8s.getResources(
-                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                    ).main("appvaults")
+                    ard.buckets = cache.get(
+                        "buckets",
+                        lambda: astraSDK.k8s.getResources(
+                            config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                        ).main("appvaults"),
+                    )
                     acl.buckets = ard.buildList("buckets", "metadata.name")
             elif argv[verbPosition + 1] == "acp":
-                ard.credentials = astraSDK.k8s.getSecrets(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main(namespace="trident")
+                ard.credentials = cache.get(
+                    "credentials",
+                    lambda: astraSDK.k8s.getSecrets(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main(namespace="trident"),
+                    namespace="trident",
+                )
                 acl.credentials = ard.buildList("credentials", "metadata.name")
 
     elif verbs["clone"] or verbs["restore"]:
         if v3:
-            ard.apps = astraSDK.k8s.getResources(
-                config_context=v3, skip_tls_verify=v3_skip_tls_verify
-            ).main("applications")
+            ard.apps = cache.get(
+                "apps",
+                lambda: astraSDK.k8s.getResources(
+                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                ).main("applications"),
+            )
             acl.apps = ard.buildList("apps", "metadata.name")
             if verbs["restore"]:
-                ard.backups = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("backups")
-                ard.snapshots = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("snapshots")
+                ard.backups = cache.get(
+                    "backups",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("backups"),
+                )
+                ard.snapshots = cache.get(
+                    "snapshots",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("snapshots"),
+                )
                 acl.dataProtections = ard.buildList("backups", "metadata.name") + ard.buildList(
                     "snapshots", "metadata.name"
                 )
@@ -77,51 +306,86 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                         ).api_client
                         is not None
                     ):
-                        ard.storageClasses = astraSDK.k8s.getStorageClasses(
-                            config_context=arg, skip_tls_verify=v3_skip_tls_verify
-                        ).main()
+                        ard.storageClasses = cache.get(
+                            "storageClasses",
+                            lambda: astraSDK.k8s.getStorageClasses(
+                                config_context=arg, skip_tls_verify=v3_skip_tls_verify
+                            ).main(),
+                            context=arg,
+                        )
                         acl.storageClasses = ard.buildList("storageClasses", "metadata.name")
                         break
             else:
-                ard.storageClasses = astraSDK.k8s.getStorageClasses(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main()
+                ard.storageClasses = cache.get(
+                    "storageClasses",
+                    lambda: astraSDK.k8s.getStorageClasses(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main(),
+                )
                 acl.storageClasses = ard.buildList("storageClasses", "metadata.name")
         else:
-            ard.apps = astraSDK.apps.getApps(config=config).main()
+            ard.apps = cache.shared(
+                config["context"], "apps", astraSDK.apps.getApps(config=config).main
+            )
             acl.apps = ard.buildList("apps", "id")
-            ard.destClusters = astraSDK.clusters.getClusters(config=config).main(hideUnmanaged=True)
+            ard.destClusters = cache.get(
+                "clusters",
+                lambda: astraSDK.clusters.getClusters(config=config).main(hideUnmanaged=True),
+                hideUnmanaged=True,
+            )
             acl.destClusters = ard.buildList("destClusters", "id")
             if verbs["restore"]:
-                ard.backups = astraSDK.backups.getBackups(config=config).main()
-                ard.snapshots = astraSDK.snapshots.getSnaps(config=config).main()
+                ard.backups = cache.get(
+                    "backups", lambda: astraSDK.backups.getBackups(config=config).main()
+                )
+                ard.snapshots = cache.get(
+                    "snapshots", lambda: astraSDK.snapshots.getSnaps(config=config).main()
+                )
                 acl.dataProtections = ard.buildList("backups", "id") + ard.buildList(
                     "snapshots", "id"
                 )
             # if the destination cluster has been specified, only show those storage classes
             if (clusterID := list(set(argv) & set(acl.destClusters))) and len(clusterID) == 1:
-                ard.storageClasses = astraSDK.storageclasses.getStorageClasses(config=config).main(
-                    clusterStr=clusterID[0], hideUnmanaged=True
+                ard.storageClasses = cache.get(
+                    "storageClasses",
+                    lambda: astraSDK.storageclasses.getStorageClasses(config=config).main(
+                        clusterStr=clusterID[0], hideUnmanaged=True
+                    ),
+                    cluster=clusterID[0],
+                    hideUnmanaged=True,
                 )
             else:
-                ard.storageClasses = astraSDK.storageclasses.getStorageClasses(config=config).main(
-                    hideUnmanaged=True
+                ard.storageClasses = cache.get(
+                    "storageClasses",
+                    lambda: astraSDK.storageclasses.getStorageClasses(config=config).main(
+                        hideUnmanaged=True
+                    ),
+                    hideUnmanaged=True,
                 )
             acl.storageClasses = list(set(ard.buildList("storageClasses", "name")))
 
     elif verbs["ipr"]:
         if v3:
-            ard.apps = astraSDK.k8s.getResources(
-                config_context=v3, skip_tls_verify=v3_skip_tls_verify
-            ).main("applications")
+            ard.apps = cache.get(
+                "apps",
+                lambda: astraSDK.k8s.getResources(
+                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                ).main("applications"),
+            )
             acl.apps = ard.buildList("apps", "metadata.name")
             if len(argv) - verbPosition >= 2:
-                ard.backups = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("backups")
-                ard.snapshots = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("snapshots")
+                ard.backups = cache.get(
+                    "backups",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("backups"),
+                )
+                ard.snapshots = cache.get(
+                    "snapshots",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("snapshots"),
+                )
                 for a in argv[verbPosition + 1 :]:
                     acl.backups += ard.buildList(
                         "backups", "metadata.name", "spec.applicationRef", a
@@ -130,11 +394,17 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                         "snapshots", "metadata.name", "spec.applicationRef", a
                     )
         else:
-            ard.apps = astraSDK.apps.getApps(config=config).main()
+            ard.apps = cache.shared(
+                config["context"], "apps", astraSDK.apps.getApps(config=config).main
+            )
             acl.apps = ard.buildList("apps", "id")
             if len(argv) - verbPosition >= 2:
-                ard.backups = astraSDK.backups.getBackups(config=config).main()
-                ard.snapshots = astraSDK.snapshots.getSnaps(config=config).main()
+                ard.backups = cache.get(
+                    "backups", lambda: astraSDK.backups.getBackups(config=config).main()
+                )
+                ard.snapshots = cache.get(
+                    "snapshots", lambda: astraSDK.snapshots.getSnaps(config=config).main()
+                )
                 for a in argv[verbPosition + 1 :]:
                     acl.backups += ard.buildList("backups", "id", "appID", a)
                     acl.snapshots += ard.buildList("snapshots", "id", "appID", a)
@@ -150,62 +420,96 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
             or argv[verbPosition + 1] == "snapshot"
         ):
             if v3:
-                ard.apps = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("applications")
+                ard.apps = cache.get(
+                    "apps",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("applications"),
+                )
                 acl.apps = ard.buildList("apps", "metadata.name")
             else:
-                ard.apps = astraSDK.apps.getApps(config=config).main()
+                ard.apps = cache.shared(
+                    config["context"], "apps", astraSDK.apps.getApps(config=config).main
+                )
                 acl.apps = ard.buildList("apps", "id")
             if argv[verbPosition + 1] == "backup" or argv[verbPosition + 1] == "snapshot":
                 if v3:
-                    ard.buckets = astraSDK.k8s.getResources(
-                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                    ).main("appvaults")
+                    ard.buckets = cache.get(
+                        "buckets",
+                        lambda: astraSDK.k8s.getResources(
+                            config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                        ).main("appvaults"),
+                    )
                     acl.buckets = ard.buildList("buckets", "metadata.name")
                 else:
-                    ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+                    ard.buckets = cache.get(
+                        "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+                    )
                     acl.buckets = ard.buildList("buckets", "id")
                 # Generate acl.snapshots if an app was provided
                 if argv[verbPosition + 1] == "backup":
                     for a in argv[verbPosition + 1 :]:
                         if a in acl.apps:
                             if v3:
-                                ard.snapshots = astraSDK.k8s.getResources(
-                                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                                ).main(
+                                ard.snapshots = cache.get(
                                     "snapshots",
-                                    filters=[{"keyFilter": "spec.applicationRef", "valFilter": a}],
+                                    lambda: astraSDK.k8s.getResources(
+                                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                                    ).main(
+                                        "snapshots",
+                                        filters=[
+                                            {"keyFilter": "spec.applicationRef", "valFilter": a}
+                                        ],
+                                    ),
+                                    app=a,
                                 )
                                 acl.snapshots = ard.buildList("snapshots", "metadata.name")
                             else:
-                                ard.snapshots = astraSDK.snapshots.getSnaps(config=config).main(
-                                    appFilter=a
+                                ard.snapshots = cache.get(
+                                    "snapshots",
+                                    lambda: astraSDK.snapshots.getSnaps(config=config).main(
+                                        appFilter=a
+                                    ),
+                                    app=a,
                                 )
                                 acl.snapshots = ard.buildList("snapshots", "id")
             if argv[verbPosition + 1] == "hook" or argv[verbPosition + 1] == "exechook":
                 if not v3:
-                    ard.scripts = astraSDK.scripts.getScripts(config=config).main()
+                    ard.scripts = cache.get(
+                        "scripts", lambda: astraSDK.scripts.getScripts(config=config).main()
+                    )
                     acl.scripts = ard.buildList("scripts", "id")
             if argv[verbPosition + 1] == "protection" or argv[verbPosition + 1] == "schedule":
                 if v3:
-                    ard.buckets = astraSDK.k8s.getResources(
-                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                    ).main("appvaults")
+                    ard.buckets = cache.get(
+                        "buckets",
+                        lambda: astraSDK.k8s.getResources(
+                            config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                        ).main("appvaults"),
+                    )
                     acl.buckets = ard.buildList("buckets", "metadata.name")
                 else:
-                    ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+                    ard.buckets = cache.get(
+                        "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+                    )
                     acl.buckets = ard.buildList("buckets", "id")
             if argv[verbPosition + 1] == "replication":
-                ard.destClusters = astraSDK.clusters.getClusters(config=config).main(
-                    hideUnmanaged=True
+                ard.destClusters = cache.get(
+                    "clusters",
+                    lambda: astraSDK.clusters.getClusters(config=config).main(hideUnmanaged=True),
+                    hideUnmanaged=True,
                 )
                 acl.destClusters = ard.buildList("destClusters", "id")
-                ard.storageClasses = astraSDK.storageclasses.getStorageClasses(config=config).main()
+                ard.storageClasses = cache.get(
+                    "storageClasses",
+                    lambda: astraSDK.storageclasses.getStorageClasses(config=config).main(),
+                )
                 acl.storageClasses = ard.buildList("storageClasses", "name")
                 acl.storageClasses = list(set(acl.storageClasses))
         elif argv[verbPosition + 1] == "cluster":
-            ard.clouds = astraSDK.clouds.getClouds(config=config).main()
+            ard.clouds = cache.shared(
+                config["context"], "clouds", astraSDK.clouds.getClouds(config=config).main
+            )
             for cloud in ard.clouds["items"]:
                 if cloud["cloudType"] not in ["GCP", "Azure", "AWS"]:
                     acl.clouds.append(cloud["id"])
@@ -215,7 +519,9 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                 if rc:
                     acl.clouds.append(rc["id"])
         elif argv[verbPosition + 1] == "user" or argv[verbPosition + 1] == "group":
-            ard.namespaces = astraSDK.namespaces.getNamespaces(config=config).main()
+            ard.namespaces = cache.get(
+                "namespaces", lambda: astraSDK.namespaces.getNamespaces(config=config).main()
+            )
             for namespace in ard.namespaces["items"]:
                 acl.namespaces.append(namespace["id"])
                 if namespace.get("kubernetesLabels"):
@@ -228,10 +534,12 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
 
     elif verbs["copy"]:
         if argv[verbPosition + 1] == "asup":
-            ard.asups = astraSDK.asups.getAsups(config=config).main()
+            ard.asups = cache.get("asups", lambda: astraSDK.asups.getAsups(config=config).main())
             acl.asups = ard.buildList("asups", "id")
         else:
-            ard.apps = astraSDK.apps.getApps(config=config).main()
+            ard.apps = cache.shared(
+                config["context"], "apps", astraSDK.apps.getApps(config=config).main
+            )
             acl.apps = ard.buildList("apps", "id")
             if len(argv) - verbPosition > 2 and argv[verbPosition + 2] in acl.apps:
                 acl.destApps = [x for x in acl.apps if x != argv[verbPosition + 2]]
@@ -240,26 +548,36 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
 
     elif verbs["list"] and len(argv) - verbPosition >= 2:
         if argv[verbPosition + 1] == "assets":
-            ard.apps = astraSDK.apps.getApps(config=config).main()
+            ard.apps = cache.shared(
+                config["context"], "apps", astraSDK.apps.getApps(config=config).main
+            )
             acl.apps = ard.buildList("apps", "id")
 
     elif (verbs["manage"] or verbs["define"]) and len(argv) - verbPosition >= 2:
         if argv[verbPosition + 1] == "app" or argv[verbPosition + 1] == "application":
             if v3:
-                ard.namespaces = astraSDK.k8s.getNamespaces(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main()
+                ard.namespaces = cache.get(
+                    "namespaces",
+                    lambda: astraSDK.k8s.getNamespaces(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main(),
+                )
                 acl.namespaces = ard.buildList("namespaces", "metadata.name")
             else:
-                ard.namespaces = astraSDK.namespaces.getNamespaces(config=config).main()
+                ard.namespaces = cache.get(
+                    "namespaces", lambda: astraSDK.namespaces.getNamespaces(config=config).main()
+                )
                 acl.namespaces = ard.buildList("namespaces", "name")
                 acl.clusters = ard.buildList("namespaces", "clusterID")
                 acl.clusters = list(set(acl.clusters))
         elif argv[verbPosition + 1] == "bucket" or argv[verbPosition + 1] == "appVault":
             if v3:
-                ard.credentials = astraSDK.k8s.getSecrets(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main()
+                ard.credentials = cache.get(
+                    "credentials",
+                    lambda: astraSDK.k8s.getSecrets(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main(),
+                )
                 acl.credentials = ard.buildList("credentials", "metadata.name")
                 for c in argv[verbPosition + 1 :]:
                     if c in acl.credentials:
@@ -270,7 +588,9 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     acl.keys = [i for d in ard.buildList("credentials", "data") for i in d]
                 acl.keys = list(set(acl.keys))
             else:
-                ard.credentials = astraSDK.credentials.getCredentials(config=config).main()
+                ard.credentials = cache.get(
+                    "credentials", lambda: astraSDK.credentials.getCredentials(config=config).main()
+                )
                 if ard.credentials:
                     for credential in ard.credentials["items"]:
                         if credential["metadata"].get("labels"):
@@ -296,7 +616,11 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     acl.clouds.append("123")
                 else:
                     try:
-                        ard.clouds = astraSDK.clouds.getClouds(config=config).main()
+                        ard.clouds = cache.shared(
+                            config["context"],
+                            "clouds",
+                            astraSDK.clouds.getClouds(config=config).main,
+                        )
                         if ard.clouds and ard.clouds.get("items"):
                             for cloud in ard.clouds["items"]:
                                 if cloud["cloudType"] not in ["GCP", "Azure", "AWS"]:
@@ -310,32 +634,48 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                                 acl.clouds.append(rc["id"])
                     except SystemExit:
                         pass
-                ard.credentials = astraSDK.k8s.getSecrets(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main()
+                ard.credentials = cache.get(
+                    "credentials",
+                    lambda: astraSDK.k8s.getSecrets(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main(),
+                )
                 acl.credentials = ard.buildList("credentials", "metadata.name")
             else:
-                ard.clusters = astraSDK.clusters.getClusters(config=config).main()
+                ard.clusters = cache.shared(
+                    config["context"], "clusters", astraSDK.clusters.getClusters(config=config).main
+                )
                 acl.clusters = ard.buildList(
                     "clusters", "id", fKey="managedState", fVal="unmanaged"
                 )
-                ard.storageClasses = astraSDK.storageclasses.getStorageClasses(config=config).main()
+                ard.storageClasses = cache.get(
+                    "storageClasses",
+                    lambda: astraSDK.storageclasses.getStorageClasses(config=config).main(),
+                )
                 for a in argv[verbPosition + 2 :]:
                     acl.storageClasses += ard.buildList("storageClasses", "id", "clusterID", a)
         elif argv[verbPosition + 1] == "cloud":
-            ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+            ard.buckets = cache.get(
+                "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+            )
             acl.buckets = ard.buildList("buckets", "id")
 
     elif verbs["destroy"] and len(argv) - verbPosition >= 2:
         if argv[verbPosition + 1] == "backup" and len(argv) - verbPosition >= 3:
             if v3:
-                ard.apps = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("applications")
+                ard.apps = cache.get(
+                    "apps",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("applications"),
+                )
                 acl.apps = ard.buildList("apps", "metadata.name")
-                ard.backups = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("backups")
+                ard.backups = cache.get(
+                    "backups",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("backups"),
+                )
                 acl.backups = ard.buildList(
                     "backups",
                     "metadata.name",
@@ -343,40 +683,59 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     fVal=argv[verbPosition + 2],
                 )
             else:
-                ard.apps = astraSDK.apps.getApps(config=config).main()
+                ard.apps = cache.shared(
+                    config["context"], "apps", astraSDK.apps.getApps(config=config).main
+                )
                 acl.apps = ard.buildList("apps", "id")
-                ard.backups = astraSDK.backups.getBackups(config=config).main()
+                ard.backups = cache.get(
+                    "backups", lambda: astraSDK.backups.getBackups(config=config).main()
+                )
                 acl.backups = ard.buildList(
                     "backups", "id", fKey="appID", fVal=argv[verbPosition + 2]
                 )
         elif argv[verbPosition + 1] == "cluster" and len(argv) - verbPosition >= 3:
-            ard.clusters = astraSDK.clusters.getClusters(config=config).main()
+            ard.clusters = cache.shared(
+                config["context"], "clusters", astraSDK.clusters.getClusters(config=config).main
+            )
             acl.clusters = ard.buildList("clusters", "id", fKey="managedState", fVal="unmanaged")
         elif (argv[verbPosition + 1] == "credential" or argv[verbPosition + 1] == "secret") and len(
             argv
         ) - verbPosition >= 3:
             if v3:
-                ard.credentials = astraSDK.k8s.getSecrets(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main()
+                ard.credentials = cache.get(
+                    "credentials",
+                    lambda: astraSDK.k8s.getSecrets(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main(),
+                )
                 acl.credentials = ard.buildList("credentials", "metadata.name")
             else:
-                ard.credentials = astraSDK.credentials.getCredentials(config=config).main()
+                ard.credentials = cache.get(
+                    "credentials", lambda: astraSDK.credentials.getCredentials(config=config).main()
+                )
                 acl.credentials = ard.buildList("credentials", "id")
         elif argv[verbPosition + 1] == "group" and len(argv) - verbPosition >= 3:
-            ard.groups = astraSDK.groups.getGroups(config=config).main()
+            ard.groups = cache.get(
+                "groups", lambda: astraSDK.groups.getGroups(config=config).main()
+            )
             acl.groups = ard.buildList("groups", "id")
         elif (argv[verbPosition + 1] == "hook" or argv[verbPosition + 1] == "exechook") and len(
             argv
         ) - verbPosition >= 3:
             if v3:
-                ard.apps = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("applications")
+                ard.apps = cache.get(
+                    "apps",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("applications"),
+                )
                 acl.apps = ard.buildList("apps", "metadata.name")
-                ard.hooks = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("exechooks")
+                ard.hooks = cache.get(
+                    "hooks",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("exechooks"),
+                )
                 acl.hooks = ard.buildList(
                     "hooks",
                     "metadata.name",
@@ -384,21 +743,31 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     fVal=argv[verbPosition + 2],
                 )
             else:
-                ard.apps = astraSDK.apps.getApps(config=config).main()
+                ard.apps = cache.shared(
+                    config["context"], "apps", astraSDK.apps.getApps(config=config).main
+                )
                 acl.apps = ard.buildList("apps", "id")
-                ard.hooks = astraSDK.hooks.getHooks(config=config).main()
+                ard.hooks = cache.get(
+                    "hooks", lambda: astraSDK.hooks.getHooks(config=config).main()
+                )
                 acl.hooks = ard.buildList("hooks", "id", fKey="appID", fVal=argv[verbPosition + 2])
         elif (
             argv[verbPosition + 1] == "protection" or argv[verbPosition + 1] == "schedule"
         ) and len(argv) - verbPosition >= 3:
             if v3:
-                ard.apps = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("applications")
+                ard.apps = cache.get(
+                    "apps",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("applications"),
+                )
                 acl.apps = ard.buildList("apps", "metadata.name")
-                ard.protections = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("schedules")
+                ard.protections = cache.get(
+                    "protections",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("schedules"),
+                )
                 acl.protections = ard.buildList(
                     "protections",
                     "metadata.name",
@@ -406,14 +775,22 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     fVal=argv[verbPosition + 2],
                 )
             else:
-                ard.apps = astraSDK.apps.getApps(config=config).main()
+                ard.apps = cache.shared(
+                    config["context"], "apps", astraSDK.apps.getApps(config=config).main
+                )
                 acl.apps = ard.buildList("apps", "id")
-                ard.protections = astraSDK.protections.getProtectionpolicies(config=config).main()
+                ard.protections = cache.get(
+                    "protections",
+                    lambda: astraSDK.protections.getProtectionpolicies(config=config).main(),
+                )
                 acl.protections = ard.buildList(
                     "protections", "id", fKey="appID", fVal=argv[verbPosition + 2]
                 )
         elif argv[verbPosition + 1] == "replication" and len(argv) - verbPosition >= 3:
-            ard.replications = astraSDK.replications.getReplicationpolicies(config=config).main()
+            ard.replications = cache.get(
+                "replications",
+                lambda: astraSDK.replications.getReplicationpolicies(config=config).main(),
+            )
             if not ard.replications:  # Gracefully handle ACS env
                 raise SystemExit(
                     "Error: 'replication' commands are currently only supported in ACC."
@@ -421,13 +798,19 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
             acl.replications = ard.buildList("replications", "id")
         elif argv[verbPosition + 1] == "snapshot" and len(argv) - verbPosition >= 3:
             if v3:
-                ard.apps = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("applications")
+                ard.apps = cache.get(
+                    "apps",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("applications"),
+                )
                 acl.apps = ard.buildList("apps", "metadata.name")
-                ard.snapshots = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("snapshots")
+                ard.snapshots = cache.get(
+                    "snapshots",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("snapshots"),
+                )
                 acl.snapshots = ard.buildList(
                     "snapshots",
                     "metadata.name",
@@ -435,58 +818,85 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     fVal=argv[verbPosition + 2],
                 )
             else:
-                ard.apps = astraSDK.apps.getApps(config=config).main()
+                ard.apps = cache.shared(
+                    config["context"], "apps", astraSDK.apps.getApps(config=config).main
+                )
                 acl.apps = ard.buildList("apps", "id")
-                ard.snapshots = astraSDK.snapshots.getSnaps(config=config).main()
+                ard.snapshots = cache.get(
+                    "snapshots", lambda: astraSDK.snapshots.getSnaps(config=config).main()
+                )
                 acl.snapshots = ard.buildList(
                     "snapshots", "id", fKey="appID", fVal=argv[verbPosition + 2]
                 )
         elif argv[verbPosition + 1] == "script" and len(argv) - verbPosition >= 3:
-            ard.scripts = astraSDK.scripts.getScripts(config=config).main()
+            ard.scripts = cache.get(
+                "scripts", lambda: astraSDK.scripts.getScripts(config=config).main()
+            )
             acl.scripts = ard.buildList("scripts", "id")
         elif argv[verbPosition + 1] == "user" and len(argv) - verbPosition >= 3:
-            ard.users = astraSDK.users.getUsers(config=config).main()
+            ard.users = cache.get("users", lambda: astraSDK.users.getUsers(config=config).main())
             acl.users = ard.buildList("users", "id")
 
     elif verbs["unmanage"] and len(argv) - verbPosition >= 2:
         if argv[verbPosition + 1] == "app" or argv[verbPosition + 1] == "application":
             if v3:
-                ard.apps = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("applications")
+                ard.apps = cache.get(
+                    "apps",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("applications"),
+                )
                 acl.apps = ard.buildList("apps", "metadata.name")
             else:
-                ard.apps = astraSDK.apps.getApps(config=config).main()
+                ard.apps = cache.shared(
+                    config["context"], "apps", astraSDK.apps.getApps(config=config).main
+                )
                 acl.apps = ard.buildList("apps", "id")
         elif argv[verbPosition + 1] == "bucket" or argv[verbPosition + 1] == "appVault":
             if v3:
-                ard.buckets = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("appvaults")
+                ard.buckets = cache.get(
+                    "buckets",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("appvaults"),
+                )
                 acl.buckets = ard.buildList("buckets", "metadata.name")
             else:
-                ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+                ard.buckets = cache.get(
+                    "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+                )
                 acl.buckets = ard.buildList("buckets", "id")
         elif argv[verbPosition + 1] == "cluster":
             if v3:
-                ard.connectors = astraSDK.k8s.getResources(
-                    config_context=v3, skip_tls_verify=v3_skip_tls_verify
-                ).main("astraconnectors", version="v1", group="astra.netapp.io")
+                ard.connectors = cache.get(
+                    "connectors",
+                    lambda: astraSDK.k8s.getResources(
+                        config_context=v3, skip_tls_verify=v3_skip_tls_verify
+                    ).main("astraconnectors", version="v1", group="astra.netapp.io"),
+                )
                 acl.clusters = ard.buildList("connectors", "spec.astra.clusterId") + ard.buildList(
                     "connectors", "spec.astra.clusterName"
                 )
             else:
-                ard.clusters = astraSDK.clusters.getClusters(config=config).main()
+                ard.clusters = cache.shared(
+                    config["context"], "clusters", astraSDK.clusters.getClusters(config=config).main
+                )
                 acl.clusters = ard.buildList("clusters", "id", fKey="managedState", fVal="managed")
         elif argv[verbPosition + 1] == "cloud":
-            ard.clouds = astraSDK.clouds.getClouds(config=config).main()
+            ard.clouds = cache.shared(
+                config["context"], "clouds", astraSDK.clouds.getClouds(config=config).main
+            )
             acl.clouds = ard.buildList("clouds", "id")
 
     elif verbs["update"] and len(argv) - verbPosition >= 2:
         if argv[verbPosition + 1] == "bucket" or argv[verbPosition + 1] == "appVault":
-            ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+            ard.buckets = cache.get(
+                "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+            )
             acl.buckets = ard.buildList("buckets", "id")
-            ard.credentials = astraSDK.credentials.getCredentials(config=config).main()
+            ard.credentials = cache.get(
+                "credentials", lambda: astraSDK.credentials.getCredentials(config=config).main()
+            )
             for credential in ard.credentials["items"]:
                 if credential["metadata"].get("labels"):
                     credID = None
@@ -500,11 +910,17 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     if credID:
                         acl.credentials.append(credential["id"])
         elif argv[verbPosition + 1] == "cloud":
-            ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+            ard.buckets = cache.get(
+                "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+            )
             acl.buckets = ard.buildList("buckets", "id")
-            ard.clouds = astraSDK.clouds.getClouds(config=config).main()
+            ard.clouds = cache.shared(
+                config["context"], "clouds", astraSDK.clouds.getClouds(config=config).main
+            )
             acl.clouds = ard.buildList("clouds", "id")
-            ard.credentials = astraSDK.credentials.getCredentials(config=config).main()
+            ard.credentials = cache.get(
+                "credentials", lambda: astraSDK.credentials.getCredentials(config=config).main()
+            )
             for credential in ard.credentials["items"]:
                 if credential["metadata"].get("labels"):
                     credID = None
@@ -518,28 +934,42 @@ def main(argv, verbs, verbPosition, ard, acl, v3, v3_skip_tls_verify=False, conf
                     if credID:
                         acl.credentials.append(credential["id"])
         elif argv[verbPosition + 1] == "cluster":
-            ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+            ard.buckets = cache.get(
+                "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+            )
             acl.buckets = ard.buildList("buckets", "id")
-            ard.clusters = astraSDK.clusters.getClusters(config=config).main()
+            ard.clusters = cache.shared(
+                config["context"], "clusters", astraSDK.clusters.getClusters(config=config).main
+            )
             # If we're updating a default bucket, only allow managed clusters
             if len(set(argv[verbPosition + 2 :]) & set(acl.buckets)) > 0:
                 acl.clusters = ard.buildList("clusters", "id", fKey="managedState", fVal="managed")
             else:
                 acl.clusters = ard.buildList("clusters", "id")
         elif argv[verbPosition + 1] == "protection":
-            ard.protections = astraSDK.protections.getProtectionpolicies(config=config).main()
+            ard.protections = cache.get(
+                "protections",
+                lambda: astraSDK.protections.getProtectionpolicies(config=config).main(),
+            )
             acl.protections = ard.buildList("protections", "id")
-            ard.buckets = astraSDK.buckets.getBuckets(config=config).main()
+            ard.buckets = cache.get(
+                "buckets", lambda: astraSDK.buckets.getBuckets(config=config).main()
+            )
             acl.buckets = ard.buildList("buckets", "id")
         elif argv[verbPosition + 1] == "replication":
-            ard.replications = astraSDK.replications.getReplicationpolicies(config=config).main()
+            ard.replications = cache.get(
+                "replications",
+                lambda: astraSDK.replications.getReplicationpolicies(config=config).main(),
+            )
             if not ard.replications:  # Gracefully handle ACS env
                 raise SystemExit(
                     "Error: 'replication' commands are currently only supported in ACC."
                 )
             acl.replications = ard.buildList("replications", "id")
         elif argv[verbPosition + 1] == "script":
-            ard.scripts = astraSDK.scripts.getScripts(config=config).main()
+            ard.scripts = cache.get(
+                "scripts", lambda: astraSDK.scripts.getScripts(config=config).main()
+            )
             acl.scripts = ard.buildList("scripts", "id")
 
 
@@ -559,6 +989,8 @@ def kube_config(argv, acl, verbPosition, v3Position, global_args):
     Since we are potentially modifying the length of argv, this function also modifies and returns
     verbPosition.
     """
+    import kubernetes
+
     desired_context = ""
     # Catch "actoolkit --v3" command (without any other arguments)
     if v3Position + 1 == len(argv):
@@ -15,9 +15,20 @@
    limitations under the License.
 """
 
+import contextvars
+import functools
+import io
+
 from tkSrc.helpers import parserError
 
 
+@functools.lru_cache(maxsize=1024)
+def splitPath(k):
+    """Returns the '.' separated components of a key path, which are cached as the same handful of
+    key paths are looked up for every item of a resource dict"""
+    return tuple(k.split("."))
+
+
 class ArgparseChoicesLists:
     """This Class defines a set of Lists which are used in the "choices" section of the Argparse
     parser. An empty list is perfectly valid, so all possible lists are pre-defined. These lists
@@ -68,13 +79,12 @@ class AstraResourceDicts:
             return True
 
     def recursiveGet(self, k, item):
-        """Recursion function which is just a wrapper around dict.get(key), to handle cases
-        where there's a dict within a dict. A '.' in the key name ('metadata.name')
-        is used for identification purposes."""
-        if len(k.split(".")) > 1:
-            return self.recursiveGet(k.split(".", 1)[1], item[k.split(".")[0]])
-        else:
-            return item.get(k)
+        """Wrapper around dict.get(key), to handle cases where there's a dict within a dict. A '.'
+        in the key name ('metadata.name') is used for identification purposes."""
+        *path, last = splitPath(k)
+        for key in path:
+            item = item[key]
+        return item.get(last)
 
     def buildList(self, name, key, fKey=None, fVal=None):
         """Generates a list for use in argparse choices"""
@@ -82,16 +92,15 @@ class AstraResourceDicts:
             # return a list of resource values based on 'key'
             if not fKey or not fVal:
                 return [
-                    self.recursiveGet(key, x)
+                    value
                     for x in getattr(self, name)["items"]
-                    if self.recursiveGet(key, x)
+                    if (value := self.recursiveGet(key, x))
                 ]
             # return a list of resource values based on 'key' only if some other 'fKey' == 'fVal'
             return [
                 self.recursiveGet(key, x)
-                for x in (
-                    y for y in getattr(self, name)["items"] if self.recursiveGet(fKey, y) == fVal
-                )
+                for x in getattr(self, name)["items"]
+                if self.recursiveGet(fKey, x) == fVal
             ]
         except TypeError:
             return []
@@ -107,3 +116,40 @@ class AstraResourceDicts:
             parserError(
                 f"A resource with a '{key}:{value}' pair in the '{name}' dict was not found"
             )
+
+
+class ThreadOutput:
+    """A file-like object to install as sys.stdout/sys.stderr, which writes to a per-thread buffer
+    (started with capture()) if the writing thread has one, and to stream otherwise. This allows
+    concurrently running commands to each collect their own output, to be printed in order. The
+    buffer is kept in a context variable, so threads started with a copy of the capturing
+    thread's context (like SDKCommon.fanOut's workers) write to the same buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer = contextvars.ContextVar(f"ThreadOutput-{id(self)}", default=None)
+
+    def capture(self):
+        """Starts buffering the current thread's output, and returns the buffer"""
+        buffer = io.StringIO()
+        self.buffer.set(buffer)
+        return buffer
+
+    def release(self):
+        """Stops buffering the current thread's output, and returns everything it wrote"""
+        buffer = self.buffer.get()
+        self.buffer.set(None)
+        return buffer.getvalue()
+
+    def write(self, data):
+        return (self.buffer.get() or self.stream).write(data)
+
+    def flush(self):
+        if self.buffer.get() is None:
+            self.stream.flush()
+
+    def fileno(self):
+        return self.stream.fileno()
+
+    def isatty(self):
+        return self.stream.isatty()
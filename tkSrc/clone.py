@@ -19,7 +19,6 @@ import copy
 import json
 import kubernetes
 import sys
-import time
 import yaml
 
 
@@ -71,16 +70,18 @@ def doClone(
                 if cluster["id"] == clusterID:
                     if cluster["name"] in context["name"]:
                         destClient = kubernetes.client.NetworkingV1Api(
-                            api_client=kubernetes.config.new_client_from_config(
-                                context=context["name"]
-                            )
+                            api_client=astraSDK.common.KubeCommon(
+                                config_context=context["name"],
+                                client_configuration=kubernetes.client.Configuration(),
+                            ).api_client
                         )
                 elif cluster["id"] == oApp["clusterID"]:
                     if cluster["name"] in context["name"]:
                         sourceClient = kubernetes.client.NetworkingV1Api(
-                            api_client=kubernetes.config.new_client_from_config(
-                                context=context["name"]
-                            )
+                            api_client=astraSDK.common.KubeCommon(
+                                config_context=context["name"],
+                                client_configuration=kubernetes.client.Configuration(),
+                            ).api_client
                         )
         try:
             # Get the source cluster ingressclass and apply it to the dest cluster
@@ -199,23 +200,15 @@ def doClone(
             return True
         print(f"Waiting for {verb} to become available", end="")
         sys.stdout.flush()
-        appID = cloneRet.get("id")
-        state = cloneRet.get("state")
-        while state != "ready":
-            apps = astraSDK.apps.getApps(config=config).main()
-            for app in apps["items"]:
-                if app["id"] == appID:
-                    if app["state"] == "ready":
-                        state = app["state"]
-                        print(f"{verb[:-1]}ing operation complete.")
-                        sys.stdout.flush()
-                    elif app["state"] == "failed":
-                        sys.stdout.flush()
-                        raise SystemExit(f"Error: \"{app['name']}\" in a failed state")
-                    else:
-                        time.sleep(pollTimer)
-                        print(".", end="")
-                        sys.stdout.flush()
+        app = astraSDK.apps.waitForApp(quiet=quiet, verbose=verbose, config=config).main(
+            cloneRet.get("id"),
+            pollTimer=pollTimer,
+            onPoll=lambda app: print(".", end="", flush=True),
+        )
+        if not app:
+            raise SystemExit(f"Error: \"{newAppName}\" did not become ready")
+        print(f"{verb[:-1]}ing operation complete.")
+        sys.stdout.flush()
     else:
         raise SystemExit(f"Submitting {verb} failed.")
 
@@ -224,33 +217,22 @@ def waitForDpCompletion(dp_resp, cluster, skip_tls_verify):
     """Given a data protection creation response, wait for the 'status.state' field
     to be 'Completed', then return that dict"""
     dp_name = dp_resp["metadata"]["name"]
-    dp_plural = f"{dp_resp['kind'].lower()}s"
-    get_K8s_obj = astraSDK.k8s.getResources(config_context=cluster, skip_tls_verify=skip_tls_verify)
-    dp = get_K8s_obj.main(
-        dp_plural, filters=[{"keyFilter": "metadata.name", "valFilter": dp_name}]
-    )["items"][0]
-    counter = 1
     print(f"Waiting for {dp_resp['kind'].lower()} to become available", end="")
     sys.stdout.flush()
-    while (
-        not dp.get("status")
-        or not dp["status"].get("state")
-        or dp["status"]["state"] != "Completed"
-    ):
-        if dp.get("status") and dp["status"].get("state") and dp["status"]["state"] == "Failed":
-            raise SystemExit(f"{dp['metadata']['name']} failed")
-        elif counter > 60:
-            raise SystemExit(
-                f"{dp['metadata']['name']}'s status never went into a 'Completed' state: "
-                f"{dp['status']['state']}"
-            )
-        time.sleep(counter)
-        counter += 1
-        print(".", end="")
-        sys.stdout.flush()
-        dp = get_K8s_obj.main(
-            dp_plural, filters=[{"keyFilter": "metadata.name", "valFilter": dp_name}]
-        )["items"][0]
+    dp = astraSDK.k8s.watchResource(config_context=cluster, skip_tls_verify=skip_tls_verify).main(
+        f"{dp_resp['kind'].lower()}s",
+        dp_name,
+        lambda d: (d.get("status") or {}).get("state") in ["Completed", "Failed"],
+        timeout=1800,
+        onUpdate=lambda d: print(".", end="", flush=True),
+    )
+    if not dp:
+        raise SystemExit(f"{dp_name} could not be watched")
+    state = (dp.get("status") or {}).get("state")
+    if state == "Failed":
+        raise SystemExit(f"{dp_name} failed")
+    elif state != "Completed":
+        raise SystemExit(f"{dp_name}'s status never went into a 'Completed' state: {state}")
     print("Completed")
     sys.stdout.flush()
     return dp
@@ -550,7 +532,7 @@ def main(args, ard, config=None):
 
     else:
         if ard.needsattr("apps"):
-            ard.apps = astraSDK.apps.getApps(config=config).main()
+            ard.apps = config["context"].get("apps", astraSDK.apps.getApps(config=config).main)
         # Get the original app dictionary based on args.sourceApp/args.restoreSource,
         # as the app dict contains sourceCluster and namespaceScopedResources which we need
         oApp = {}
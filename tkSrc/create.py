@@ -19,8 +19,8 @@ import base64
 import json
 import os
 import sys
-import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
 
 import astraSDK
@@ -31,11 +31,7 @@ def monitorProtectionTask(protectionID, protectionType, appID, background, pollT
     """Ensure backup/snapshot task was created successfully, then monitor"""
     if protectionID is False:
         return False
-    if protectionType == "backup":
-        protection_class = astraSDK.backups.getBackups(config=config)
-    elif protectionType == "snapshot":
-        protection_class = astraSDK.snapshots.getSnaps(config=config)
-    else:
+    if protectionType not in ["backup", "snapshot"]:
         helpers.parserError(f"unknown protection type: {protectionType}")
 
     print(f"Starting {protectionType} of {appID}")
@@ -47,69 +43,245 @@ def monitorProtectionTask(protectionID, protectionType, appID, background, pollT
 
     print(f"Waiting for {protectionType} to complete.", end="")
     sys.stdout.flush()
-    err_counter = []
-    while len(err_counter) < 3:
-        try:
-            objects = protection_class.main(appFilter=appID)
-            if not objects:
-                raise Exception(f"astraSDK.{protectionType}s.get{protectionType}s().main() failed")
-            protection_found = False
-            for obj in objects["items"]:
-                if obj["id"] == protectionID:
-                    protection_found = True
-                    if obj["state"] == "completed":
-                        print("complete!")
-                        sys.stdout.flush()
-                        return protectionID
-                    elif obj["state"] == "failed":
-                        print(f"{protectionType} job failed")
-                        return False
-            if not protection_found:
-                raise Exception(f"Protection ID {protectionID} not found")
-            time.sleep(pollTimer)
-            print(".", end="")
-            sys.stdout.flush()
-        except Exception as err:
-            err_counter.append(err)
-    for err in set([str(e) for e in err_counter]):
-        protection_class.printError(err + "\n")
+    # A GET of the single backup/snapshot per poll, rather than a list of every one of the app's
+    tracker = astraSDK.jobs.JobTracker(quiet=False, pollTimer=pollTimer, config=config)
+    track = tracker.trackBackup if protectionType == "backup" else tracker.trackSnapshot
+    if track(appID, protectionID, onUpdate=lambda p: print(".", end="", flush=True)).result():
+        print("complete!")
+        sys.stdout.flush()
+        return protectionID
+    print(f"{protectionType} job failed")
     return False
 
 
 def monitorV3ProtectionTask(protection, pollTimer, v3, skip_tls_verify):
+    """Waits for the protection to complete, by watching the resource rather than re-listing
+    every resource of its kind (progress is printed at least every pollTimer seconds)"""
     name = protection["metadata"]["name"]
     singular = protection["kind"].lower()
-    resource_class = astraSDK.k8s.getResources(config_context=v3, skip_tls_verify=skip_tls_verify)
     print(f"Waiting for {singular} to complete.", end="")
     sys.stdout.flush()
-    err_counter = []
-    while len(err_counter) < 3:
+    resource = astraSDK.k8s.watchResource(config_context=v3, skip_tls_verify=skip_tls_verify).main(
+        f"{singular}s",
+        name,
+        lambda r: (r.get("status") or {}).get("state") in ["Completed", "Failed", "Error"],
+        watchTimeout=pollTimer,
+        onUpdate=lambda r: print(".", end="", flush=True),
+    )
+    if not resource:
+        return False
+    elif resource["status"]["state"] == "Completed":
+        print("complete!")
+        sys.stdout.flush()
+        return resource
+    print(f"{singular} failed")
+    return False
+
+
+def selectApps(appsFrom, ard, v3, skip_tls_verify, config=None):
+    """Returns the apps (v3: application names, otherwise app IDs) selected by --apps-from, which
+    is one of 'all', 'label:<key>[=<value>]', or 'file:<path>' (one app name or ID per line)"""
+    if ard.needsattr("apps"):
+        if v3:
+            ard.apps = astraSDK.k8s.getResources(
+                config_context=v3, skip_tls_verify=skip_tls_verify
+            ).main("applications")
+        else:
+            ard.apps = config["context"].get("apps", astraSDK.apps.getApps(config=config).main)
+    if not ard.apps:
+        raise SystemExit("Unable to list apps")
+    idKey = "metadata.name" if v3 else "id"
+    if appsFrom == "all":
+        return ard.buildList("apps", idKey)
+    elif appsFrom.startswith("label:"):
+        key, _, value = appsFrom[len("label:") :].partition("=")
+        if v3:
+            labels = [(a, a["metadata"].get("labels") or {}) for a in ard.apps["items"]]
+        else:
+            labels = [
+                (a, {lb["name"]: lb.get("value", "") for lb in a["metadata"].get("labels") or []})
+                for a in ard.apps["items"]
+            ]
+        return [
+            ard.recursiveGet(idKey, a)
+            for a, lbs in labels
+            if key in lbs and (not value or lbs[key] == value)
+        ]
+    elif appsFrom.startswith("file:"):
+        ids = {}
+        for a in ard.apps["items"]:
+            ids[ard.recursiveGet("metadata.name" if v3 else "name", a)] = ard.recursiveGet(idKey, a)
+            ids[ard.recursiveGet(idKey, a)] = ard.recursiveGet(idKey, a)
         try:
-            resources = resource_class.main(
-                f"{singular}s", filters=[{"keyFilter": "metadata.name", "valFilter": name}]
+            with open(appsFrom[len("file:") :], encoding="utf8") as f:
+                lines = [line.strip() for line in f]
+        except OSError as e:
+            helpers.parserError(f"--apps-from {appsFrom}: {e.strerror}")
+        apps = []
+        for line in lines:
+            if not line or line.startswith("#"):
+                continue
+            elif line not in ids:
+                helpers.parserError(f"--apps-from {appsFrom}: app '{line}' not found")
+            elif ids[line] not in apps:
+                apps.append(ids[line])
+        return apps
+    helpers.parserError(
+        f"--apps-from must be 'all', 'label:<key>[=<value>]', or 'file:<path>', not '{appsFrom}'"
+    )
+
+
+def monitorProtectionTasks(futures, protectionType, pollTimer):
+    """Waits for many backup/snapshot jobs (a dict of app: Future, see astraSDK.jobs), printing
+    progress at most every pollTimer seconds whenever it changes, and returns a dict of
+    app: whether the job completed"""
+    results, progress = {}, None
+    pending = {future: app for app, future in futures.items()}
+    while pending:
+        done, _ = wait(pending, timeout=pollTimer)
+        for future in done:
+            results[pending.pop(future)] = bool(future.result())
+        completed = sum(results.values())
+        if (completed, len(results)) != progress:
+            progress = (completed, len(results))
+            print(
+                f"{protectionType}s: {completed} completed, {len(results) - completed} failed, "
+                f"{len(pending)} in progress"
             )
-            if not resources:
-                raise Exception("astraSDK.k8s.getResources().main() failed")
-            elif not resources["items"]:
-                raise Exception(f"{singular} {name} not found")
-            elif len(resources["items"]) > 1:
-                raise Exception(f"Multiple {singular}s found with name {name}")
-            resource = resources["items"][0]
-            if resource["status"]["state"] == "Completed":
-                print("complete!")
-                sys.stdout.flush()
-                return resource
-            elif resource["status"]["state"] == "Failed" or resource["status"]["state"] == "Error":
-                print(f"{singular} failed")
-                return False
-            time.sleep(pollTimer)
-            print(".", end="")
             sys.stdout.flush()
-        except Exception as err:
-            err_counter.append(err)
-    for err in set([str(e) for e in err_counter]):
-        resource_class.printError(err + "\n")
-    return False
+    return results
+
+
+def createBulkProtections(args, ard, config=None):
+    """Creates a backup or snapshot (args.objectType) of every app selected by --apps-from, with at
+    most max_workers creations in flight at once, and then waits for all of them with a single
+    polling loop (unless --background). For v3, args.name is used as the generateName prefix of
+    each custom resource, otherwise it's the name of every app's backup/snapshot."""
+    protectionType = args.objectType
+    if args.app:
+        helpers.parserError("app and --apps-from cannot both be specified")
+    elif getattr(args, "snapshot", None):
+        helpers.parserError("--snapshot cannot be used with --apps-from")
+    apps = selectApps(args.appsFrom, ard, args.v3, args.skip_tls_verify, config=config)
+    if not apps:
+        raise SystemExit(f"--apps-from {args.appsFrom} did not select any apps")
+    print(f"Starting {protectionType}s of {len(apps)} apps")
+    sys.stdout.flush()
+
+    # The creations run in worker threads, so they're quiet (other than dry runs' manifests, which
+    # are created one at a time) and each app's outcome is printed below from this thread instead
+    quiet = args.quiet if args.dry_run else True
+    if args.v3:
+        helpers.isRFC1123(args.name)
+
+        def create(app):
+            if protectionType == "snapshot":
+                return createV3Snapshot(
+                    args.v3,
+                    args.dry_run,
+                    args.skip_tls_verify,
+                    quiet,
+                    args.verbose,
+                    None,
+                    app,
+                    args.bucket,
+                    reclaimPolicy=args.reclaimPolicy,
+                    createdTimeout=args.createdTimeout,
+                    readyToUseTimeout=args.readyToUseTimeout,
+                    generateName=f"{args.name}-",
+                )
+            return createV3Backup(
+                args.v3,
+                args.dry_run,
+                args.skip_tls_verify,
+                quiet,
+                args.verbose,
+                None,
+                app,
+                args.bucket,
+                reclaimPolicy=args.reclaimPolicy,
+                generateName=f"{args.name}-",
+            )
+
+        workers = astraSDK.common.DEFAULT_MAX_WORKERS
+    else:
+        name = helpers.isRFC1123(args.name)
+        if protectionType == "snapshot":
+            taker = astraSDK.snapshots.takeSnap(quiet=quiet, verbose=args.verbose, config=config)
+
+            def create(app):
+                return taker.main(app, name)
+
+        else:
+            taker = astraSDK.backups.takeBackup(quiet=quiet, verbose=args.verbose, config=config)
+
+            def create(app):
+                return taker.main(app, name, bucketID=args.bucket)
+
+        workers = taker.maxWorkers
+    if args.verbose or args.dry_run:
+        workers = 1
+
+    def start(app):
+        # A connection error exits apicall, which would otherwise end the whole run, so it's
+        # counted as a failed start of just this app
+        try:
+            return create(app), None
+        except SystemExit as err:
+            return False, err
+
+    jobs, failed = {}, []
+    with ThreadPoolExecutor(max_workers=min(workers, len(apps))) as executor:
+        for app, (job, err) in zip(apps, executor.map(start, apps)):
+            if job:
+                jobs[app] = job
+                if not args.dry_run:
+                    jobID = job["metadata"]["name"] if args.v3 else job
+                    print(
+                        f"Started {protectionType} of {app}"
+                        + (f": {jobID}" if jobID is not True else "")
+                    )
+            else:
+                failed.append(app)
+                print(f"Failed to start {protectionType} of {app}" + (f": {err}" if err else ""))
+            sys.stdout.flush()
+    if args.background or args.dry_run or not jobs:
+        if jobs and not args.dry_run:
+            print(
+                f"Background {protectionType}s selected, run 'list {protectionType}s' to get status"
+            )
+        if failed:
+            raise SystemExit(f"{len(failed)} of {len(apps)} {protectionType}s failed to start")
+        return jobs
+
+    # Every job is checked by a single tracker thread, with one list of the backups/snapshots
+    # per cycle (per app for v2), rather than a call per job
+    if args.v3:
+        tracker = astraSDK.jobs.KubeJobTracker(
+            quiet=args.quiet,
+            verbose=args.verbose,
+            config_context=args.v3,
+            skip_tls_verify=args.skip_tls_verify,
+            pollTimer=args.pollTimer,
+        )
+        futures = {
+            app: tracker.trackResource(f"{protectionType}s", job["metadata"]["name"])
+            for app, job in jobs.items()
+        }
+    else:
+        tracker = astraSDK.jobs.JobTracker(
+            quiet=args.quiet, verbose=args.verbose, pollTimer=args.pollTimer, config=config
+        )
+        track = tracker.trackBackup if protectionType == "backup" else tracker.trackSnapshot
+        futures = {app: track(app, job) for app, job in jobs.items()}
+
+    results = monitorProtectionTasks(futures, protectionType, args.pollTimer)
+    failed.extend(app for app, completed in results.items() if not completed)
+    if failed:
+        raise SystemExit(
+            f"{len(failed)} of {len(apps)} {protectionType}s failed: {', '.join(failed)}"
+        )
+    return jobs
 
 
 def createAsup(
@@ -469,6 +641,11 @@ def main(args, ard, config=None):
                 args.bucket = ard.getSingleDict("buckets", "status.state", "available")["metadata"][
                     "name"
                 ]
+        if args.appsFrom:
+            createBulkProtections(args, ard, config=config)
+        elif not args.app:
+            helpers.parserError("either an app or --apps-from must be specified")
+        elif args.v3:
             backup = createV3Backup(
                 args.v3,
                 args.dry_run,
@@ -706,7 +883,7 @@ def main(args, ard, config=None):
             rrule += str(int(args.replicationFrequency.strip("h")) * 60)
         # Get Source ClusterID
         if ard.needsattr("apps"):
-            ard.apps = astraSDK.apps.getApps(config=config).main()
+            ard.apps = config["context"].get("apps", astraSDK.apps.getApps(config=config).main)
         for app in ard.apps["items"]:
             if app["id"] == args.appID:
                 sourceClusterID = app["clusterID"]
@@ -762,6 +939,11 @@ def main(args, ard, config=None):
                 args.bucket = ard.getSingleDict("buckets", "status.state", "available")["metadata"][
                     "name"
                 ]
+        if args.appsFrom:
+            createBulkProtections(args, ard, config=config)
+        elif not args.app:
+            helpers.parserError("either an app or --apps-from must be specified")
+        elif args.v3:
             snapshot = createV3Snapshot(
                 args.v3,
                 args.dry_run,
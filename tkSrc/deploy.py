@@ -151,8 +151,13 @@ def deployHelm(
                         else:
                             raise SystemExit("Error managing app")
 
+        # Wait for the newly managed app to be ready before protecting it
+        if not astraSDK.apps.waitForApp(quiet=quiet, verbose=verbose, config=config).main(
+            appID, pollTimer=3
+        ):
+            raise SystemExit(f"Error: app {appID} did not become ready")
+
         # Create a protection policy on that namespace (using its appID)
-        time.sleep(5)
         backupRetention = "1"
         snapshotRetention = "1"
         minute = "0"
@@ -38,7 +38,9 @@ def main(args, ard, config=None):
                 raise SystemExit(f"Failed destroying backup: {args.backup}")
     elif args.objectType == "cluster":
         if ard.needsattr("clusters"):
-            ard.clusters = astraSDK.clusters.getClusters(config=config).main()
+            ard.clusters = config["context"].get(
+                "clusters", astraSDK.clusters.getClusters(config=config).main
+            )
         cluster = ard.getSingleDict("clusters", "id", args.cluster)
         rc = astraSDK.clusters.deleteCluster(
             quiet=args.quiet, verbose=args.verbose, config=config
@@ -23,8 +23,6 @@ import subprocess
 import yaml
 from datetime import datetime
 
-from jinja2 import Environment, FileSystemLoader
-
 import astraSDK
 
 
@@ -491,10 +489,33 @@ def checkv3Support(args, supportedDict):
     parserError(f"'{args.subcommand} {args.objectType}' is not currently a supported --v3 command")
 
 
+def checkStreamSupport(args):
+    """Function to ensure a streaming output format (-o ndjson, yaml-stream, or table-stream) is
+    only used with the list/get commands which write their items as they're fetched"""
+    if args.output not in astraSDK.common.STREAM_OUTPUTS:
+        return True
+    if args.subcommand in ["list", "get"]:
+        if args.v3 and args.objectType not in ["namespaces", "secrets"]:
+            return True
+        elif not args.v3 and args.objectType in [
+            "apps",
+            "applications",
+            "backups",
+            "namespaces",
+            "notifications",
+            "snapshots",
+        ]:
+            return True
+    command = f"{args.subcommand} {getattr(args, 'objectType', '')}".rstrip()
+    parserError(f"'-o {args.output}' is not currently supported by '{command}'")
+
+
 def setupJinja(
     objectType, filesystem=os.path.dirname(os.path.realpath(__file__)) + "/templates/jinja"
 ):
     """Function to load a jinja template from the filesystem based on parser objectType"""
+    from jinja2 import Environment, FileSystemLoader
+
     env = Environment(loader=FileSystemLoader(filesystem))
     return env.get_template(f"{objectType}.jinja")
 
@@ -643,8 +664,8 @@ def parserError(message):
     """Prints an argparse-like generic error message"""
     prog = "actoolkit"
     usage = (
-        "usage: actoolkit [-h] [-v] [-o {json,yaml,table}] [-q] [-f] [--v3] "
-        "[--dry-run {client,server}] [--insecure-skip-tls-verify] "
+        "usage: actoolkit [-h] [-v] [-o {json,yaml,table,ndjson,yaml-stream,table-stream}] [-q] "
+        "[-f] [--v3] [--dry-run {client,server}] [--insecure-skip-tls-verify] "
         "{deploy,clone,restore,ipr,list,get,copy,create,manage,define,destroy,unmanage,update} ..."
     )
     raise SystemExit(f"{usage}\n{prog}: error: {message}")
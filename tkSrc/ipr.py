@@ -16,7 +16,6 @@
 """
 
 import sys
-import time
 import uuid
 import yaml
 
@@ -126,20 +125,15 @@ def main(args, ard, config=None):
                 return True
             print("In-Place-Restore job in progress", end="")
             sys.stdout.flush()
-            while True:
-                restoreApps = astraSDK.apps.getApps(config=config).main()
-                state = None
-                for restoreApp in restoreApps["items"]:
-                    if restoreApp["id"] == args.app:
-                        state = restoreApp["state"]
-                if state == "restoring":
-                    print(".", end="")
-                    sys.stdout.flush()
-                elif state == "ready":
-                    print("Success!")
-                    break
-                elif state == "failed":
-                    raise SystemExit(f"Restore of app {args.app} failed!")
-                time.sleep(args.pollTimer)
+            app = astraSDK.apps.waitForApp(
+                quiet=args.quiet, verbose=args.verbose, config=config
+            ).main(
+                args.app,
+                pollTimer=args.pollTimer,
+                onPoll=lambda app: print(".", end="", flush=True),
+            )
+            if not app:
+                raise SystemExit(f"Restore of app {args.app} failed!")
+            print("Success!")
         else:
             raise SystemExit("Submitting restore job failed.")
@@ -16,7 +16,6 @@
 """
 
 import base64
-import copy
 
 import astraSDK
 from tkSrc import helpers
@@ -130,10 +129,9 @@ def listV3Iprs(v3, quiet, output, verbose, skip_tls_verify=False, app=None):
         for ipr in iprs["items"]:
             if a["metadata"]["uid"] in ipr["spec"]["appArchivePath"]:
                 ipr["metadata"]["app"] = a
-    iprsCopy = copy.deepcopy(iprs)
-    for counter, ipr in enumerate(iprsCopy.get("items")):
-        if app and app != ipr["metadata"]["app"]["metadata"]["name"]:
-            iprs["items"].remove(iprsCopy["items"][counter])
+    iprs = resources.filterItems(
+        iprs, lambda ipr: not app or app == ipr["metadata"]["app"]["metadata"]["name"]
+    )
     resources.formatPrint(iprs, "inplacerestores", quiet=quiet, output=output, verbose=verbose)
     return iprs
 
@@ -259,6 +257,7 @@ def main(args, config=None):
                 namespace=args.namespace,
                 nameFilter=args.nameFilter,
                 cluster=args.cluster,
+                shared=True,
             )
             if rc is False:
                 raise SystemExit("astraSDK.apps.getApps() failed")
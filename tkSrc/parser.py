@@ -36,8 +36,9 @@ class ToolkitParser:
             "-o",
             "--output",
             default="table",
-            choices=["json", "yaml", "table"],
-            help="command output format",
+            choices=["json", "yaml", "table", "ndjson", "yaml-stream", "table-stream"],
+            help="command output format (the -stream formats and ndjson write each item of a "
+            "list as soon as it's fetched)",
         )
         self.parser.add_argument(
             "-q", "--quiet", default=False, action="store_true", help="supress output"
@@ -50,6 +51,19 @@ class ToolkitParser:
             help="prioritize speed over validation (using this will not validate arguments, which "
             + "may have unintended consequences)",
         )
+        self.parser.add_argument(
+            "--profile",
+            default=False,
+            action="store_true",
+            help="print the time spent in each phase of the command, and a summary of every API "
+            "call it made, to stderr",
+        )
+        self.parser.add_argument(
+            "--profile-file",
+            default=None,
+            metavar="FILE",
+            help="write the phases of the command and every API call it made to this json file",
+        )
         v3Group = self.parser.add_argument_group(
             title="v3 group",
             description="use CR-driven Kubernetes workflows rather than the Astra Control API",
@@ -550,7 +564,9 @@ class ToolkitParser:
                 "--pollTimer",
                 type=int,
                 default=5,
-                help="The frequency (seconds) to poll the operation status (default: %(default)s)",
+                help="The initial frequency (seconds) to poll the operation status, which "
+                "backs off (by half after each unchanged poll, up to 60 seconds) until the "
+                "status changes (default: %(default)s)",
             )
 
     def restore_args(self):
@@ -636,7 +652,9 @@ class ToolkitParser:
                 "--pollTimer",
                 type=int,
                 default=5,
-                help="The frequency (seconds) to poll the operation status (default: %(default)s)",
+                help="The initial frequency (seconds) to poll the operation status, which "
+                "backs off (by half after each unchanged poll, up to 60 seconds) until the "
+                "status changes (default: %(default)s)",
             )
 
     def IPR_args(self):
@@ -697,7 +715,9 @@ class ToolkitParser:
                 "--pollTimer",
                 type=int,
                 default=5,
-                help="The frequency (seconds) to poll the operation status (default: %(default)s)",
+                help="The initial frequency (seconds) to poll the operation status, which "
+                "backs off (by half after each unchanged poll, up to 60 seconds) until the "
+                "status changes (default: %(default)s)",
             )
 
     def deploy_acp_args(self):
@@ -1215,8 +1235,9 @@ class ToolkitParser:
         """create backups args and flags"""
         self.subparserCreateBackup.add_argument(
             "app",
+            nargs="?",
             choices=(None if self.plaidMode else self.acl.apps),
-            help="app to backup",
+            help="app to backup (omit when using --apps-from)",
         )
         self.subparserCreateBackup.add_argument(
             "name",
@@ -1246,6 +1267,14 @@ class ToolkitParser:
                 choices=["Delete", "Retain"],
                 help="Define how to handle the snapshot data when the snapshot CR is deleted",
             )
+        self.subparserCreateBackup.add_argument(
+            "--apps-from",
+            dest="appsFrom",
+            default=None,
+            help="backup many apps at once: 'all' apps, apps with a 'label:<key>[=<value>]' "
+            "label, or the apps (names or IDs, one per line) of a 'file:<path>'"
+            + (" (name is used as the prefix of each backup)" if self.v3 else ""),
+        )
         pollingGroup = self.subparserCreateBackup.add_argument_group(
             title="polling group", description="optionally modify default polling mechanism"
         )
@@ -1261,7 +1290,9 @@ class ToolkitParser:
             "--pollTimer",
             type=int,
             default=5,
-            help="The frequency (seconds) to poll the operation status (default: %(default)s)",
+            help="The initial frequency (seconds) to poll the operation status, which "
+            "backs off (by half after each unchanged poll, up to 60 seconds) until the "
+            "status changes (default: %(default)s)",
         )
 
     def create_cluster_args(self):
@@ -1593,8 +1624,9 @@ class ToolkitParser:
         """create snapshot args and flags"""
         self.subparserCreateSnapshot.add_argument(
             "app",
+            nargs="?",
             choices=(None if self.plaidMode else self.acl.apps),
-            help="app to snapshot",
+            help="app to snapshot (omit when using --apps-from)",
         )
         self.subparserCreateSnapshot.add_argument(
             "name",
@@ -1632,6 +1664,14 @@ class ToolkitParser:
                 help="The time (in minutes) to wait for Snapshot CR to complete before returning "
                 "timeout error (default: 30)",
             )
+        self.subparserCreateSnapshot.add_argument(
+            "--apps-from",
+            dest="appsFrom",
+            default=None,
+            help="snapshot many apps at once: 'all' apps, apps with a 'label:<key>[=<value>]' "
+            "label, or the apps (names or IDs, one per line) of a 'file:<path>'"
+            + (" (name is used as the prefix of each snapshot)" if self.v3 else ""),
+        )
         pollingGroup = self.subparserCreateSnapshot.add_argument_group(
             title="polling group", description="optionally modify default polling mechanism"
         )
@@ -1647,7 +1687,9 @@ class ToolkitParser:
             "--pollTimer",
             type=int,
             default=5,
-            help="The frequency (seconds) to poll the operation status (default: %(default)s)",
+            help="The initial frequency (seconds) to poll the operation status, which "
+            "backs off (by half after each unchanged poll, up to 60 seconds) until the "
+            "status changes (default: %(default)s)",
         )
 
     def create_user_args(self):
@@ -2227,98 +2269,117 @@ class ToolkitParser:
             help="the local filesystem path to the updated script",
         )
 
-    def main(self):
+    def main(self, subcommand=None):
+        """Returns the parser. If subcommand (the verb found by inspecting sys.argv) is given, only
+        that subcommand's parser tree is built, as building the entire tree is a large portion of
+        the toolkit's startup time. The top level commands are always built, so the top level
+        help text and any errors are unchanged."""
+        # The subcommand aliases share their parser tree with the primary subcommand
+        subcommand = {"get": "list", "define": "manage"}.get(subcommand, subcommand)
+
         # Create the top-level commands like: deploy, clone, list, manage, etc.
         self.top_level_commands()
 
         # *Some* top-level commands have sub-commands like: list apps vs list buckets
         self.sub_commands()
 
-        # Of those top-level commands with sub-commands, create those sub-command parsers
-        self.sub_deploy_commands()
-        self.sub_list_commands()
-        self.sub_copy_commands()
-        self.sub_create_commands()
-        self.sub_manage_commands()
-        self.sub_destroy_commands()
-        self.sub_unmanage_commands()
-        self.sub_update_commands()
-
-        # Create arguments for all commands
-        self.clone_args()
-        self.restore_args()
-        self.IPR_args()
-
-        self.deploy_acp_args()
-        self.deploy_chart_args()
-
-        self.list_apiresources_args()
-        self.list_apps_args()
-        self.list_assets_args()
-        self.list_asups_args()
-        self.list_backups_args()
-        self.list_buckets_args()
-        self.list_clouds_args()
-        self.list_clusters_args()
-        self.list_credentials_args()
-        self.list_hooks_args()
-        self.list_ldapgroups_args()
-        self.list_ldapusers_args()
-        self.list_hooksruns_args()
-        self.list_iprs_args()
-        self.list_namespaces_args()
-        self.list_notifications_args()
-        self.list_protections_args()
-        self.list_replications_args()
-        self.list_restores_args()
-        self.list_rolebindings_args()
-        self.list_scripts_args()
-        self.list_snapshots_args()
-        self.list_storageclasses_args()
-        self.list_users_args()
-
-        self.copy_asup_args()
-        self.copy_hooks_args()
-        self.copy_protections_args()
-
-        self.create_asup_args()
-        self.create_backup_args()
-        self.create_cluster_args()
-        self.create_group_args()
-        self.create_hook_args()
-        self.create_ldap_args()
-        self.create_protection_args()
-        self.create_replication_args()
-        self.create_script_args()
-        self.create_snapshot_args()
-        self.create_user_args()
-
-        self.manage_app_args()
-        self.manage_bucket_args()
-        self.manage_cluster_args()
-        self.manage_cloud_args()
-
-        self.destroy_backup_args()
-        self.destroy_cluster_args()
-        self.destroy_credential_args()
-        self.destroy_group_args()
-        self.destroy_hook_args()
-        self.destroy_protection_args()
-        self.destroy_replication_args()
-        self.destroy_script_args()
-        self.destroy_snapshot_args()
-        self.destroy_user_args()
-
-        self.unmanage_app_args()
-        self.unmanage_bucket_args()
-        self.unmanage_cluster_args()
-        self.unmanage_cloud_args()
-
-        self.update_bucket_args()
-        self.update_cloud_args()
-        self.update_cluster_args()
-        self.update_protection_args()
-        self.update_replication_args()
-        self.update_script_args()
+        # For each top-level command, create the sub-command parsers (if any), then the arguments
+        commands = {
+            "deploy": [
+                self.sub_deploy_commands,
+                self.deploy_acp_args,
+                self.deploy_chart_args,
+            ],
+            "clone": [self.clone_args],
+            "restore": [self.restore_args],
+            "ipr": [self.IPR_args],
+            "list": [
+                self.sub_list_commands,
+                self.list_apiresources_args,
+                self.list_apps_args,
+                self.list_assets_args,
+                self.list_asups_args,
+                self.list_backups_args,
+                self.list_buckets_args,
+                self.list_clouds_args,
+                self.list_clusters_args,
+                self.list_credentials_args,
+                self.list_hooks_args,
+                self.list_ldapgroups_args,
+                self.list_ldapusers_args,
+                self.list_hooksruns_args,
+                self.list_iprs_args,
+                self.list_namespaces_args,
+                self.list_notifications_args,
+                self.list_protections_args,
+                self.list_replications_args,
+                self.list_restores_args,
+                self.list_rolebindings_args,
+                self.list_scripts_args,
+                self.list_snapshots_args,
+                self.list_storageclasses_args,
+                self.list_users_args,
+            ],
+            "copy": [
+                self.sub_copy_commands,
+                self.copy_asup_args,
+                self.copy_hooks_args,
+                self.copy_protections_args,
+            ],
+            "create": [
+                self.sub_create_commands,
+                self.create_asup_args,
+                self.create_backup_args,
+                self.create_cluster_args,
+                self.create_group_args,
+                self.create_hook_args,
+                self.create_ldap_args,
+                self.create_protection_args,
+                self.create_replication_args,
+                self.create_script_args,
+                self.create_snapshot_args,
+                self.create_user_args,
+            ],
+            "manage": [
+                self.sub_manage_commands,
+                self.manage_app_args,
+                self.manage_bucket_args,
+                self.manage_cluster_args,
+                self.manage_cloud_args,
+            ],
+            "destroy": [
+                self.sub_destroy_commands,
+                self.destroy_backup_args,
+                self.destroy_cluster_args,
+                self.destroy_credential_args,
+                self.destroy_group_args,
+                self.destroy_hook_args,
+                self.destroy_protection_args,
+                self.destroy_replication_args,
+                self.destroy_script_args,
+                self.destroy_snapshot_args,
+                self.destroy_user_args,
+            ],
+            "unmanage": [
+                self.sub_unmanage_commands,
+                self.unmanage_app_args,
+                self.unmanage_bucket_args,
+                self.unmanage_cluster_args,
+                self.unmanage_cloud_args,
+            ],
+            "update": [
+                self.sub_update_commands,
+                self.update_bucket_args,
+                self.update_cloud_args,
+                self.update_cluster_args,
+                self.update_protection_args,
+                self.update_replication_args,
+                self.update_script_args,
+            ],
+        }
+        for command, builders in commands.items():
+            if subcommand is None or subcommand == command:
+                for builder in builders:
+                    builder()
 
         return self.parser
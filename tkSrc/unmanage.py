@@ -102,7 +102,9 @@ def main(args, ard, config=None):
             ).main(args.cluster):
                 # "Private" cloud clusters+credentials also should be deleted
                 if ard.needsattr("clusters"):
-                    ard.clusters = astraSDK.clusters.getClusters(config=config).main()
+                    ard.clusters = config["context"].get(
+                        "clusters", astraSDK.clusters.getClusters(config=config).main
+                    )
                 for cluster in ard.clusters["items"]:
                     for label in cluster["metadata"]["labels"]:
                         if (
@@ -127,7 +129,9 @@ def main(args, ard, config=None):
                 raise SystemExit("astraSDK.clusters.unmanageCluster() failed")
     elif args.objectType == "cloud":
         if ard.needsattr("cloud"):
-            ard.clouds = astraSDK.clouds.getClouds(config=config).main()
+            ard.clouds = config["context"].get(
+                "clouds", astraSDK.clouds.getClouds(config=config).main
+            )
         rc = astraSDK.clouds.unmanageCloud(
             quiet=args.quiet, verbose=args.verbose, config=config
         ).main(args.cloudID)
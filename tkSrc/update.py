@@ -74,7 +74,9 @@ def main(args, ard, config=None):
                     helpers.parserError(f"{args.credentialPath} does not seem to be valid JSON")
             encodedStr = base64.b64encode(json.dumps(credDict).encode("utf-8")).decode("utf-8")
             if ard.needsattr("clouds"):
-                ard.clouds = astraSDK.clouds.getClouds(config=config).main()
+                ard.clouds = config["context"].get(
+                    "clouds", astraSDK.clouds.getClouds(config=config).main
+                )
             try:
                 cloud = next(c for c in ard.clouds["items"] if c["id"] == args.cloudID)
             except StopIteration:
@@ -104,7 +106,9 @@ def main(args, ard, config=None):
     elif args.objectType == "cluster":
         # Get the cluster information based on the clusterID input
         if ard.needsattr("clusters"):
-            ard.clusters = astraSDK.clusters.getClusters(config=config).main()
+            ard.clusters = config["context"].get(
+                "clusters", astraSDK.clusters.getClusters(config=config).main
+            )
         cluster = ard.getSingleDict("clusters", "id", args.clusterID)
         # Currently this is required to be True, but this will not always be the case
         if args.credentialPath:
@@ -16,13 +16,82 @@
 """
 
 import gc
+import importlib
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-import tkSrc
-from astraSDK.common import getConfig
+# Timed for the "imports" phase of --profile (tkSrc itself is only a stub which imports its
+# modules lazily, see importCommandModules() for those)
+importStart = time.perf_counter()
+import tkSrc  # noqa: E402
+from astraSDK.common import getConfig, profiler, ResourceContext, DEFAULT_MAX_WORKERS  # noqa: E402
+
+importTime = time.perf_counter() - importStart
+
+# The tkSrc module which runs each verb
+VERB_MODULES = {
+    "deploy": "deploy",
+    "clone": "clone",
+    "restore": "clone",
+    "ipr": "ipr",
+    "list": "list",
+    "get": "list",
+    "copy": "copy",
+    "create": "create",
+    "manage": "manage",
+    "define": "manage",
+    "destroy": "destroy",
+    "unmanage": "unmanage",
+    "update": "update",
+}
 
 
 def tkMain(argv=sys.argv, config=None):
+    """Runs a toolkit command, recording its phases and API calls with astraSDK.common.profiler if
+    --profile (print a summary to stderr) and/or --profile-file (write json) is specified. The
+    profiler is only started and reported by the outermost call, so the per-type calls of a comma
+    separated list (see listConcurrently) are recorded as part of it."""
+    profile, profileFile = False, None
+    for counter, item in enumerate(argv):
+        if item == "--profile":
+            profile = True
+        elif item == "--profile-file" and counter + 1 < len(argv):
+            profileFile = argv[counter + 1]
+        elif item.startswith("--profile-file="):
+            profileFile = item.split("=", 1)[1]
+    if not (profile or profileFile) or profiler.enabled:
+        return runToolkit(argv=argv, config=config)
+
+    profiler.reset()
+    profiler.enable()
+    profiler.addPhase("imports", importTime, importStart)
+    try:
+        runToolkit(argv=argv, config=config)
+    finally:
+        profiler.enable(False)
+        if profileFile:
+            profiler.write(profileFile)
+        if profile:
+            sys.stderr.write(profiler.report())
+            sys.stderr.flush()
+        profiler.reset()
+
+
+def importCommandModules(verbs, v3):
+    """Imports the modules a command will use up front, as the "imports" phase of the profiler,
+    rather than having them lazily imported within (and counted as part of) the later phases.
+    The astraSDK modules are still imported as they're first used."""
+    with profiler.phase("imports"):
+        for name in ["helpers", "choices", "parser"] + [
+            VERB_MODULES[verb] for verb in verbs if verbs[verb]
+        ]:
+            importlib.import_module(f"tkSrc.{name}")
+        if v3:
+            importlib.import_module("kubernetes")
+
+
+def runToolkit(argv=sys.argv, config=None):
     # The various functions to populate the lists used for choices() in the options are
     # expensive. argparse provides no way to know what subcommand was selected prior to
     # parsing the options. By then it's too late to decide which functions to run to
@@ -48,6 +117,8 @@ def tkMain(argv=sys.argv, config=None):
             "--v3",
             "--dry-run",
             "--insecure-skip-tls-verify",
+            "--profile",
+            "--profile-file",
         ]
         # verbs must manually be kept in sync with top_level_commands() in tkSrc/parser.py
         verbs = {
@@ -138,38 +209,44 @@ def tkMain(argv=sys.argv, config=None):
         ):
             argv[verbPosition + 1] = "protection"
 
+        if profiler.active():
+            importCommandModules(verbs, v3)
+
         # If v3, build the context@kubeconfig choices list (we want this outside of
         # tkSrc.choices.main as it should be generated regardless of plaidMode)
-        if v3:
-            v3, verbPosition = tkSrc.choices.kube_config(
-                argv, acl, verbPosition, v3Position, global_args
-            )
-        # If not v3, set up the Astra Control config, which includes a requests Session
-        elif config is None:
-            config = getConfig().main()
+        with profiler.phase("config"):
+            if v3:
+                v3, verbPosition = tkSrc.choices.kube_config(
+                    argv, acl, verbPosition, v3Position, global_args
+                )
+            # If not v3, set up the Astra Control config, which includes a requests Session
+            elif config is None:
+                config = getConfig().main()
+            else:
+                # Hand-built configs share parent lookups through a context like getConfig's
+                config.setdefault("context", ResourceContext())
 
         # Enabling comma separated listing of objects, like:
         # 'toolkit.py list apps,backups,snapshots'
         if (verbs["list"] or verbs["get"]) and len(argv) > (verbPosition + 1):
             if "," in argv[verbPosition + 1]:
-                listTypeArray = argv[verbPosition + 1].split(",")
-                for lt in listTypeArray:
-                    argv[verbPosition + 1] = lt
-                    main(argv=argv, config=config)
+                with profiler.phase("command"):
+                    listConcurrently(argv, verbPosition, argv[verbPosition + 1].split(","), config)
                 sys.exit(0)
 
         # As long as we're not --fast/plaidMode, build the argparse choices lists
         if not plaidMode:
-            tkSrc.choices.main(
-                argv,
-                verbs,
-                verbPosition,
-                ard,
-                acl,
-                v3,
-                v3_skip_tls_verify=v3_skip_tls_verify,
-                config=config,
-            )
+            with profiler.phase("choices"):
+                tkSrc.choices.cachedMain(
+                    argv,
+                    verbs,
+                    verbPosition,
+                    ard,
+                    acl,
+                    v3,
+                    v3_skip_tls_verify=v3_skip_tls_verify,
+                    config=config,
+                )
 
     else:
         raise SystemExit(
@@ -179,8 +256,11 @@ def tkMain(argv=sys.argv, config=None):
 
     # Manually passing args into argparse via parse_args() shouldn't include the function name
     argv = argv[1:] if "toolkit" in argv[0] else argv
-    tkParser = tkSrc.parser.ToolkitParser(acl, plaidMode=plaidMode, v3=v3).main()
-    args = tkParser.parse_args(args=argv)
+    # Only build the parser tree of the verb we found (or all of them if a verb wasn't found)
+    subcommand = next((verb for verb in verbs if verbs[verb]), None)
+    with profiler.phase("parser"):
+        tkParser = tkSrc.parser.ToolkitParser(acl, plaidMode=plaidMode, v3=v3).main(subcommand)
+        args = tkParser.parse_args(args=argv)
     # Memory optimization
     tkParser, acl = None, None
     gc.collect()
@@ -236,6 +316,7 @@ def tkMain(argv=sys.argv, config=None):
             )
         )
         tkSrc.helpers.checkv3Support(args, v3_dict)
+    tkSrc.helpers.checkStreamSupport(args)
     if args.dry_run and not args.v3:
         tkSrc.helpers.parserError("--dry-run can only be used in conjunction with --v3")
     elif args.skip_tls_verify and not args.v3:
@@ -243,26 +324,84 @@ def tkMain(argv=sys.argv, config=None):
             "--insecure-skip-tls-verify can only be used in conjunction with --v3"
         )
 
-    if args.subcommand == "deploy":
-        tkSrc.deploy.main(args, ard, config=config)
-    elif args.subcommand == "clone" or args.subcommand == "restore":
-        tkSrc.clone.main(args, ard, config=config)
-    elif args.subcommand == "ipr":
-        tkSrc.ipr.main(args, ard, config=config)
-    elif args.subcommand == "list" or args.subcommand == "get":
-        tkSrc.list.main(args, config=config)
-    elif args.subcommand == "copy":
-        tkSrc.copy.main(args, config=config)
-    elif args.subcommand == "create":
-        tkSrc.create.main(args, ard, config=config)
-    elif args.subcommand == "manage" or args.subcommand == "define":
-        tkSrc.manage.main(args, ard, config=config)
-    elif args.subcommand == "destroy":
-        tkSrc.destroy.main(args, ard, config=config)
-    elif args.subcommand == "unmanage":
-        tkSrc.unmanage.main(args, ard, config=config)
-    elif args.subcommand == "update":
-        tkSrc.update.main(args, ard, config=config)
+    commandStart = time.perf_counter()
+    try:
+        if args.subcommand == "deploy":
+            tkSrc.deploy.main(args, ard, config=config)
+        elif args.subcommand == "clone" or args.subcommand == "restore":
+            tkSrc.clone.main(args, ard, config=config)
+        elif args.subcommand == "ipr":
+            tkSrc.ipr.main(args, ard, config=config)
+        elif args.subcommand == "list" or args.subcommand == "get":
+            tkSrc.list.main(args, config=config)
+        elif args.subcommand == "copy":
+            tkSrc.copy.main(args, config=config)
+        elif args.subcommand == "create":
+            tkSrc.create.main(args, ard, config=config)
+        elif args.subcommand == "manage" or args.subcommand == "define":
+            tkSrc.manage.main(args, ard, config=config)
+        elif args.subcommand == "destroy":
+            tkSrc.destroy.main(args, ard, config=config)
+        elif args.subcommand == "unmanage":
+            tkSrc.unmanage.main(args, ard, config=config)
+        elif args.subcommand == "update":
+            tkSrc.update.main(args, ard, config=config)
+    finally:
+        profiler.addPhase("command", time.perf_counter() - commandStart, commandStart)
+        # Drop the cached choices collections which the command may have changed
+        if not args.dry_run:
+            objectType = getattr(args, "objectType", None)
+            tkSrc.choices.invalidateCache(
+                tkSrc.choices.cacheIdentity(v3, config),
+                tkSrc.choices.mutatedCollections(args.subcommand, objectType),
+            )
+
+
+def listConcurrently(argv, verbPosition, listTypes, config=None):
+    """Runs a comma separated list/get (like 'list apps,backups,snapshots') as one tkMain call per
+    resource type, concurrently, all sharing config's requests session and resource context (so
+    parent resources like the app list are only fetched once). Each type's output is captured and
+    printed in the requested order, and the first type to fail (in that order) ends the command,
+    as though the types had been listed one after another."""
+    typeArgvs = [argv[: verbPosition + 1] + [lt] + argv[verbPosition + 2 :] for lt in listTypes]
+    # Verbose output is only readable if the calls aren't interleaved, so run them serially
+    if "-v" in argv[:verbPosition] or "--verbose" in argv[:verbPosition]:
+        with profiler.nestedPhases():
+            for typeArgv in typeArgvs:
+                main(argv=typeArgv, config=config)
+        return
+
+    stdout, stderr, dunderStdout = sys.stdout, sys.stderr, sys.__stdout__
+    out, err = tkSrc.classes.ThreadOutput(stdout), tkSrc.classes.ThreadOutput(stderr)
+
+    def listType(typeArgv):
+        out.capture()
+        err.capture()
+        exit = None
+        try:
+            # The types' phases are already timed by this command's phase
+            with profiler.nestedPhases():
+                tkMain(argv=typeArgv, config=config)
+        except (SystemExit, Exception) as e:
+            exit = e
+        return out.release(), err.release(), exit
+
+    workers = min((config or {}).get("max_workers", DEFAULT_MAX_WORKERS), len(typeArgvs))
+    # The kubernetes verbose handling resets sys.stdout to sys.__stdout__, so point that at the
+    # per-thread output as well
+    sys.stdout, sys.stderr, sys.__stdout__ = out, err, out
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for typeOut, typeErr, exit in executor.map(listType, typeArgvs):
+                # Errors are typically printed while fetching, before the output is formatted
+                stderr.write(typeErr)
+                stderr.flush()
+                stdout.write(typeOut)
+                stdout.flush()
+                if exit is not None:
+                    raise exit
+    finally:
+        sys.stdout, sys.stderr, sys.__stdout__ = stdout, stderr, dunderStdout
 
 
 def main(argv=sys.argv, config=None):
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+   Copyright 2024 NetApp, Inc
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+
+# Only standard library modules are imported at the module level, so that the client (which is
+# invoked once per command) starts up as quickly as possible. The toolkit itself is only imported
+# by the server, or by the client if the server can't be reached.
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+
+RED = "\033[31m"
+ENDC = "\033[0m"
+# The environment variables which change where the toolkit finds its config, kubeconfig, and
+# caches, which the client sends along with every command to be applied on the server
+FORWARDED_ENV = [
+    "ASTRATOOLKITS_CONF",
+    "ASTRATOOLKITS_CHOICES_TTL",
+    "HOME",
+    "KUBECONFIG",
+    "XDG_CACHE_HOME",
+]
+# The most Astra Control configs (and their requests sessions) the server keeps warm at once
+CONFIG_CACHE_SIZE = 8
+
+
+def socketPath():
+    """Returns the path of the toolkit server's Unix domain socket, which can be overridden with
+    the ASTRATOOLKITS_SOCKET shell env var"""
+    if os.environ.get("ASTRATOOLKITS_SOCKET"):
+        return os.environ["ASTRATOOLKITS_SOCKET"]
+    runDir = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "astra-toolkits",
+    )
+    return os.path.join(runDir, "actoolkitd.sock")
+
+
+class StreamWriter:
+    """A file-like object which forwards everything written to it to the client as a single
+    line of json, of the form {stream: data}"""
+
+    def __init__(self, wfile, stream):
+        self.wfile = wfile
+        self.stream = stream
+        self.broken = False
+
+    def write(self, data):
+        if data and not self.broken:
+            try:
+                self.wfile.write((json.dumps({self.stream: data}) + "\n").encode())
+            # The client went away, but the command must still run to completion
+            except OSError:
+                self.broken = True
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def isatty(self):
+        return False
+
+
+class ToolkitHandler(socketserver.StreamRequestHandler):
+    """Handles a single toolkit invocation: a line of json containing the argv, cwd, and
+    FORWARDED_ENV environment variables of the client, followed by the streamed stdout/stderr of
+    the command, and finally the exit code"""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            argv, cwd, env = request["argv"], request.get("cwd"), request.get("env") or {}
+            env = {name: env[name] for name in FORWARDED_ENV if name in env}
+        except (ValueError, KeyError, TypeError):
+            return
+        out, err = StreamWriter(self.wfile, "stdout"), StreamWriter(self.wfile, "stderr")
+        code = self.server.run(argv, cwd, env, out, err)
+        try:
+            self.wfile.write((json.dumps({"exit": code}) + "\n").encode())
+        except OSError:
+            pass
+
+
+class ToolkitServer(socketserver.UnixStreamServer):
+    """A long-lived toolkit process which keeps the imported modules, the Astra Control config
+    (and its requests session with open connections), and any cached resources warm between
+    commands. Commands are run one at a time, as they share the process's stdout, stderr, and
+    working directory."""
+
+    def __init__(self, path):
+        self.configs = {}
+        super().__init__(path, ToolkitHandler)
+        os.chmod(path, 0o600)
+        # Import the toolkit (and all of its lazily imported modules) up front, so the first
+        # command doesn't pay the import cost
+        import astraSDK
+        import tkSrc
+        import toolkit
+
+        for package in (astraSDK, tkSrc):
+            for name in package.__all__:
+                getattr(package, name)
+        self.toolkit = toolkit
+
+    def getConfig(self):
+        """Returns a copy of the Astra Control config for the current working directory and
+        environment, with a fresh resource context, so parent lookups are never stale across
+        commands. Configs are only read in when they're needed (as --v3 only environments may
+        not have a config.yaml), and are kept by the resolved path and modification time of every
+        config.yaml which is searched, so an edited (or different) config.yaml is read in again."""
+        from astraSDK.common import getConfig, ResourceContext
+
+        key = []
+        for path in getConfig.searchPaths():
+            try:
+                key.append((os.path.realpath(path), os.stat(path).st_mtime_ns))
+            except OSError:
+                continue
+        key = tuple(key)
+        if key not in self.configs:
+            self.configs[key] = getConfig().main()
+            if len(self.configs) > CONFIG_CACHE_SIZE:
+                self.configs.pop(next(iter(self.configs)))["session"].close()
+        return dict(self.configs[key], context=ResourceContext())
+
+    def run(self, argv, cwd, env, out, err):
+        """Runs tkMain in the client's cwd and FORWARDED_ENV environment variables (env), with
+        stdout and stderr redirected to the client, returning the exit code"""
+        stdout, stderr, dunderStdout, oldCwd = sys.stdout, sys.stderr, sys.__stdout__, os.getcwd()
+        oldEnv = {name: os.environ.get(name) for name in FORWARDED_ENV}
+        # The kubernetes verbose handling resets sys.stdout to sys.__stdout__, so point that at the
+        # client as well for the duration of the command
+        sys.stdout, sys.stderr, sys.__stdout__ = out, err, out
+        try:
+            setEnv({name: env.get(name) for name in FORWARDED_ENV})
+            if cwd:
+                os.chdir(cwd)
+            config = None if "--v3" in argv else self.getConfig()
+            self.toolkit.tkMain(argv=["actoolkit"] + list(argv), config=config)
+            code = 0
+        except SystemExit as e:
+            if e.code is None or type(e.code) is int:
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                code = 1
+        except KeyboardInterrupt:
+            code = 130
+        except Exception as e:
+            print(f"{RED}{type(e).__name__}: {e}{ENDC}", file=sys.stderr)
+            code = 1
+        finally:
+            sys.stdout, sys.stderr, sys.__stdout__ = stdout, stderr, dunderStdout
+            os.chdir(oldCwd)
+            setEnv(oldEnv)
+        return code
+
+
+def setEnv(env):
+    """Sets each name: value environment variable of env, or unsets it if value is None"""
+    for name, value in env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = str(value)
+
+
+def serve(path):
+    """Starts the toolkit server on the Unix domain socket path, removing a stale socket left
+    behind by a previous server if necessary"""
+    if os.path.exists(path):
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+                s.connect(path)
+            raise SystemExit(f"{RED}actoolkitd is already listening on {path}{ENDC}")
+        except ConnectionRefusedError:
+            os.remove(path)
+    os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+    server = ToolkitServer(path)
+    print(f"actoolkitd listening on {path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.remove(path)
+
+
+def forward(argv, path):
+    """Sends argv (along with the working directory and FORWARDED_ENV environment variables) to
+    the toolkit server, writing the streamed output to stdout/stderr and returning the exit code,
+    or None if the server could not be reached"""
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(path)
+    except OSError:
+        return None
+    with sock, sock.makefile("rb") as rfile:
+        env = {name: os.environ[name] for name in FORWARDED_ENV if name in os.environ}
+        request = {"argv": argv, "cwd": os.getcwd(), "env": env}
+        sock.sendall((json.dumps(request) + "\n").encode())
+        for line in rfile:
+            message = json.loads(line)
+            if "stdout" in message:
+                sys.stdout.write(message["stdout"])
+                sys.stdout.flush()
+            elif "stderr" in message:
+                sys.stderr.write(message["stderr"])
+                sys.stderr.flush()
+            elif "exit" in message:
+                return message["exit"]
+    # The server went away mid-command
+    return 1
+
+
+def client():
+    """A drop-in replacement for actoolkit, which runs the command on actoolkitd if it's
+    running, otherwise the command is run locally"""
+    code = forward(sys.argv[1:], socketPath())
+    if code is None:
+        import toolkit
+
+        return toolkit.main(argv=["actoolkit"] + sys.argv[1:])
+    sys.exit(code)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the toolkit as a long-lived server, which actoolkitc forwards commands to"
+    )
+    parser.add_argument(
+        "-s",
+        "--socket",
+        default=socketPath(),
+        help="the Unix domain socket to listen on (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    serve(args.socket)
+
+
+if __name__ == "__main__":
+    main()